@@ -4,7 +4,7 @@ import numpy as np
 from PyQt5.QtCore import QSize
 from PyQt5.QtWidgets import QApplication
 
-from DeclarativeQt.DqtCore.DqtBase import ReferState, Remember, Run
+from DeclarativeQt.DqtCore.DqtBase import ReferState, Remember, Run, ReferMemo, ChangePolicy
 from DeclarativeQt.DqtCore.DqtStyle.DqtStyle import DqtStyle
 from DeclarativeQt.DqtCore.DqtSyntax.DqtSyntax import MainApplication
 from DeclarativeQt.DqtUI.DqtMaven.Buttons.BorderedButton import ButtonStyle
@@ -68,10 +68,11 @@ demo_app = MainApplication(
                 ManusPlotter(
                     curveData=DictData(
                         Key(key).Val(ReferState(
-                            data, referExp=lambda a0: list(zip(
+                            data.sampleOnFrame(), referExp=lambda a0: list(zip(
                                 tlist.tolist(),
                                 np.sin(2.0 * np.pi * a0 * tlist).tolist(),
-                            ))
+                            )),
+                            memo=ReferMemo(maxSize=32), compare=ChangePolicy.identity
                         )),
                     ).data,
                     xLabel=GStr("时间/s"),
@@ -1,12 +1,19 @@
-from collections import defaultdict
+import heapq
+import inspect
+import json
+import math
+import time
+import weakref
+from collections import OrderedDict
 from functools import partial
-from typing import Generic, TypeVar, Union, Callable, Iterable, Optional, Any, Tuple, List, Dict
+from typing import Generic, TypeVar, Union, Callable, Iterable, Optional, Any, Tuple, List, Dict, Hashable
 
-from PyQt5.QtCore import pyqtSignal, QObject
+import numpy as np
+from PyQt5.QtCore import pyqtSignal, QObject, QTimer, Qt
 
 from DeclarativeQt.Resource.Grammars.RDecorator import private
 from DeclarativeQt.Resource.Grammars.RGrammar import ReferList, DtReferDict, isValid, Validate, GTuple, Equal, \
-    GetDictItem
+    GetDictItem, isEmpty, GList
 from DeclarativeQt.Resource.Grammars.RGrmBase import RGrmObject
 from DeclarativeQt.Resource.Strings.RStr import RStr
 
@@ -18,23 +25,393 @@ UiString = str
 Run = RGrmObject.Run
 Formula = Callable[..., _MT]
 InputRequest = Callable[..., Tuple]
-type RState[MT] = Union[MT, Remember[MT]]
+type RState[MT] = Union[MT, Remember[MT], RCell[MT]]
 OptionFlags = Optional[Iterable[OptionKey]]
+ChangeMethod = Callable[[Any, Any], bool]
+
+
+class RVersion(Generic[_MT]):
+    __slots__ = GTuple("_data", "_version")
+
+    def __init__(self, data: _MT, version: int = int(0)):
+        self._data = data
+        self._version = version
+
+    @property
+    def data(self) -> _MT:
+        return self._data
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def evolve(self, data: _MT) -> "RVersion[_MT]":
+        return RVersion(data, self._version + int(1))
+
+
+class ChangePolicy:
+    @staticmethod
+    def identity(preValue: Any, value: Any) -> bool:
+        return preValue is not value
+
+    @staticmethod
+    def deep(preValue: Any, value: Any) -> bool:
+        if preValue is value:
+            return False
+        if isinstance(preValue, RVersion) and isinstance(value, RVersion):
+            return ChangePolicy.version(preValue, value)
+        if isinstance(preValue, np.ndarray) or isinstance(value, np.ndarray):
+            return ChangePolicy.array(preValue, value)
+        try:
+            return bool(preValue != value)
+        except (ValueError, TypeError):
+            return ChangePolicy.array(preValue, value)
+
+    @staticmethod
+    def shallow(preValue: Any, value: Any) -> bool:
+        if preValue is value:
+            return False
+        if type(preValue) is not type(value):
+            return True
+        if isinstance(value, (list, tuple)):
+            if len(preValue) != len(value):
+                return True
+            return any(a0 is not a1 for a0, a1 in zip(preValue, value))
+        if isinstance(value, dict):
+            if preValue.keys() != value.keys():
+                return True
+            return any(preValue[k] is not v for k, v in value.items())
+        return ChangePolicy.deep(preValue, value)
+
+    @staticmethod
+    def hashed(preValue: Any, value: Any) -> bool:
+        if preValue is value:
+            return False
+        try:
+            if hash(preValue) != hash(value):
+                return True
+        except TypeError:
+            pass
+        return ChangePolicy.deep(preValue, value)
+
+    @staticmethod
+    def version(preValue: Any, value: Any) -> bool:
+        if not isinstance(preValue, RVersion) or not isinstance(value, RVersion):
+            return ChangePolicy.deep(preValue, value)
+        return preValue.data is not value.data or preValue.version != value.version
+
+    @staticmethod
+    def array(preValue: Any, value: Any) -> bool:
+        if preValue is value:
+            return False
+        if preValue is None or value is None:
+            return True
+        try:
+            return not np.array_equal(preValue, value)
+        except (ValueError, TypeError):
+            return True
+
+
+class RememberBatch:
+    def __enter__(self):
+        Remember.beginBatch()
+        return self
+
+    def __exit__(self, excType, excVal, excTb):
+        Remember.endBatch()
+        return False
+
+
+class RememberHostHook:
+    __slots__ = GTuple("_state", "_hostId")
+
+    def __init__(self, state: Union["Remember", "RCell"], host: QObject):
+        self._state = weakref.ref(state)
+        self._hostId = id(host)
+
+    def __call__(self):
+        stateRef = getattr(self, "_state", None)
+        state = stateRef() if stateRef is not None else None
+        if state is None:
+            return None
+        host = next((x for x in state.hookedHosts() if id(x) == self._hostId), None)
+        if host is not None:
+            state.releaseHost(host)
+        return None
+
+
+class ReferPropagator:
+    CycleMessage: str = "ReferState dependency cycle rejected"
+    _queue: List[Tuple[int, int, QObject]] = list()
+    _queued: Dict[QObject, int] = dict()
+    _holdDepth: int = 0
+    _flushing: bool = False
+    _sequence: int = 0
+
+    @staticmethod
+    def schedule(state: QObject):
+        if state in ReferPropagator._queued:
+            return None
+        ReferPropagator._sequence += 1
+        ReferPropagator._queued[state] = ReferPropagator._sequence
+        heapq.heappush(ReferPropagator._queue, GTuple(state.referRank(), ReferPropagator._sequence, state))
+        if not ReferPropagator.isHolding():
+            ReferPropagator.flush()
+        return None
+
+    @staticmethod
+    def flush():
+        if ReferPropagator._flushing:
+            return None
+        ReferPropagator._flushing = True
+        try:
+            while ReferPropagator._queue:
+                _, sequence, state = heapq.heappop(ReferPropagator._queue)
+                if ReferPropagator._queued.get(state) != sequence:
+                    continue
+                ReferPropagator._queued.pop(state)
+                state.updateRefValue()
+        finally:
+            ReferPropagator._flushing = False
+        return None
+
+    @staticmethod
+    def isPending(state: QObject) -> bool:
+        if not ReferPropagator._queued:
+            return False
+        minRank = ReferPropagator._queue[0][0]
+        visited, stack = set(), [state]
+        while stack:
+            state = stack.pop()
+            if state in ReferPropagator._queued:
+                return True
+            if state.referRank() <= minRank or id(state) in visited:
+                continue
+            visited.add(id(state))
+            stack.extend(state.referSources())
+        return False
+
+    @staticmethod
+    def discard(state: QObject):
+        ReferPropagator._queued.pop(state, None)
+        return None
+
+    @staticmethod
+    def isHolding() -> bool:
+        return ReferPropagator._holdDepth > 0
+
+    @staticmethod
+    def hold():
+        ReferPropagator._holdDepth += 1
+        return None
+
+    @staticmethod
+    def release():
+        ReferPropagator._holdDepth = max(ReferPropagator._holdDepth - 1, 0)
+        if not ReferPropagator.isHolding():
+            ReferPropagator.flush()
+        return None
+
+    @staticmethod
+    def isCyclic(target: QObject, states: Iterable) -> bool:
+        visited, stack = set(), list(states)
+        while stack:
+            state = stack.pop()
+            if state is target:
+                return True
+            if not isinstance(state, ReferState) or id(state) in visited:
+                continue
+            visited.add(id(state))
+            stack.extend(state.referStates())
+        return False
+
+
+class ReferScheduler(QObject):
+    FrameMsec: int = int(16)
+    armed = pyqtSignal()
+    _shared: Optional["ReferScheduler"] = None
+
+    def __init__(self):
+        super().__init__()
+        self._tasks: Dict[Hashable, Tuple[float, Callable]] = dict()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        # noinspection PyUnresolvedReferences
+        self._timer.timeout.connect(self.fire)
+        # noinspection PyUnresolvedReferences
+        self.armed.connect(self.arm)
+
+    @staticmethod
+    def shared() -> "ReferScheduler":
+        if ReferScheduler._shared is None:
+            ReferScheduler._shared = ReferScheduler()
+        return ReferScheduler._shared
+
+    def schedule(self, key: Hashable, delayMsec: int, method: Callable, restart: bool = True):
+        if not restart and key in self._tasks:
+            return None
+        self._tasks[key] = GTuple(time.monotonic() + max(delayMsec, int(0)) / 1e3, method)
+        # noinspection PyUnresolvedReferences
+        self.armed.emit()
+        return None
+
+    def cancel(self, key: Hashable):
+        self._tasks.pop(key, None)
+        return None
+
+    def isScheduled(self, key: Hashable) -> bool:
+        return key in self._tasks
+
+    def arm(self):
+        if not self._tasks:
+            self._timer.stop()
+            return None
+        due = min(x[0] for x in list(self._tasks.values()))
+        self._timer.start(max(int(math.ceil((due - time.monotonic()) * 1e3)), int(0)))
+        return None
+
+    def fire(self):
+        now = time.monotonic()
+        keys = [k for k, x in list(self._tasks.items()) if x[0] <= now + 1e-3]
+        for key in keys:
+            task = self._tasks.pop(key, None)
+            if task is not None:
+                task[-1]()
+        self.arm()
+        return None
+
+
+class ReferTraceScope:
+    def __enter__(self):
+        ReferTracer.enable()
+        return self
+
+    def __exit__(self, excType, excVal, excTb):
+        ReferTracer.disable()
+        return False
+
+
+class ReferTracer:
+    kdEmit: str = "emit"
+    kdRecompute: str = "recompute"
+    fmtJson: str = "json"
+    fmtFolded: str = "folded"
+    tracing: bool = False
+    _stack: List[List] = list()
+    _records: Dict[str, Dict[str, float]] = dict()
+    _folded: Dict[str, float] = dict()
+
+    @staticmethod
+    def trace() -> ReferTraceScope:
+        return ReferTraceScope()
+
+    @staticmethod
+    def enable():
+        ReferTracer.tracing = True
+        return None
+
+    @staticmethod
+    def disable():
+        ReferTracer.tracing = False
+        ReferTracer._stack.clear()
+        return None
+
+    @staticmethod
+    def reset():
+        ReferTracer._stack.clear()
+        ReferTracer._records.clear()
+        ReferTracer._folded.clear()
+        return None
+
+    @staticmethod
+    def stateLabel(state: object) -> str:
+        name = state.objectName() if isinstance(state, QObject) else None
+        return name if name else f"{type(state).__name__}@{id(state):x}"
+
+    @staticmethod
+    def enter(state: object, kind: str, fanOut: int = int(0)):
+        label = ReferTracer.stateLabel(state)
+        record = ReferTracer._records.get(label)
+        if record is None:
+            record = dict(
+                emits=0, recomputes=0, emitSec=0.0, recomputeSec=0.0, selfSec=0.0, fanOut=0, depth=0
+            )
+            ReferTracer._records[label] = record
+        record[kind + "s"] += 1
+        record["fanOut"] = max(record["fanOut"], fanOut)
+        record["depth"] = max(record["depth"], len(ReferTracer._stack) + 1)
+        ReferTracer._stack.append([label, kind, time.perf_counter(), 0.0])
+        return None
+
+    @staticmethod
+    def exit():
+        if not ReferTracer._stack:
+            return None
+        path = ";".join(f"{x[0]}:{x[1]}" for x in ReferTracer._stack)
+        label, kind, start, childSec = ReferTracer._stack.pop()
+        elapsed = time.perf_counter() - start
+        if ReferTracer._stack:
+            ReferTracer._stack[-1][-1] += elapsed
+        record = ReferTracer._records[label]
+        record[kind + "Sec"] += elapsed
+        record["selfSec"] += elapsed - childSec
+        ReferTracer._folded[path] = ReferTracer._folded.get(path, 0.0) + elapsed - childSec
+        return None
+
+    @staticmethod
+    def report(top: int = None) -> Dict[str, Any]:
+        states = [dict(state=k, **v) for k, v in ReferTracer._records.items()]
+        states.sort(key=lambda a0: a0["selfSec"], reverse=True)
+        return dict(
+            states=states[:top] if top else states,
+            maxDepth=max([x["depth"] for x in states], default=0),
+            totalEmits=sum(x["emits"] for x in states),
+            totalRecomputes=sum(x["recomputes"] for x in states),
+        )
+
+    @staticmethod
+    def folded() -> str:
+        lines = [f"{k} {int(round(v * 1e6))}" for k, v in ReferTracer._folded.items()]
+        return "\n".join(sorted(lines))
+
+    @staticmethod
+    def dump(path: str, fmt: str = None):
+        fmt = Validate(fmt, ReferTracer.fmtJson)
+        with open(path, "w", encoding="utf-8") as file:
+            if fmt == ReferTracer.fmtFolded:
+                file.write(ReferTracer.folded())
+            else:
+                json.dump(ReferTracer.report(), file, indent=2)
+        return None
 
 
 class Remember(Generic[_MT], QObject):
     changed = pyqtSignal(object)
     activated = pyqtSignal(object, object)
+    sgChanged: str = "changed"
+    sgActivated: str = "activated"
+    SignalNames: Tuple[str, ...] = GTuple(sgChanged, sgActivated)
+    _batchDepth: int = 0
+    _batchPending: Dict[QObject, Any] = dict()
 
-    def __init__(self, value: _MT, signal: bool = True, sensitive: bool = False, spread: bool = False):
+    def __init__(
+            self, value: _MT, signal: bool = True, sensitive: bool = False,
+            spread: bool = False, cellSpread: bool = False, compare: ChangeMethod = None
+    ):
         super().__init__()
         self._value = None
+        self._compare = Validate(compare, ChangePolicy.deep)
         self._signal = signal
         self._sensitive = sensitive
         self._spread = spread
+        self._cellSpread = cellSpread
         self._dftVal = None
-        self._connections = defaultdict(list)
+        self._connections: Dict[Optional[QObject], Dict[Tuple[str, Callable], int]] = dict()
+        self._methodHosts: Dict[Callable, Dict[Optional[QObject], None]] = dict()
+        self._hostHooks: Dict[QObject, RememberHostHook] = dict()
         self._uniqueMethods = dict()
+        self._referDependents = list()
         self.setValue(value)
 
     def updateValue(self, updateExp: Callable[[Any], Any]):
@@ -48,16 +425,99 @@ class Remember(Generic[_MT], QObject):
             value = self._dftVal
         if self._spread:
             if isinstance(value, List):
-                value = Remember.rememberListItems(value)
+                value = Remember.rememberListItems(value, self._cellSpread)
             if isinstance(value, Dict):
-                value = Remember.rememberDictItems(value)
+                value = Remember.rememberDictItems(value, self._cellSpread)
         pre_value = self._value
         self._value = value
-        if bool(pre_value != value or self._sensitive) and self._signal:
+        if not self._signal:
+            return None
+        if Remember.isBatching():
+            if self not in Remember._batchPending:
+                Remember._batchPending[self] = pre_value
+            return None
+        if bool(self._sensitive or self._compare(pre_value, value)):
+            self.emitChange(value, pre_value)
+        return None
+
+    def isChanged(self, preValue: object, value: object) -> bool:
+        return bool(self._sensitive or self._compare(preValue, value))
+
+    def setChangePolicy(self, compare: ChangeMethod):
+        self._compare = Validate(compare, ChangePolicy.deep)
+        return None
+
+    # noinspection PyUnresolvedReferences
+    # noinspection PyTypeChecker
+    def emitChange(self, value: object, preValue: object):
+        tracing = ReferTracer.tracing
+        if tracing:
+            ReferTracer.enter(self, ReferTracer.kdEmit, self.receivers(self.changed) + self.receivers(self.activated))
+        ReferPropagator.hold()
+        try:
             self.changed.emit(value)
-            self.activated.emit(value, pre_value)
+            self.activated.emit(value, preValue)
+        finally:
+            ReferPropagator.release()
+            if tracing:
+                ReferTracer.exit()
+        return None
+
+    @staticmethod
+    def batch() -> RememberBatch:
+        return RememberBatch()
+
+    @staticmethod
+    def isBatching() -> bool:
+        return Remember._batchDepth > 0
+
+    @staticmethod
+    def beginBatch():
+        Remember._batchDepth += 1
+        return None
+
+    @staticmethod
+    def endBatch():
+        Remember._batchDepth = max(Remember._batchDepth - 1, 0)
+        if not Remember.isBatching():
+            Remember.flushBatch()
+        return None
+
+    @staticmethod
+    def flushBatch():
+        pending = Remember._batchPending
+        Remember._batchPending = dict()
+        ReferPropagator.hold()
+        try:
+            for state, pre_value in pending.items():
+                value = state.value()
+                if state.isChanged(pre_value, value):
+                    state.emitChange(value, pre_value)
+        finally:
+            ReferPropagator.release()
+        return None
+
+    def referRank(self) -> int:
+        return int(0)
+
+    def referDependents(self) -> List[QObject]:
+        return list(self._referDependents)
+
+    def addReferDependent(self, state: QObject):
+        self._referDependents.append(state)
         return None
 
+    def removeReferDependent(self, state: QObject):
+        if state in self._referDependents:
+            self._referDependents.remove(state)
+        return None
+
+    def isSensitive(self):
+        return self._sensitive
+
+    def isStale(self) -> bool:
+        return False
+
     def setSpread(self, spread: bool):
         self._spread = spread
         self.setValue(self._value)
@@ -81,10 +541,51 @@ class Remember(Generic[_MT], QObject):
         return self._value
 
     def copy(self):
-        return Remember[_MT](self._value, self._signal, self._sensitive)
+        return Remember[_MT](self.value(), self._signal, self._sensitive, compare=self._compare)
 
     def equal(self, value):
-        return False if self._value != Remember.getValue(value) else True
+        return not self._compare(self.value(), Remember.getValue(value))
+
+    def distinctUntilChanged(self, compare: ChangeMethod = None) -> "Remember[_MT]":
+        derived = Remember[_MT](self.value(), compare=compare)
+        self.connect(partial(self.forwardValue, derived), host=derived)
+        return derived
+
+    def debounce(self, msec: int) -> "Remember[_MT]":
+        derived = Remember[_MT](self.value(), compare=self._compare)
+        deliver = partial(self.forwardValue, derived)
+        self.connect(lambda: ReferScheduler.shared().schedule(derived, msec, deliver), host=derived)
+        return derived
+
+    def throttle(self, msec: int) -> "Remember[_MT]":
+        derived = Remember[_MT](self.value(), compare=self._compare)
+        self.connect(partial(self.throttleValue, derived, msec, False), host=derived)
+        return derived
+
+    def sampleOnFrame(self) -> "Remember[_MT]":
+        derived = Remember[_MT](self.value(), compare=self._compare)
+        deliver = partial(self.forwardValue, derived)
+        sample = lambda: ReferScheduler.shared().schedule(derived, ReferScheduler.FrameMsec, deliver, restart=False)
+        self.connect(sample, host=derived)
+        return derived
+
+    @private
+    def forwardValue(self, derived: "Remember[_MT]"):
+        derived.setValue(self.value())
+        return None
+
+    @private
+    def throttleValue(self, derived: "Remember[_MT]", msec: int, trailing: bool):
+        scheduler = ReferScheduler.shared()
+        if not trailing and scheduler.isScheduled(derived):
+            derived.setProperty("throttlePending", True)
+            return None
+        if trailing and not derived.property("throttlePending"):
+            return None
+        derived.setProperty("throttlePending", False)
+        self.forwardValue(derived)
+        scheduler.schedule(derived, msec, partial(self.throttleValue, derived, msec, True))
+        return None
 
     def uniqueConnect(self, func: Callable, *args: Any, method: Callable = None, host: QObject = None):
         if func in self._uniqueMethods:
@@ -100,65 +601,116 @@ class Remember(Generic[_MT], QObject):
         self.actConnect(self._uniqueMethods[func], host=host)
         return None
 
-    # noinspection PyUnresolvedReferences
     def connect(self, method: Callable, host: QObject = None, once: bool = False):
         if once:
             self.disconnect(method=method)
-        self.changed.connect(method)
-        self._connections[self.changed].append(GTuple(host, method))
-        if isValid(host):
-            # noinspection PyTypeChecker
-            host.destroyed.connect(lambda: self.disconnect(host))
+        self.registerSlot(self.sgChanged, method, host)
         return None
 
-    # noinspection PyUnresolvedReferences
     def actConnect(self, method: Callable, host: QObject = None, once: bool = False):
         if once:
             self.disconnect(method=method)
-        self.activated.connect(method)
-        self._connections[self.activated].append(GTuple(host, method))
-        if isValid(host):
-            # noinspection PyTypeChecker
-            host.destroyed.connect(lambda: self.disconnect(host))
+        self.registerSlot(self.sgActivated, method, host)
         return None
 
     # noinspection PyUnresolvedReferences
+    @private
+    def registerSlot(self, signalName: str, method: Callable, host: QObject = None):
+        getattr(self, signalName).connect(method)
+        slots = self._connections.setdefault(host, dict())
+        key = GTuple(signalName, method)
+        slots[key] = slots.get(key, int(0)) + int(1)
+        self._methodHosts.setdefault(method, dict())[host] = None
+        if isValid(host) and host not in self._hostHooks:
+            self._hostHooks[host] = RememberHostHook(self, host)
+            # noinspection PyTypeChecker
+            host.destroyed.connect(self._hostHooks[host])
+        return None
+
     def disconnect(self, host: QObject = None, method: Callable = None):
-        slot_count = 0
-        log = list()
-        for key, val in self._connections.items():
-            signal: pyqtSignal = key
-            for val_host, val_method in val:
-                cancel_slot = False
-                if isValid(method) and isValid(host):
-                    if Equal(method, val_method) and Equal(host, val_host):
-                        cancel_slot = True
-                elif not isValid(method) and isValid(host):
-                    if Equal(host, val_host):
-                        cancel_slot = True
-                elif isValid(method) and not isValid(host):
-                    if Equal(method, val_method):
-                        cancel_slot = True
-                if cancel_slot:
-                    slot_count += 1
-                    try:
-                        signal.disconnect(val_method)
-                    except Exception as e:
-                        log.append(GTuple(host, method, e))
-                    self._connections[signal].remove(GTuple(val_host, val_method))
+        if isValid(method) and isValid(host):
+            return self.releaseSlots(host, method)
+        elif not isValid(method) and isValid(host):
+            return self.releaseSlots(host)
+        elif isValid(method) and not isValid(host):
+            hosts = list(GetDictItem(self._methodHosts, method, dict()).keys())
+            return sum(ReferList(hosts, lambda a0: self.releaseSlots(a0, method)))
+        return int(0)
+
+    def hookedHosts(self) -> List[QObject]:
+        return list(self._hostHooks)
+
+    @private
+    def releaseHost(self, host: QObject):
+        self._hostHooks.pop(host, None)
+        self.releaseSlots(host)
+        return None
+
+    # noinspection PyUnresolvedReferences
+    @private
+    def releaseSlots(self, host: Optional[QObject], method: Callable = None) -> int:
+        slots = GetDictItem(self._connections, host)
+        if not slots:
+            return int(0)
+        if isValid(method):
+            keys = [GTuple(x, method) for x in self.SignalNames if GTuple(x, method) in slots]
+        else:
+            keys = list(slots.keys())
+        slot_count = int(0)
+        for key in keys:
+            signalName, val_method = key
+            for _ in range(slots.pop(key)):
+                slot_count += 1
+                try:
+                    getattr(self, signalName).disconnect(val_method)
+                except (RuntimeError, TypeError):
+                    continue
+            self.releaseMethodHost(val_method, host)
+        if isEmpty(slots):
+            self._connections.pop(host, None)
+            self.releaseHostHook(host)
         return slot_count
 
+    # noinspection PyUnresolvedReferences
+    @private
+    def releaseHostHook(self, host: Optional[QObject]):
+        hook = self._hostHooks.pop(host, None)
+        if hook is None:
+            return None
+        try:
+            host.destroyed.disconnect(hook)
+        except (RuntimeError, TypeError):
+            pass
+        return None
+
+    @private
+    def releaseMethodHost(self, method: Callable, host: Optional[QObject]):
+        hosts = GetDictItem(self._methodHosts, method)
+        if hosts is None:
+            return None
+        hosts.pop(host, None)
+        if isEmpty(hosts):
+            self._methodHosts.pop(method, None)
+        return None
+
     @staticmethod
-    def rememberItem(item: Any):
-        return item if isinstance(item, Remember) else Remember(item)
+    def isState(item: object) -> bool:
+        return isinstance(item, (Remember, RCell))
 
     @staticmethod
-    def rememberDictItems(dt: dict):
-        return DtReferDict(dt, lambda k, v: Remember.rememberItem(k), lambda k, v: Remember.rememberItem(v))
+    def rememberItem(item: Any, cell: bool = False):
+        if Remember.isState(item):
+            return item
+        return RCell(item) if cell else Remember(item)
 
     @staticmethod
-    def rememberListItems(lt: list):
-        return ReferList(lt, lambda a0: Remember.rememberItem(a0))
+    def rememberDictItems(dt: dict, cell: bool = False):
+        keyExp = lambda k, v: Remember.rememberItem(k, cell)
+        return DtReferDict(dt, keyExp, lambda k, v: Remember.rememberItem(v, cell))
+
+    @staticmethod
+    def rememberListItems(lt: list, cell: bool = False):
+        return ReferList(lt, lambda a0: Remember.rememberItem(a0, cell))
 
     @staticmethod
     def obtainListItem(lt: object, idx: int):
@@ -174,16 +726,16 @@ class Remember(Generic[_MT], QObject):
 
     @staticmethod
     def toValid(item: object, default: object):
-        if not isinstance(item, Remember):
+        if not Remember.isState(item):
             return Validate(item, default)
-        if isValid(Remember.getValue(item)):
+        if item.isStale() or isValid(Remember.getValue(item)):
             return item
         item.setValue(default)
         return item
 
     @staticmethod
     def getValue(item: object):
-        return item.value() if isinstance(item, Remember) else item
+        return item.value() if Remember.isState(item) else item
 
     @staticmethod
     def getListValue(items: object):
@@ -200,24 +752,513 @@ class Remember(Generic[_MT], QObject):
         return DtReferDict(items, lambda k, v: Remember.getValue(k), lambda k, v: Remember.getValue(v))
 
 
+class RCell(Generic[_MT]):
+    __slots__ = GTuple(
+        "_value", "_sensitive", "_compare", "_slots", "_hosts", "_uniqueMethods", "_bridge", "_bridging", "__weakref__"
+    )
+
+    def __init__(self, value: _MT = None, sensitive: bool = False, compare: ChangeMethod = None):
+        self._value = Remember.getValue(value)
+        self._sensitive = sensitive
+        self._compare = compare
+        self._slots: Optional[List[Tuple[str, Callable, Optional[QObject], int]]] = None
+        self._hosts: Optional[Dict[QObject, RememberHostHook]] = None
+        self._uniqueMethods: Optional[Dict[Callable, Callable]] = None
+        self._bridge: Optional[Remember] = None
+        self._bridging = False
+
+    def value(self):
+        return self._value
+
+    def equal(self, value):
+        return not Validate(self._compare, ChangePolicy.deep)(self._value, Remember.getValue(value))
+
+    def isStale(self) -> bool:
+        return False
+
+    def isSensitive(self) -> bool:
+        return self._sensitive
+
+    def isChanged(self, preValue: object, value: object) -> bool:
+        return bool(self._sensitive or Validate(self._compare, ChangePolicy.deep)(preValue, value))
+
+    def referRank(self) -> int:
+        return int(0)
+
+    def addReferDependent(self, state: QObject):
+        return None
+
+    def removeReferDependent(self, state: QObject):
+        return None
+
+    def updateValue(self, updateExp: Callable[[Any], Any]):
+        self.setValue(updateExp(self._value))
+        return None
+
+    def setValue(self, value: object):
+        value = Remember.getValue(value)
+        pre_value = self._value
+        self._value = value
+        if Remember.isBatching():
+            if self not in Remember._batchPending:
+                Remember._batchPending[self] = pre_value
+            return None
+        if self.isChanged(pre_value, value):
+            self.emitChange(value, pre_value)
+        return None
+
+    def emitChange(self, value: object, preValue: object):
+        if not self._slots:
+            return None
+        args = GTuple(value, preValue)
+        tracing = ReferTracer.tracing
+        if tracing:
+            ReferTracer.enter(self, ReferTracer.kdEmit, len(self._slots))
+        ReferPropagator.hold()
+        try:
+            for signalName, method, host, argc in list(self._slots):
+                method(*args[:argc])
+        finally:
+            ReferPropagator.release()
+            if tracing:
+                ReferTracer.exit()
+        return None
+
+    def connect(self, method: Callable, host: QObject = None, once: bool = False):
+        if once:
+            self.disconnect(method=method)
+        self.registerSlot(Remember.sgChanged, method, host)
+        return None
+
+    def actConnect(self, method: Callable, host: QObject = None, once: bool = False):
+        if once:
+            self.disconnect(method=method)
+        self.registerSlot(Remember.sgActivated, method, host)
+        return None
+
+    def uniqueConnect(self, func: Callable, *args: Any, method: Callable = None, host: QObject = None):
+        self._uniqueMethods = Validate(self._uniqueMethods, dict())
+        if func in self._uniqueMethods:
+            self.disconnect(host=host, method=self._uniqueMethods[func])
+        self._uniqueMethods[func] = partial(func, *args) if method is None else method
+        self.connect(self._uniqueMethods[func], host=host)
+        return None
+
+    # noinspection PyUnresolvedReferences
+    @private
+    def registerSlot(self, signalName: str, method: Callable, host: QObject = None):
+        maxArgs = int(1) if Equal(signalName, Remember.sgChanged) else int(2)
+        self._slots = Validate(self._slots, list())
+        self._slots.append(GTuple(signalName, method, host, RCell.slotArgCount(method, maxArgs)))
+        if isValid(host):
+            self._hosts = Validate(self._hosts, dict())
+            if host not in self._hosts:
+                self._hosts[host] = RememberHostHook(self, host)
+                # noinspection PyTypeChecker
+                host.destroyed.connect(self._hosts[host])
+        return None
+
+    def hookedHosts(self) -> List[QObject]:
+        return list(Validate(self._hosts, dict()))
+
+    @private
+    def releaseHost(self, host: QObject):
+        if self._hosts:
+            self._hosts.pop(host, None)
+        self.disconnect(host=host)
+        return None
+
+    def disconnect(self, host: QObject = None, method: Callable = None):
+        if not self._slots or not isValid(host) and not isValid(method):
+            return int(0)
+        matched = lambda a0: (not isValid(host) or a0[2] is host) and (not isValid(method) or Equal(a0[1], method))
+        remains = list([x for x in self._slots if not matched(x)])
+        slot_count = len(self._slots) - len(remains)
+        self._slots = remains if remains else None
+        if self._hosts:
+            hosts = set(id(x[2]) for x in remains)
+            for host in [x for x in self._hosts if id(x) not in hosts]:
+                self.releaseHostHook(host)
+        return slot_count
+
+    # noinspection PyUnresolvedReferences
+    @private
+    def releaseHostHook(self, host: QObject):
+        hook = self._hosts.pop(host, None)
+        if hook is None:
+            return None
+        try:
+            host.destroyed.disconnect(hook)
+        except (RuntimeError, TypeError):
+            pass
+        return None
+
+    def isNotConnected(self):
+        return not bool(self._slots)
+
+    def asRemember(self) -> Remember:
+        if self._bridge is not None:
+            return self._bridge
+        self._bridge = Remember(self._value, sensitive=self._sensitive, compare=self._compare)
+        self.connect(partial(self.syncBridge, self._bridge))
+        self._bridge.connect(partial(self.syncBridge, self))
+        return self._bridge
+
+    @private
+    def syncBridge(self, target: Union[Remember, "RCell"], value: object):
+        if self._bridging:
+            return None
+        self._bridging = True
+        try:
+            target.setValue(value)
+        finally:
+            self._bridging = False
+        return None
+
+    @staticmethod
+    def slotArgCount(method: Callable, maxArgs: int) -> int:
+        try:
+            params = inspect.signature(method).parameters.values()
+        except (TypeError, ValueError):
+            return maxArgs
+        count = int(0)
+        for param in params:
+            if Equal(param.kind, param.VAR_POSITIONAL):
+                return maxArgs
+            if param.kind in GTuple(param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+                count += 1
+        return min(count, maxArgs)
+
+
+class RList(Generic[_MT], Remember[List[_MT]]):
+    inserted = pyqtSignal(int, int)
+    removed = pyqtSignal(int, int)
+    moved = pyqtSignal(int, int)
+    itemChanged = pyqtSignal(int)
+    reset = pyqtSignal(object)
+    sgInserted: str = "inserted"
+    sgRemoved: str = "removed"
+    sgMoved: str = "moved"
+    sgItemChanged: str = "itemChanged"
+    sgReset: str = "reset"
+    SignalNames: Tuple[str, ...] = GTuple(
+        Remember.sgChanged, Remember.sgActivated, sgInserted, sgRemoved, sgMoved, sgItemChanged, sgReset
+    )
+    _resetting: bool = False
+
+    def __init__(
+            self, value: List[_MT] = None, signal: bool = True, sensitive: bool = False,
+            spread: bool = False, cellSpread: bool = False, compare: ChangeMethod = None
+    ):
+        super().__init__(Validate(value, list()), signal, sensitive, spread, cellSpread, compare)
+
+    def setValue(self, value: object):
+        value = Validate(Remember.getValue(value), list())
+        self._resetting = True
+        super().setValue(list(value))
+        if not Remember.isBatching():
+            self._resetting = False
+        return None
+
+    # noinspection PyUnresolvedReferences
+    def emitChange(self, value: object, preValue: object):
+        ReferPropagator.hold()
+        try:
+            if self._resetting:
+                self._resetting = False
+                self.reset.emit(value)
+            super().emitChange(value, preValue)
+        finally:
+            ReferPropagator.release()
+        return None
+
+    def diffConnect(
+            self, host: QObject = None, onReset: Callable = None, onInserted: Callable = None,
+            onRemoved: Callable = None, onMoved: Callable = None, onItemChanged: Callable = None
+    ):
+        slots = GTuple(
+            GTuple(self.sgReset, onReset), GTuple(self.sgInserted, onInserted),
+            GTuple(self.sgRemoved, onRemoved), GTuple(self.sgMoved, onMoved),
+            GTuple(self.sgItemChanged, onItemChanged),
+        )
+        for signalName, method in slots:
+            if isValid(method):
+                self.registerSlot(signalName, method, host)
+        return None
+
+    def insert(self, index: int, *items: _MT):
+        rows = self._value
+        index = self.boundIndex(index, len(rows) + int(1))
+        if isEmpty(items):
+            return None
+        pre_value = list(rows)
+        items = self.rememberRows(items)
+        rows[index:index] = items
+        self.emitDiff(self.inserted, index, len(items), preValue=pre_value)
+        return None
+
+    def append(self, *items: _MT):
+        self.insert(len(self._value), *items)
+        return None
+
+    def remove(self, index: int, count: int = int(1)):
+        rows = self._value
+        if not rows or count <= 0:
+            return None
+        index = self.boundIndex(index, len(rows))
+        count = min(count, len(rows) - index)
+        pre_value = list(rows)
+        del rows[index:index + count]
+        self.emitDiff(self.removed, index, count, preValue=pre_value)
+        return None
+
+    def move(self, fromAt: int, moveTo: int):
+        rows = self._value
+        if not rows:
+            return None
+        fromAt = self.boundIndex(fromAt, len(rows))
+        moveTo = self.boundIndex(moveTo, len(rows))
+        if Equal(fromAt, moveTo):
+            return None
+        pre_value = list(rows)
+        rows.insert(moveTo, rows.pop(fromAt))
+        self.emitDiff(self.moved, fromAt, moveTo, preValue=pre_value)
+        return None
+
+    def setItem(self, index: int, item: _MT):
+        rows = self._value
+        if not rows:
+            return None
+        index = self.boundIndex(index, len(rows))
+        pre_value = list(rows)
+        rows[index] = self.rememberRows(GList(item))[0]
+        self.emitDiff(self.itemChanged, index, preValue=pre_value)
+        return None
+
+    @private
+    def rememberRows(self, items: Iterable) -> List:
+        items = list(items)
+        if not self._spread:
+            return items
+        return Remember.rememberListItems(items, self._cellSpread)
+
+    # noinspection PyUnresolvedReferences
+    @private
+    def emitDiff(self, signal: pyqtSignal, *args: int, preValue: List):
+        if not self._signal:
+            return None
+        ReferPropagator.hold()
+        try:
+            signal.emit(*args)
+            if Remember.isBatching():
+                if self not in Remember._batchPending:
+                    Remember._batchPending[self] = preValue
+            else:
+                self.emitChange(self._value, preValue)
+        finally:
+            ReferPropagator.release()
+        return None
+
+    @staticmethod
+    def boundIndex(index: int, size: int) -> int:
+        if index < 0:
+            index += size
+        return min(max(index, int(0)), max(size - int(1), int(0)))
+
+
+class ReferMemo:
+    DefaultSize: int = int(64)
+
+    def __init__(self, maxSize: int = None, keyExp: Callable[..., Hashable] = None):
+        self._maxSize = max(Validate(maxSize, self.DefaultSize), int(1))
+        self._keyExp = keyExp
+        self._cache = OrderedDict()
+        self._hits = int(0)
+        self._misses = int(0)
+        self._bypasses = int(0)
+
+    def memoKey(self, *args: Any) -> Optional[Hashable]:
+        key = self._keyExp(*args) if self._keyExp else args
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def evaluate(self, formula: Formula, *args: Any) -> Any:
+        key = self.memoKey(*args)
+        if key is None:
+            self._bypasses += 1
+            return formula(*args)
+        if key in self._cache:
+            self._hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        self._misses += 1
+        result = formula(*args)
+        self._cache[key] = result
+        while len(self._cache) > self._maxSize:
+            self._cache.popitem(last=False)
+        return result
+
+    def clear(self):
+        self._cache.clear()
+        return None
+
+    def resetStats(self):
+        self._hits = int(0)
+        self._misses = int(0)
+        self._bypasses = int(0)
+        return None
+
+    def stats(self) -> Dict[str, int]:
+        return dict(
+            hits=self._hits, misses=self._misses, bypasses=self._bypasses,
+            size=len(self._cache), maxSize=self._maxSize
+        )
+
+    @staticmethod
+    def freezeKey(*args: Any) -> Tuple:
+        return tuple(ReferList(args, lambda a0: ReferMemo.freezeItem(a0)))
+
+    @staticmethod
+    def freezeItem(item: Any) -> Hashable:
+        if isinstance(item, (list, tuple)):
+            return GTuple(type(item).__name__, ReferMemo.freezeKey(*item))
+        if isinstance(item, dict):
+            return GTuple(dict.__name__, ReferMemo.freezeKey(*item.items()))
+        if isinstance(item, (set, frozenset)):
+            return frozenset(ReferList(item, lambda a0: ReferMemo.freezeItem(a0)))
+        if hasattr(item, "tobytes") and hasattr(item, "shape") and hasattr(item, "dtype"):
+            return GTuple(item.shape, str(item.dtype), item.tobytes())
+        return item
+
+
 class ReferState(Generic[_MT], Remember[_MT]):
-    def __init__(self, *states: RState[Any], referExp: Formula = None, value: _MT = None):
-        super().__init__(value)
-        self._states = states
+    invalidated = pyqtSignal()
+    sgInvalidated: str = "invalidated"
+    SignalNames: Tuple[str, ...] = GTuple(Remember.sgChanged, Remember.sgActivated, sgInvalidated)
+
+    def __init__(
+            self, *states: RState[Any], referExp: Formula = None, value: _MT = None,
+            lazy: bool = False, memo: ReferMemo = None, compare: ChangeMethod = None
+    ):
+        super().__init__(value, compare=compare)
+        self._states = tuple()
+        self._memo = memo
+        self._referRank = int(1)
         self._referExp = referExp if referExp else lambda *x: x
-        self.updateRefValue()
-        for state in self._states:
-            if isinstance(state, Remember):
-                # noinspection PyUnresolvedReferences
-                state.changed.connect(partial(self.updateRefValue))
+        self._referHook = partial(self.markDirty)
+        self._lazy = lazy
+        self._stale = False
+        self._pulling = False
+        self.setReferStates(*states)
+
+    def setReferStates(self, *states: RState[Any]) -> bool:
+        if ReferPropagator.isCyclic(self, states):
+            RStr.log(ReferPropagator.CycleMessage, RStr.lgError)
+            return False
+        for state in self.referSources():
+            state.disconnect(method=self._referHook)
+            state.removeReferDependent(self)
+        self._states = states
+        for state in self.referSources():
+            state.connect(self._referHook)
+            if isinstance(state, ReferState):
+                state.invalidConnect(self._referHook)
+            state.addReferDependent(self)
+        self.updateReferRank()
+        if self._lazy:
+            self.invalidate()
+        else:
+            self.updateRefValue()
+        return True
+
+    def referStates(self) -> Tuple:
+        return self._states
+
+    def referSources(self) -> List[Union[Remember, RCell]]:
+        return list([x for x in self._states if Remember.isState(x)])
+
+    def referRank(self) -> int:
+        return self._referRank
+
+    @private
+    def updateReferRank(self):
+        rank = int(1) + max([x.referRank() for x in self.referSources()], default=int(0))
+        if Equal(rank, self._referRank):
+            return None
+        self._referRank = rank
+        for state in self.referDependents():
+            state.updateReferRank()
+        return None
+
+    def markDirty(self):
+        if self._pulling:
+            return None
+        if self._lazy:
+            self.invalidate()
+            return None
+        ReferPropagator.schedule(self)
+        return None
+
+    # noinspection PyUnresolvedReferences
+    def invalidate(self):
+        if self._stale:
+            return None
+        self._stale = True
+        ReferPropagator.hold()
+        try:
+            self.invalidated.emit()
+        finally:
+            ReferPropagator.release()
+        return None
+
+    def invalidConnect(self, method: Callable, host: QObject = None):
+        self.registerSlot(self.sgInvalidated, method, host)
+        return None
+
+    def isLazy(self) -> bool:
+        return self._lazy
+
+    def referMemo(self) -> Optional[ReferMemo]:
+        return self._memo
+
+    def isStale(self) -> bool:
+        return self._stale
+
+    def value(self):
+        if self._stale or ReferPropagator.isPending(self):
+            ReferPropagator.discard(self)
+            self.updateRefValue()
+        return self._value
+
+    def setSpread(self, spread: bool):
+        if self._stale:
+            self._spread = spread
+            return None
+        return super().setSpread(spread)
 
     @private
     def updateRefValue(self):
-        result: Callable = partial(self._referExp)
-        for state in self._states:
-            result = partial(result, Remember.getValue(state))
+        if not ReferTracer.tracing:
+            return self.recomputeValue()
+        ReferTracer.enter(self, ReferTracer.kdRecompute, len(self._referDependents))
+        try:
+            return self.recomputeValue()
+        finally:
+            ReferTracer.exit()
+
+    @private
+    def recomputeValue(self):
+        self._stale = False
+        self._pulling = True
+        try:
+            args = ReferList(self._states, lambda a0: Remember.getValue(a0))
+        finally:
+            self._pulling = False
         try:
-            result = result()
+            result = self._memo.evaluate(self._referExp, *args) if self._memo else self._referExp(*args)
         except Exception as e:
             RStr.log(str(e), RStr.lgError)
             return None
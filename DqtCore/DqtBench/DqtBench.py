@@ -0,0 +1,42 @@
+import gc
+import tracemalloc
+from typing import Callable, Dict, Any
+
+from DeclarativeQt.DqtCore.DqtBase import Remember, RCell
+from DeclarativeQt.Resource.Grammars.RGrammar import DictData, Key
+from DeclarativeQt.Resource.Strings.RStr import RStr
+
+BenchReport = Dict[str, Any]
+
+
+class DqtBench:
+    DefaultCellCount: int = int(10000)
+
+    @staticmethod
+    def measureAllocation(factory: Callable[[int], Any], count: int) -> float:
+        gc.collect()
+        tracemalloc.start()
+        start = tracemalloc.take_snapshot()
+        items = list([factory(i) for i in range(count)])
+        end = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        allocated = sum([x.size_diff for x in end.compare_to(start, "filename")])
+        del items
+        gc.collect()
+        return float(allocated) / max(count, int(1))
+
+    @staticmethod
+    def stateMemory(count: int = None) -> BenchReport:
+        count = count if count else DqtBench.DefaultCellCount
+        rememberBytes = DqtBench.measureAllocation(lambda i: Remember(i), count)
+        cellBytes = DqtBench.measureAllocation(lambda i: RCell(i), count)
+        return DictData(
+            Key("cells").Val(count),
+            Key("rememberBytesPerCell").Val(round(rememberBytes, 1)),
+            Key("cellBytesPerCell").Val(round(cellBytes, 1)),
+            Key("ratio").Val(round(rememberBytes / cellBytes, 2) if cellBytes else None),
+        ).data
+
+
+if not __name__ != "__main__":
+    RStr.log(DqtBench.stateMemory(), RStr.lgInfo)
@@ -54,7 +54,7 @@ def fontTextMetric(font: QFont, text: RState[str], lineLim: int = None) -> QSize
     if isEmpty(lines):
         return QSize(int(1), height)
     maxWidth = max(ReferList(lines, lambda a0: metrics.horizontalAdvance(a0)))
-    if isinstance(text, Remember):
+    if Remember.isState(text):
         text.setValue(RStr.pLinefeed.join(lines))
     return QSize(maxWidth, height)
 
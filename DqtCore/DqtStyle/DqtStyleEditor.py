@@ -3,7 +3,7 @@ from typing import Dict, Any, Self
 
 from PyQt5.QtCore import QObject
 
-from DeclarativeQt.DqtCore.DqtBase import Remember, RState
+from DeclarativeQt.DqtCore.DqtBase import Remember, RState, RCell
 from DeclarativeQt.Resource.Grammars.RGrammar import GetDictItem, SetDictItem, Validate
 
 
@@ -12,8 +12,10 @@ class DqtStyleEditor(QObject):
         super().__init__()
         self._styleSources = Validate(styleValues, dict())
         self._defaultStyles = Remember.getDictValue(self._styleSources.copy())
-        for k, v in self._styleSources.items():
-            if isinstance(v, Remember):
+        for k, v in list(self._styleSources.items()):
+            if isinstance(v, RCell):
+                v = self._styleSources[k] = v.asRemember()
+            if Remember.isState(v):
                 v.setAlwaysValid(self._defaultStyles[k])
 
     @abstractmethod
@@ -4,8 +4,8 @@ from typing import Iterable, Dict, Union, Callable
 
 from PyQt5.QtWidgets import QDialog, QMainWindow, QWidget
 
-from DeclarativeQt.DqtCore.DqtBase import Remember, ReferState, RState
-from DeclarativeQt.Resource.Grammars.RGrammar import ReferList, isValid
+from DeclarativeQt.DqtCore.DqtBase import Remember, ReferState, RState, RCell, RList
+from DeclarativeQt.Resource.Grammars.RGrammar import isValid
 from DeclarativeQt.Resource.Strings.RStr import Semantics, NLIndex
 
 
@@ -25,26 +25,43 @@ class BaseDqtGrammars:
 
     @staticmethod
     def ValToState(value: object):
+        if isinstance(value, RCell):
+            return value.asRemember()
         if isinstance(value, Remember):
             return value
         return Remember(value)
 
     @staticmethod
-    def SeqToState(sequence: Union[Iterable, Remember]):
+    def SeqToState(sequence: Union[Iterable, Remember], cellSpread: bool = False):
         sequence = Remember.toValid(sequence, list())
+        if isinstance(sequence, RCell):
+            sequence = sequence.asRemember()
         if isinstance(sequence, Remember):
             sequence.setSpread(True)
             return sequence
-        lt = ReferList(sequence, lambda item: BaseDqtGrammars.ValToState(item))
-        return Remember(lt, spread=True)
+        lt = Remember.rememberListItems(list(sequence), cellSpread)
+        return Remember(lt, spread=True, cellSpread=cellSpread)
 
     @staticmethod
-    def MapToState(mapping: Union[Dict, Remember]):
+    def ListToState(sequence: Union[Iterable, Remember], cellSpread: bool = False):
+        sequence = Remember.toValid(sequence, list())
+        if isinstance(sequence, RCell):
+            sequence = sequence.asRemember()
+        if isinstance(sequence, Remember):
+            sequence.setSpread(True)
+            return sequence
+        lt = Remember.rememberListItems(list(sequence), cellSpread)
+        return RList(lt, spread=True, cellSpread=cellSpread)
+
+    @staticmethod
+    def MapToState(mapping: Union[Dict, Remember], cellSpread: bool = False):
         mapping = Remember.toValid(mapping, dict())
+        if isinstance(mapping, RCell):
+            mapping = mapping.asRemember()
         if isinstance(mapping, Remember):
             mapping.setSpread(True)
             return mapping
-        return Remember(Remember.rememberDictItems(mapping), spread=True)
+        return Remember(Remember.rememberDictItems(mapping, cellSpread), spread=True, cellSpread=cellSpread)
 
     @staticmethod
     def Execute(dialog: QDialog):
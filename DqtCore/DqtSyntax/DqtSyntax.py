@@ -18,6 +18,7 @@ DialogOffsetMethod = Callable[[QWidget], Optional[QPoint]]
 MainApplication = DqtGrmBase.MainApplication
 ValToState = DqtGrmBase.BaseDqtGrammars.ValToState
 SeqToState = DqtGrmBase.BaseDqtGrammars.SeqToState
+ListToState = DqtGrmBase.BaseDqtGrammars.ListToState
 SmticToState = DqtGrmBase.BaseDqtGrammars.SmticToState
 MapToState = DqtGrmBase.BaseDqtGrammars.MapToState
 Callback = DqtGrmBase.BaseDqtGrammars.Callback
@@ -46,13 +46,13 @@ class BoxLayout(QWidget):
         refuseParentStyle = bool(self.RefuseParentStyle in self._options)
         self._style = Validate(style, DqtStyle.emptyStyle(DqtStyle.QWidget) if refuseParentStyle else RStr.pEmpty)
         self.setStyleSheet(self._style)
-        if isinstance(self._style, Remember):
+        if Remember.isState(self._style):
             self._style.connect(lambda value: self.setStyleSheet(value), host=self)
         if self._content:
             content: QWidget = Remember.getValue(self._content)
             content.setParent(self)
         self._destroyPrevious = destroyPrevious
-        if isinstance(self._content, Remember):
+        if Remember.isState(self._content):
             self._content.actConnect(self.updateContent, host=self)
         triggers = triggers if triggers else dict()
         for k, v in triggers.items():
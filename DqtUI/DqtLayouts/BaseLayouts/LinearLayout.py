@@ -63,7 +63,7 @@ class LinearLayout(QWidget):
         refuseParentStyle = bool(self.RefuseParentStyle in self._options)
         self._style = Validate(style, DqtStyle.emptyStyle(DqtStyle.QWidget) if refuseParentStyle else RStr.pEmpty)
         self.setStyleSheet(self._style)
-        if isinstance(self._style, Remember):
+        if Remember.isState(self._style):
             self._style.connect(lambda value: self.setStyleSheet(value), host=self)
         self._contentSizeRatio = None
         self._autoContentResize = autoContentResize
@@ -55,11 +55,11 @@ class Button(QPushButton):
         self.setEnabled(Remember.getValue(enable))
         self.setText(text)
         self.setStyleSheet(style)
-        if isinstance(text, Remember):
+        if Remember.isState(text):
             text.connect(lambda value: self.setText(value), host=self)
-        if isinstance(style, Remember):
+        if Remember.isState(style):
             style.connect(lambda value: self.setStyleSheet(value), host=self)
-        if isinstance(enable, Remember):
+        if Remember.isState(enable):
             enable.connect(lambda value: self.setEnabled(value), host=self)
         if onClick:
             # noinspection PyUnresolvedReferences
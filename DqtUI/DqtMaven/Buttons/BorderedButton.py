@@ -151,7 +151,7 @@ class BorderedButton(Button):
         self.updateStyle()
         self.updateBorderRadius()
         for v in self._styleEditor.styles.values():
-            if isinstance(v, Remember):
+            if Remember.isState(v):
                 v.connect(partial(self.updateStyle), host=self)
 
     def resizeEvent(self, a0):
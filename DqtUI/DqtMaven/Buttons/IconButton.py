@@ -51,7 +51,7 @@ class IconButton(BorderedButton):
         self._icon = icon
         self._iconRatio = Validate(iconSizeRatio, self.DefaultIconSizeRatio)
         self.setIcon(self._icon)
-        if isinstance(self._icon, Remember):
+        if Remember.isState(self._icon):
             self._icon.connect(lambda value: Run(self.setIcon(QIcon(value)), self.resizeIcon()), host=self)
 
     @private
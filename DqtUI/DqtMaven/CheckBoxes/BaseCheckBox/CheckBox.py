@@ -38,17 +38,17 @@ class CheckBox(QCheckBox):
         self.setFixedSize(size)
         self.setParent(parent)
         self.setText(description)
-        if isinstance(description, Remember):
+        if Remember.isState(description):
             description.connect(lambda value: self.setText(value), host=self)
         self.setChecked(checked)
-        if isinstance(checked, Remember):
+        if Remember.isState(checked):
             checked.connect(lambda value: self.setChecked(value), host=self)
             checked.connect(partial(Validate(onValueChange, lambda: None)), host=self)
             # noinspection PyUnresolvedReferences
             self.clicked.connect(lambda: checked.setValue(self.isChecked()))
         style = Validate(style, DqtStyle.emptyStyle(DqtStyle.QCheckBox))
         self.setStyleSheet(style)
-        if isinstance(style, Remember):
+        if Remember.isState(style):
             style.connect(lambda value: self.setStyleSheet(value), host=self)
         if onClick:
             # noinspection PyUnresolvedReferences
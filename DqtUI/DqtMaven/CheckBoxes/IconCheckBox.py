@@ -121,7 +121,7 @@ class IconCheckBox(CheckBox):
         )
         self._styleEditor = Validate(styleEditor, CheckBoxStyle())
         for v in self._styleEditor.styles.values():
-            if isinstance(v, Remember):
+            if Remember.isState(v):
                 v.connect(lambda: self.updateStyle(), host=self)
 
     @private
@@ -45,16 +45,16 @@ class ComboBox(QComboBox):
         self.setParent(parent)
         self._placeholder = Validate(placeholder, self.DefaultPlaceholder)
         self._selection = ValToState(selection)
-        if isinstance(self._selection, Remember):
+        if Remember.isState(self._selection):
             self._selection.connect(lambda value: self.setCurrentText(value), host=self)
             # noinspection PyUnresolvedReferences
             self.activated.connect(lambda: self._selection.setValue(self.currentItem()))
         self._dataModel = Validate(dataModel, list())
         self.setItems(self._dataModel)
-        if isinstance(self._dataModel, Remember):
+        if Remember.isState(self._dataModel):
             self._dataModel.connect(lambda value: self.setItems(value), host=self)
         self.setStyleSheet(Validate(style, DqtStyle.emptyStyle(DqtStyle.QComboBox)))
-        if isinstance(style, Remember):
+        if Remember.isState(style):
             style.connect(lambda value: self.setStyleSheet(value), host=self)
         # noinspection PyUnresolvedReferences
         self.activated.connect(partial(Validate(onSelected, lambda: None)))
@@ -286,7 +286,7 @@ class BorderedComboBox(ComboBox):
         self._styleEditor = Validate(styleEditor, ComboBoxStyle())
         self._dropListOffset = Validate(dropListOffset, int(0))
         for v in self._styleEditor.styles.values():
-            if isinstance(v, Remember):
+            if Remember.isState(v):
                 v.connect(partial(self.updateStyle), host=self)
 
     def updateStyle(self):
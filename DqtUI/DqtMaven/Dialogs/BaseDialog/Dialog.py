@@ -55,11 +55,11 @@ class Dialog(QDialog):
         self.setWindowFlag(Qt.Dialog)
         title = Validate(title, RStr.pEmpty)
         self.setWindowTitle(title)
-        if isinstance(title, Remember):
+        if Remember.isState(title):
             title.connect(lambda value: self.setWindowTitle(value), host=self)
         style = Validate(style, RStr.pEmpty)
         self.setStyleSheet(style)
-        if isinstance(style, Remember):
+        if Remember.isState(style):
             style.connect(lambda value: self.setStyleSheet(value), host=self)
         self._subDialogs = Validate(subDialogs, dict())
         for k, v in self._subDialogs.items():
@@ -71,7 +71,7 @@ class Dialog(QDialog):
             Key(acceptTrig).Val(partial(self.accept))
         ).data
         for k, v in triggers.items():
-            if isinstance(k, Remember):
+            if Remember.isState(k):
                 k.connect(partial(v), host=self)
         if maximizeHint:
             self.setWindowFlags(self.windowFlags() | Qt.WindowMaximizeButtonHint)
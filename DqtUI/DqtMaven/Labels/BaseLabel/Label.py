@@ -51,11 +51,11 @@ class Label(QLabel):
         self.setText(text)
         self.setStyleSheet(style)
         self.setAlignment(alignment)
-        if isinstance(text, Remember):
+        if Remember.isState(text):
             text.connect(lambda value: self.setText(value), host=self)
-        if isinstance(style, Remember):
+        if Remember.isState(style):
             style.connect(lambda value: self.setStyleSheet(value), host=self)
-        if isinstance(alignment, Remember):
+        if Remember.isState(alignment):
             alignment.connect(lambda value: self.setAlignment(value), host=self)
         self._onClick = onClick
         self._enable = enable
@@ -96,7 +96,7 @@ class IconLabel(Label):
         self._iconPixmap = iconPixmap
         if self._iconPixmap:
             self.setPixmap(self._iconPixmap)
-        if isinstance(self._iconPixmap, Remember):
+        if Remember.isState(self._iconPixmap):
             self._iconPixmap.connect(lambda value: self.setPixmap(value), host=self)
 
     def setPixmap(self, a0: RState[QPixmap]):
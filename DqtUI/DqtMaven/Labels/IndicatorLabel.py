@@ -161,7 +161,7 @@ class IndicatorLabel(Label):
         self._state = Validate(state, self.NORMAL)
         self.updateStyle()
         for item in self._styleEditor.styles() + GList(self._state):
-            if isinstance(item, Remember):
+            if Remember.isState(item):
                 item.connect(partial(self.updateStyle), host=self)
 
     @private
@@ -47,7 +47,7 @@ class PixmapLabel(Label):
         self.setScaledContents(False)
         self._pixmap = pixmap
         self._placeholder = Validate(placeholder, self.Placeholder)
-        if isinstance(self._pixmap, Remember):
+        if Remember.isState(self._pixmap):
             self._pixmap.connect(lambda value: self.setPixmap(value), host=self)
         self.setPixmap(self._pixmap)
 
@@ -102,7 +102,7 @@ class LazyRow(QScrollArea):
         self._fixWidth = fixWidth
         self._fixHeight = fixHeight
         for v in self._scrollAreaStyle.styles.values():
-            if isinstance(v, Remember):
+            if Remember.isState(v):
                 v.connect(partial(self.updateStyle), host=self)
         self.updateStyle()
         self._initialSize = None
@@ -189,7 +189,7 @@ class LazyColumn(QScrollArea):
         self._fixWidth = fixWidth
         self._fixHeight = fixHeight
         for v in self._scrollAreaStyle.styles.values():
-            if isinstance(v, Remember):
+            if Remember.isState(v):
                 v.connect(partial(self.updateStyle), host=self)
         self.updateStyle()
         self._initialSize = None
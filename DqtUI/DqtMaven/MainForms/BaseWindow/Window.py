@@ -47,9 +47,9 @@ class Window(QMainWindow):
             self.setWindowTitle(title)
         if isValid(style):
             self.setStyleSheet(style)
-        if isinstance(title, Remember):
+        if Remember.isState(title):
             title.connect(lambda value: self.setWindowTitle(value), host=self)
-        if isinstance(style, Remember):
+        if Remember.isState(style):
             style.connect(lambda value: self.setStyleSheet(value), host=self)
         for k, v in Validate(dialogs, dict()).items():
             k.setParent(self)
@@ -180,76 +180,76 @@ class CurvePlotter(MultiAxisPlotter):
             Key(self.curveVisible).Val(Remember.obtainListItem(curveVisibles, idx))
         ).data
         self._curveKeys = list(Remember.getDictValue(curveData).keys())
-        if isinstance(curveData, Remember):
+        if Remember.isState(curveData):
             curveData.connect(lambda value: self.setCurveData(value), host=self)
-        if isinstance(xLabel, Remember):
+        if Remember.isState(xLabel):
             xLabel.connect(lambda value: self.setXLabel(value), host=self)
-        if isinstance(yLabels, Remember):
+        if Remember.isState(yLabels):
             yLabels.connect(lambda value: self.setYLabels(value), host=self)
-        if isinstance(aspectMode, Remember):
+        if Remember.isState(aspectMode):
             aspectMode.connect(lambda value: self.setAspectMode(value), host=self)
-        if isinstance(lineWidths, Remember):
+        if Remember.isState(lineWidths):
             lineWidths.connect(lambda value: self.setLineWidths(value), host=self)
-        if isinstance(lineColors, Remember):
+        if Remember.isState(lineColors):
             lineColors.connect(lambda value: self.setLineColors(value), host=self)
-        if isinstance(lineStyles, Remember):
+        if Remember.isState(lineStyles):
             lineStyles.connect(lambda value: self.setLineStyles(value), host=self)
-        if isinstance(pinnerStyles, Remember):
+        if Remember.isState(pinnerStyles):
             pinnerStyles.connect(lambda value: self.setPinnerStyles(value), host=self)
-        if isinstance(pinnerSizes, Remember):
+        if Remember.isState(pinnerSizes):
             pinnerSizes.connect(lambda value: self.setPinnerSizes(value), host=self)
-        if isinstance(annotationColors, Remember):
+        if Remember.isState(annotationColors):
             annotationColors.connect(lambda value: self.setAnnotationColors(value), host=self)
-        if isinstance(curveVisibles, Remember):
+        if Remember.isState(curveVisibles):
             curveVisibles.connect(lambda value: self.setCurveVisibles(value), host=self)
         for i, item in enumerate(Remember.getValue(curveData).items()):
             k, v = item
-            if isinstance(k, Remember):
+            if Remember.isState(k):
                 k.uniqueConnect(self.setCurveDescription, i, host=self)
-            if isinstance(v, Remember):
+            if Remember.isState(v):
                 updateData = lambda a0, a1=k: self.setAxCurveData(Remember.getValue(a1), a0)
                 v.uniqueConnect(self.setAxCurveData, method=updateData, host=self)
         for i, label in enumerate(Remember.getValue(yLabels)):
-            if isinstance(label, Remember):
+            if Remember.isState(label):
                 label.uniqueConnect(self.setYLabel, i, host=self)
         for i, width in enumerate(Remember.getValue(lineWidths)):
-            if isinstance(width, Remember):
+            if Remember.isState(width):
                 width.uniqueConnect(self.setLineWidth, i, host=self)
         for i, style in enumerate(Remember.getValue(lineStyles)):
-            if isinstance(style, Remember):
+            if Remember.isState(style):
                 style.uniqueConnect(self.setLineStyle, i, host=self)
         for i, style in enumerate(Remember.getValue(pinnerStyles)):
-            if isinstance(style, Remember):
+            if Remember.isState(style):
                 style.uniqueConnect(self.setPinnerStyle, i, host=self)
         for i, size in enumerate(Remember.getValue(pinnerSizes)):
-            if isinstance(size, Remember):
+            if Remember.isState(size):
                 size.uniqueConnect(self.setPinnerSize, i, host=self)
         for i, color in enumerate(Remember.getValue(lineColors)):
-            if isinstance(color, Remember):
+            if Remember.isState(color):
                 color.uniqueConnect(self.setLineColor, i, host=self)
         for i, color in enumerate(Remember.getValue(annotationColors)):
-            if isinstance(color, Remember):
+            if Remember.isState(color):
                 color.uniqueConnect(self.setAnnotationColor, i, host=self)
         for i, visible in enumerate(Remember.getValue(curveVisibles)):
-            if isinstance(visible, Remember):
+            if Remember.isState(visible):
                 visible.uniqueConnect(self.setCurveVisibleByIndex, i, host=self)
-        if isinstance(styleEditor.style, Remember):
+        if Remember.isState(styleEditor.style):
             styleEditor.style.connect(lambda value: self.setStyleSheet(value), host=self)
-        if isinstance(styleEditor.cursorStyle, Remember):
+        if Remember.isState(styleEditor.cursorStyle):
             styleEditor.cursorStyle.connect(lambda value: self.setCursorStyle(value), host=self)
-        if isinstance(styleEditor.cursorAlpha, Remember):
+        if Remember.isState(styleEditor.cursorAlpha):
             styleEditor.cursorAlpha.connect(lambda value: self.setCursorAlpha(value), host=self)
-        if isinstance(styleEditor.cursorColor, Remember):
+        if Remember.isState(styleEditor.cursorColor):
             styleEditor.cursorColor.connect(lambda value: self.setCursorColor(value), host=self)
-        if isinstance(styleEditor.annotationAlpha, Remember):
+        if Remember.isState(styleEditor.annotationAlpha):
             styleEditor.annotationAlpha.connect(lambda value: self.setAnnotationAlpha(value), host=self)
-        if isinstance(styleEditor.annotationFrame, Remember):
+        if Remember.isState(styleEditor.annotationFrame):
             styleEditor.annotationFrame.connect(lambda value: self.setAnnotationFrame(value), host=self)
-        if isinstance(markLimit, Remember):
+        if Remember.isState(markLimit):
             markLimit.connect(lambda value: self.setMarkLimit(value), host=self)
-        if isinstance(cursorOff, Remember):
+        if Remember.isState(cursorOff):
             cursorOff.connect(lambda value: self.switchCursor(value), host=self)
-        if isinstance(gridOn, Remember):
+        if Remember.isState(gridOn):
             gridOn.connect(lambda value: self.setCanvasGrid(value))
         self._lang = Validate(language, RStr.EN)
         self._exportOptions = Validate(exportOptions, dict())
@@ -275,7 +275,7 @@ class CurvePlotter(MultiAxisPlotter):
             Key(trigs.shrinkYLimTrig).Val(partial(self.scaleYAxisLimitation, self.defaultLimScaleRatio)),
         ).data
         for k, v in optionTrigs.items():
-            if isinstance(k, Remember):
+            if Remember.isState(k):
                 k.connect(partial(v), host=self)
         return None
 
@@ -313,7 +313,7 @@ class CurvePlotter(MultiAxisPlotter):
     @private
     def setLineStyles(self, styles: StringSTox):
         for i, style in enumerate(styles):
-            if isinstance(style, Remember):
+            if Remember.isState(style):
                 style.uniqueConnect(self.setLineStyle, i, host=self)
             self.setLineStyle(i, Remember.getValue(style))
         return None
@@ -321,7 +321,7 @@ class CurvePlotter(MultiAxisPlotter):
     @private
     def setPinnerStyles(self, styles: StringSTox):
         for i, style in enumerate(styles):
-            if isinstance(style, Remember):
+            if Remember.isState(style):
                 style.uniqueConnect(self.setPinnerStyle, i, host=self)
             self.setPinnerStyle(i, Remember.getValue(style))
         return None
@@ -329,7 +329,7 @@ class CurvePlotter(MultiAxisPlotter):
     @private
     def setPinnerSizes(self, sizes: FloatSTox):
         for i, size in enumerate(sizes):
-            if isinstance(size, Remember):
+            if Remember.isState(size):
                 size.uniqueConnect(self.setPinnerSize, i, host=self)
             self.setPinnerSize(i, Remember.getValue(size))
         return None
@@ -337,7 +337,7 @@ class CurvePlotter(MultiAxisPlotter):
     @private
     def setCurveVisibles(self, visibles: BoolSTox):
         for i, visible in enumerate(visibles):
-            if isinstance(visible, Remember):
+            if Remember.isState(visible):
                 visible.uniqueConnect(self.setCurveVisibleByIndex, i, host=self)
             self.setCurveVisibleByIndex(i, Remember.getValue(visible))
         return None
@@ -345,7 +345,7 @@ class CurvePlotter(MultiAxisPlotter):
     @private
     def setAnnotationColors(self, colors: ColorSTox):
         for i, color in enumerate(colors):
-            if isinstance(color, Remember):
+            if Remember.isState(color):
                 color.uniqueConnect(self.setAnnotationColor, i, host=self)
             self.setAnnotationColor(i, Remember.getValue(color))
         return None
@@ -353,7 +353,7 @@ class CurvePlotter(MultiAxisPlotter):
     @private
     def setLineColors(self, colors: ColorSTox):
         for i, color in enumerate(colors):
-            if isinstance(color, Remember):
+            if Remember.isState(color):
                 color.uniqueConnect(self.setLineColor, i, host=self)
             self.setLineColor(i, Remember.getValue(color))
             self.updateCurveLegends()
@@ -362,7 +362,7 @@ class CurvePlotter(MultiAxisPlotter):
     @private
     def setLineWidths(self, widths: FloatSTox):
         for i, width in enumerate(widths):
-            if isinstance(width, Remember):
+            if Remember.isState(width):
                 width.uniqueConnect(self.setLineWidth, i, host=self)
             self.setLineWidth(i, Remember.getValue(width))
         return None
@@ -370,7 +370,7 @@ class CurvePlotter(MultiAxisPlotter):
     @private
     def setYLabels(self, labels: StringSTox):
         for i, label in enumerate(labels):
-            if isinstance(label, Remember):
+            if Remember.isState(label):
                 label.uniqueConnect(self.setYLabel, i, host=self)
             self.setYLabel(i, Remember.getValue(label))
         return None
@@ -399,9 +399,9 @@ class CurvePlotter(MultiAxisPlotter):
         curveKeys = Remember.getListValue(curveData.keys())
         for k, v in curveData.items():
             idx = curveKeys.index(k)
-            if isinstance(k, Remember):
+            if Remember.isState(k):
                 k.uniqueConnect(self.setCurveDescription, idx, host=self)
-            if isinstance(v, Remember):
+            if Remember.isState(v):
                 v.uniqueConnect(self.setAxCurveData, Remember.getValue(k), host=self)
             description = Remember.getValue(k)
             axis_data = Remember.getValue(v)
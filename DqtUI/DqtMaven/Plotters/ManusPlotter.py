@@ -358,13 +358,13 @@ class ManusPlotter(Column):
         dif = n - len(val)
         for i, item in enumerate(val[:n]):
             if prevTrav:
-                if isinstance(item, Remember):
+                if Remember.isState(item):
                     item.setValue(prevTrav(i))
                 else:
                     val[i] = prevTrav(i)
             else:
                 if Remember.getValue(item) is None:
-                    if isinstance(item, Remember):
+                    if Remember.isState(item):
                         item.setValue(method(i))
                     else:
                         val[i] = method(i)
@@ -56,10 +56,10 @@ class Slider(QSlider):
         self.setValue(data)
         self.setPageStep(0)
         onValueChange = Validate(onValueChange, lambda: None)
-        if isinstance(data, Remember):
+        if Remember.isState(data):
             data.connect(lambda value: self.setValue(value), host=self)
             self.valueChanged.connect(lambda: Run(data.setValue(self.value()), onValueChange()))
-        if isinstance(style, Remember):
+        if Remember.isState(style):
             style.connect(lambda value: self.setStyleSheet(value), host=self)
         self.setStyleSheet(style)
         triggers = Validate(triggers, dict())
@@ -257,7 +257,7 @@ class ColoredSlider(Slider):
         )
         self.updateStyle()
         for val in self._styleEditor.styles.values():
-            if isinstance(val, Remember):
+            if Remember.isState(val):
                 val.connect(partial(self.updateStyle), host=self)
 
     def updateStyle(self):
@@ -7,7 +7,7 @@ from PyQt5.QtCore import QSize, Qt, QPoint, QTimer, QModelIndex, QItemSelectionM
 from PyQt5.QtGui import QStandardItem, QStandardItemModel
 from PyQt5.QtWidgets import QTableView, QWidget, QAbstractItemView
 
-from DeclarativeQt.DqtCore.DqtBase import Remember, RState
+from DeclarativeQt.DqtCore.DqtBase import Remember, RState, ReferState, RList
 from DeclarativeQt.DqtCore.DqtCanvas import DqtCanvas
 from DeclarativeQt.DqtCore.DqtCanvas.DqtCanvas import DqtCanvasBase
 from DeclarativeQt.DqtUI.DqtTools.Scroller import ScrollRate
@@ -77,7 +77,7 @@ class TableView(QTableView):
             self.setParent(parent)
         if style:
             self.setStyleSheet(Remember.getValue(style))
-        if isinstance(style, Remember):
+        if Remember.isState(style):
             style.connect(lambda value: self.setStyleSheet(value), host=self)
         self._autoColumnResize = autoColumnResize
         self._contentRemain = Validate(contentRemain, self.DefaultContentRemain)
@@ -91,16 +91,35 @@ class TableView(QTableView):
         self._retainFocus = retainFocus
         self._areaSelection = Validate(areaSelection, Remember(None))
         self._cellSelection = Validate(cellSelection, Remember(None))
-        if isinstance(dataModel, Remember):
+        self._lazyDataModel = dataModel if isinstance(dataModel, ReferState) and dataModel.isLazy() else None
+        self._pendingPull = False
+        self._listModel = dataModel if isinstance(dataModel, RList) else None
+        self._rowIndexes: Dict[int, int] = dict()
+        if isValid(self._listModel):
+            self._listModel.diffConnect(
+                host=self,
+                onReset=lambda value: self.setDataModel(value, fields, fieldMap, hiddenFields),
+                onInserted=partial(self.insertModelRows),
+                onRemoved=partial(self.removeModelRows),
+                onMoved=partial(self.moveModelRow),
+                onItemChanged=partial(self.resetModelRow),
+            )
+        elif Remember.isState(dataModel):
             dataModel.connect(lambda value: self.setDataModel(value, fields, fieldMap, hiddenFields), host=self)
-        if isinstance(fields, Remember):
+        if isValid(self._lazyDataModel):
+            self._lazyDataModel.invalidConnect(partial(self.pullDataModel), host=self)
+        if Remember.isState(fields):
             fields.connect(lambda value: self.setColumnLabels(value, fieldMap), host=self)
             fields.connect(lambda value: self.hideTableFields(value, hiddenFields), host=self)
-        if isinstance(fieldMap, Remember):
+        if Remember.isState(fieldMap):
             fieldMap.connect(lambda value: self.setColumnLabels(fields, value), host=self)
-        if isinstance(hiddenFields, Remember):
+        if Remember.isState(hiddenFields):
             hiddenFields.connect(lambda value: self.hideTableFields(fields, value), host=self)
-        self.setDataModel(dataModel, fields, fieldMap, hiddenFields)
+        if isValid(self._lazyDataModel) and self._lazyDataModel.isStale():
+            self._pendingPull = True
+            self.setDataModel(None, fields, fieldMap, hiddenFields)
+        else:
+            self.setDataModel(dataModel, fields, fieldMap, hiddenFields)
         # noinspection PyUnresolvedReferences
         self.activated.connect(partial(Validate(onActivated, lambda: None)))
         self.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
@@ -117,7 +136,7 @@ class TableView(QTableView):
             Key(copyCellsTrig).Val(self.copyItemTexts)
         ).data
         for k, v in optionTrigs.items():
-            if isinstance(k, Remember):
+            if Remember.isState(k):
                 k.connect(partial(v), host=self)
         triggers = Validate(triggers, dict())
         for k, v in triggers.items():
@@ -133,6 +152,20 @@ class TableView(QTableView):
         pyperclip.copy(self._copyLinker.join(texts))
         return None
 
+    def pullDataModel(self):
+        if not self.isVisible():
+            self._pendingPull = True
+            return None
+        self._pendingPull = False
+        Remember.getValue(self._lazyDataModel)
+        return None
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        if self._pendingPull:
+            self.pullDataModel()
+        return None
+
     def paintEvent(self, e):
         if not Remember.getValue(self._retainFocus):
             if self._areaSelection.value() is None:
@@ -382,6 +415,60 @@ class TableView(QTableView):
             self.setColumnHidden(col, bool(col in hidenCols))
         return None
 
+    @private
+    def bindRowState(self, row: RowData, rowIndex: int):
+        if not Remember.isState(row):
+            return None
+        if isValid(self._listModel):
+            row.uniqueConnect(self.updateRowState, row, host=self)
+        else:
+            row.uniqueConnect(self.updateRowData, rowIndex, host=self)
+        return None
+
+    @private
+    def updateRowState(self, row: RowData, rowData: RowData):
+        rowIndex = self.rowIndexOf(row)
+        if rowIndex is None:
+            return None
+        self.updateRowData(rowIndex, rowData)
+        return None
+
+    @private
+    def rowIndexOf(self, row: RowData) -> Optional[int]:
+        rows = Remember.getValue(self._listModel)
+        rowIndex = self._rowIndexes.get(id(row))
+        if rowIndex is not None and rowIndex < len(rows) and rows[rowIndex] is row:
+            return rowIndex
+        self._rowIndexes = {id(x): i for i, x in enumerate(rows)}
+        return self._rowIndexes.get(id(row))
+
+    def insertModelRows(self, index: int, count: int):
+        rows = Remember.getValue(self._listModel)
+        for i in range(index, index + count):
+            rowData = Remember.getValue(rows[i])
+            self._tableModel.insertRow(i, ReferList(rowData, lambda item: self.tableStandardItem(item)))
+            self.bindRowState(rows[i], i)
+        self.autoAdjustColumnSize()
+        return None
+
+    def removeModelRows(self, index: int, count: int):
+        self._tableModel.removeRows(index, count)
+        self.autoAdjustColumnSize()
+        return None
+
+    def moveModelRow(self, fromAt: int, moveTo: int):
+        self._tableModel.insertRow(moveTo, self._tableModel.takeRow(fromAt))
+        return None
+
+    def resetModelRow(self, index: int):
+        row = Remember.getValue(self._listModel)[index]
+        self._tableModel.removeRow(index)
+        self._tableModel.insertRow(index, ReferList(Remember.getValue(row), lambda a0: self.tableStandardItem(a0)))
+        self._rowIndexes[id(row)] = index
+        self.bindRowState(row, index)
+        self.autoAdjustColumnSize()
+        return None
+
     def updateRowData(self, rowIndex: int, rowData: RowData):
         for col, data in enumerate(Remember.getValue(rowData)):
             self._tableModel.setItem(rowIndex, col, self.tableStandardItem(data))
@@ -412,8 +499,7 @@ class TableView(QTableView):
             for row in tableData:
                 self._tableModel.appendRow(ReferList(row, lambda item: self.tableStandardItem(item)))
             for i, row in enumerate(Remember.getValue(dataModel)):
-                if isinstance(row, Remember):
-                    row.uniqueConnect(self.updateRowData, i, host=self)
+                self.bindRowState(row, i)
         self.setModel(self._tableModel)
         self.setColumnLabels(fields, fieldMap)
         self.hideTableFields(fields, hiddenFields)
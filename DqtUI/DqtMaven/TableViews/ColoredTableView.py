@@ -282,7 +282,7 @@ class ColoredTableView(TableView):
         self._styleEditor = Validate(styleEditor, TableViewStyle())
         self.setAlternatingRowColors(True)
         for v in self._styleEditor.styleValues:
-            if isinstance(v, Remember):
+            if Remember.isState(v):
                 v.connect(partial(self.updateStyle), host=self)
         self.setEditTriggers(QTableView.NoEditTriggers)
         self.setCornerButtonEnabled(False)
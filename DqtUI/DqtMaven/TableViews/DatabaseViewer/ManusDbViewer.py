@@ -1,4 +1,3 @@
-from functools import partial
 from typing import Callable, Dict
 
 from PyQt5.QtCore import QSize
@@ -53,18 +52,24 @@ class ManusDbViewer(ManusTableView):
             insertDataMethod: RowOptCallback = None,
             deleteDataMethod: RowOptCallback = None,
             moveDataMethod: RowOptCallback = None,
-            editDataMethod: RowOptCallback = None
+            editDataMethod: RowOptCallback = None,
+            lazyFetch: bool = False,
+            asyncFetch: bool = False,
+            syncFetch: bool = None
     ):
         tableToDataModel = SqliteDbViewer.tableToDataModel
         language = Validate(language, RStr.EN)
         dbFieldMap = lambda a0, a1, t0=None: a0.dbFieldNLMap(a1) if a0 else None
-        fetchDataMethod = Validate(fetchDataMethod, partial(SqlDbMethod.fetchSqlTable))
+        tableSync = SqliteDbViewer.tableSyncOf(sqlDb, fetchDataMethod, syncFetch)
+        fetchDataMethod = Validate(fetchDataMethod, SqlDbMethod.fetchSqlTable)
         fields = lambda a0, t0=None: a0.dbFields if a0 else list()
         tableData = lambda a0, t0=None: tableToDataModel(fetchDataMethod(a0, fields(a0))) if a0 else None
         reloadTrig = Validate(reloadTrig, Trigger())
         super().__init__(
             size=size,
-            dataModel=ReferState(sqlDb, reloadTrig, referExp=tableData),
+            dataModel=SqliteDbViewer.tableDataState(
+                sqlDb, reloadTrig, tableData, lazyFetch, asyncFetch, tableSync
+            ),
             fieldMap=ReferState(sqlDb, language, reloadTrig, referExp=dbFieldMap),
             fields=ReferState(sqlDb, reloadTrig, referExp=fields),
             hiddenFields=hiddenFields,
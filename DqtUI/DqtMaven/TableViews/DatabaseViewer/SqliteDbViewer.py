@@ -1,18 +1,19 @@
-from functools import partial
-from typing import Callable, Dict, Union, List
+from typing import Callable, Dict, Union, List, Optional
 
 from PyQt5.QtCore import QSize
 from PyQt5.QtWidgets import QWidget
 
-from DeclarativeQt.DqtCore.DqtBase import Remember, ReferState, RState
+from DeclarativeQt.DqtCore.DqtBase import Remember, ReferState, RState, RList
 from DeclarativeQt.DqtUI.DqtMaven.TableViews.BaseTableView.TableView import CellArea, CellAt, \
     TableFields
 from DeclarativeQt.DqtUI.DqtMaven.TableViews.ColoredTableView import ColoredTableView, TableViewStyle
 from DeclarativeQt.Resource.Grammars.RGrammar import Validate, isEmpty
 from DeclarativeQt.Resource.Images.RImage import LutPixel
 from DeclarativeQt.Resource.Strings.RStr import NLIndex, RStr
+from DeclarativeQt.Storage.SqliteDb.SqlAsync.SqlAsyncExecutor import SqlAsyncQuery
 from DeclarativeQt.Storage.SqliteDb.SqlDbKernel.SqlDatabase import SqlDatabase
-from DeclarativeQt.Storage.SqliteDb.SqlDbKernel.SqlDbMethod import SqlDbMethod, SqlTableData
+from DeclarativeQt.Storage.SqliteDb.SqlDbKernel.SqlDbMethod import SqlTableData, SqlDbMethod
+from DeclarativeQt.Storage.SqliteDb.SqlDbKernel.SqlTableSync import SqlTableSync
 
 FetchDbMethod = Union[Callable[[SqlDatabase, List], SqlTableData], Callable]
 
@@ -47,16 +48,20 @@ class SqliteDbViewer(ColoredTableView):
             copyCellsTrig: Remember = None,
             locateRowsTrig: Remember = None,
             clearSelectionTrig: Remember = None,
-            triggers: Dict[Remember, Callable] = None
+            triggers: Dict[Remember, Callable] = None,
+            lazyFetch: bool = False,
+            asyncFetch: bool = False,
+            syncFetch: bool = None
     ):
         language = Validate(language, RStr.EN)
         dbFieldMap = lambda a0, a1, t0=None: a0.dbFieldNLMap(a1) if a0 else None
-        fetchDataMethod = Validate(fetchDataMethod, partial(SqlDbMethod.fetchSqlTable))
+        tableSync = SqliteDbViewer.tableSyncOf(sqlDb, fetchDataMethod, syncFetch)
+        fetchDataMethod = Validate(fetchDataMethod, SqlDbMethod.fetchSqlTable)
         fields = lambda a0, t0=None: a0.dbFields if a0 else list()
         tableData = lambda a0, t0=None: self.tableToDataModel(fetchDataMethod(a0, fields(a0))) if a0 else None
         super().__init__(
             size=size,
-            dataModel=ReferState(sqlDb, reloadTrig, referExp=tableData),
+            dataModel=self.tableDataState(sqlDb, reloadTrig, tableData, lazyFetch, asyncFetch, tableSync),
             fieldMap=ReferState(sqlDb, language, reloadTrig, referExp=dbFieldMap),
             fields=ReferState(sqlDb, reloadTrig, referExp=fields),
             hiddenFields=hiddenFields,
@@ -84,15 +89,42 @@ class SqliteDbViewer(ColoredTableView):
             triggers=triggers
         )
 
+    @staticmethod
+    def tableSyncOf(
+            sqlDb: RState[SqlDatabase], fetchDataMethod: FetchDbMethod = None, syncFetch: bool = None
+    ) -> Optional[SqlTableSync]:
+        if fetchDataMethod is not None:
+            return None
+        database = Remember.getValue(sqlDb)
+        if not Validate(syncFetch, database is not None and database.dbChangeLog):
+            return None
+        return SqlTableSync()
+
+    @staticmethod
+    def tableDataState(
+            sqlDb: RState[SqlDatabase], reloadTrig: Remember, tableData: Callable,
+            lazyFetch: bool = False, asyncFetch: bool = False, tableSync: SqlTableSync = None
+    ) -> Remember:
+        if asyncFetch:
+            return SqlAsyncQuery().follow(sqlDb, reloadTrig, referExp=tableData)
+        if lazyFetch or tableSync is None:
+            return ReferState(sqlDb, reloadTrig, referExp=tableData, lazy=lazyFetch)
+        rows = RList()
+        syncRows = lambda *args: tableSync.syncSqlTable(
+            rows, Remember.getValue(sqlDb), converter=SqliteDbViewer.rowToDataModel
+        )
+        for state in (sqlDb, reloadTrig):
+            if Remember.isState(state):
+                state.connect(syncRows, host=rows)
+        syncRows()
+        return rows
+
     @staticmethod
     def tableToDataModel(table: SqlTableData) -> SqlTableData:
         if isEmpty(table):
             return None
-        dataModel = list()
-        for row in table.copy():
-            row = list(row)
-            for i, item in enumerate(row):
-                if item is None:
-                    row[i] = RStr.pEmpty
-            dataModel.append(tuple(row))
-        return dataModel
+        return [SqliteDbViewer.rowToDataModel(row) for row in table]
+
+    @staticmethod
+    def rowToDataModel(row: tuple) -> tuple:
+        return tuple(RStr.pEmpty if item is None else item for item in row)
@@ -4,9 +4,9 @@ from typing import Callable, Union, Dict, List, Optional, Iterable
 from PyQt5.QtCore import QSize, Qt, QPoint
 from PyQt5.QtWidgets import QWidget
 
-from DeclarativeQt.DqtCore.DqtBase import Remember, Trigger, Run, InputRequest, ReferState, RState
+from DeclarativeQt.DqtCore.DqtBase import Remember, Trigger, Run, InputRequest, ReferState, RState, RList
 from DeclarativeQt.DqtCore.DqtStyle.DqtStyle import DqtStyle
-from DeclarativeQt.DqtCore.DqtSyntax.DqtSyntax import SeqToState, ValToState, Execute
+from DeclarativeQt.DqtCore.DqtSyntax.DqtSyntax import SeqToState, ValToState, Execute, ListToState
 from DeclarativeQt.DqtUI.DqtLayouts.Layout import Column, Row
 from DeclarativeQt.DqtUI.DqtMaven.Buttons.IconButton import IconButton
 from DeclarativeQt.DqtUI.DqtMaven.Dialogs.MetaDialogs.NoteDialog import NoteDialog
@@ -70,7 +70,7 @@ class ManusTableView(Column):
             editDataMethod: RowOptCallback = None
     ):
         size = Validate(size, QSize(self.DefaultSize))
-        dataModel = SeqToState(dataModel)
+        dataModel = ListToState(dataModel)
         if fields is None:
             fields = ReferState(dataModel, referExp=lambda a0: ColoredTableView.deriveMockFields(a0))
         fields = ValToState(fields)
@@ -323,15 +323,17 @@ class ManusTableView(Column):
         moveTo = min(max(moveTo, int(0)), len(rows) - int(1))
         if Equal(fromAt, moveTo):
             return False
-        if moveTo > fromAt:
-            moved = rows[:fromAt] + rows[int(fromAt + 1):int(moveTo + 1)]
-            moved += GList(rows[fromAt]) + rows[int(moveTo + 1):]
-        else:
-            moved = rows[:moveTo] + GList(rows[fromAt])
-            moved += rows[moveTo:fromAt] + rows[int(fromAt + 1):]
-        if isinstance(dataModel, Remember):
-            dataModel.setValue(moved)
         rowArgs = Remember.getValue(rows[fromAt])
+        if isinstance(dataModel, RList):
+            dataModel.move(fromAt, moveTo)
+        elif Remember.isState(dataModel):
+            if moveTo > fromAt:
+                moved = rows[:fromAt] + rows[int(fromAt + 1):int(moveTo + 1)]
+                moved += GList(rows[fromAt]) + rows[int(moveTo + 1):]
+            else:
+                moved = rows[:moveTo] + GList(rows[fromAt])
+                moved += rows[moveTo:fromAt] + rows[int(fromAt + 1):]
+            dataModel.setValue(moved)
         if moveDataMethod:
             moveDataMethod(moveTo, **dict(zip(Remember.getValue(fields), rowArgs)))
         return True
@@ -360,7 +362,9 @@ class ManusTableView(Column):
         if not rows or not inRange(deleteAt, int(0), len(rows)):
             return False
         rowArgs = Remember.getValue(rows[deleteAt])
-        if isinstance(dataModel, Remember):
+        if isinstance(dataModel, RList):
+            dataModel.remove(deleteAt)
+        elif Remember.isState(dataModel):
             dataModel.setValue(rows[:deleteAt] + rows[int(deleteAt + 1):])
         if deleteDataMethod is not None:
             deleteDataMethod(deleteAt, **dict(zip(Remember.getValue(fields), rowArgs)))
@@ -388,7 +392,9 @@ class ManusTableView(Column):
         rows = Validate(Remember.getValue(dataModel), list())
         count = len(rows)
         index = insertAt % (count + 1) if insertAt < 0 else insertAt if insertAt < count else count
-        if isinstance(dataModel, Remember):
+        if isinstance(dataModel, RList):
+            dataModel.insert(index, Remember(result))
+        elif Remember.isState(dataModel):
             dataModel.setValue(rows[:index] + GList(Remember(result)) + rows[index:])
         if insertDataMethod is not None:
             insertDataMethod(index, **dict(zip(Remember.getValue(fields), result)))
@@ -432,7 +438,7 @@ class ManusTableView(Column):
         result = request(*args)
         if result is None:
             return None
-        if isinstance(rowData, Remember):
+        if Remember.isState(rowData):
             rowData.setValue(result)
         return result
 
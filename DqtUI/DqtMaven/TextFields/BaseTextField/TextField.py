@@ -64,7 +64,7 @@ class TextField(QLineEdit):
             self.setEchoMode(QLineEdit.Password)
         self.setEnabled(enable)
         self.setReadOnly(isReadOnly)
-        if isinstance(self._text, Remember):
+        if Remember.isState(self._text):
             self._text.connect(lambda value: self.setText(value), host=self)
             self._text.connect(partial(Validate(onValueChange, lambda: None)), host=self)
             # noinspection PyUnresolvedReferences
@@ -76,17 +76,17 @@ class TextField(QLineEdit):
         self.buildCompleter(completerStyle)
         if onCompletered:
             self._completered.connect(partial(onCompletered), host=self)
-        if isinstance(self._completer, Remember):
+        if Remember.isState(self._completer):
             self._completer.connect(partial(self.buildCompleter, completerStyle), host=self)
-        if isinstance(style, Remember):
+        if Remember.isState(style):
             style.connect(lambda value: self.setStyleSheet(value), host=self)
-        if isinstance(alignment, Remember):
+        if Remember.isState(alignment):
             alignment.connect(lambda value: self.setAlignment(value), host=self)
-        if isinstance(enable, Remember):
+        if Remember.isState(enable):
             enable.connect(lambda value: self.setEnabled(value), host=self)
-        if isinstance(isReadOnly, Remember):
+        if Remember.isState(isReadOnly):
             isReadOnly.connect(lambda value: self.setReadOnly(value), host=self)
-        if isinstance(passwordMode, Remember):
+        if Remember.isState(passwordMode):
             passwordMode.connect(lambda value: Run(self.setPasswordMode(value)), host=self)
         triggers = triggers if triggers else dict()
         for k, v in triggers.items():
@@ -114,7 +114,7 @@ class TextField(QLineEdit):
             onCompleterHide=partial(hideMethod),
             styleEditor=complterStyle,
         )).data
-        if completer and isinstance(self._text, Remember):
+        if completer and Remember.isState(self._text):
             # noinspection PyUnresolvedReferences
             completer.activated.connect(lambda value: self._text.setValue(value))
         return None
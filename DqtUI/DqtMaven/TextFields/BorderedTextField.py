@@ -212,9 +212,9 @@ class BorderedTextField(TextField):
         self.updateStyle()
         self.updateBorderRadius()
         for v in list(self._styleEditor.styles.values()) + GList(self._passwordMode, text):
-            if isinstance(v, Remember):
+            if Remember.isState(v):
                 v.connect(partial(self.updateStyle), host=self)
-        if not isinstance(text, Remember):
+        if not Remember.isState(text):
             # noinspection PyUnresolvedReferences
             self.textChanged.connect(partial(self.updateStyle))
 
@@ -82,10 +82,10 @@ class DataEditor(BorderedTextField):
             styleEditor=styleEditor
         )
         dataStr.connect(lambda a0: inputCheck.setValue(checkInputValue()), host=self)
-        if isinstance(data, Remember):
+        if Remember.isState(data):
             self.textEdited.connect(lambda: data.setValue(RStr.matchOne(dataStr.value(), dataType)))
             data.connect(partial(Validate(onValueChange, lambda: None)), host=self)
-        if isinstance(syncDataTrig, Remember):
+        if Remember.isState(syncDataTrig):
             syncDataTrig.connect(partial(self._optSyncData), host=self)
 
     def keyPressEvent(self, a0) -> None:
@@ -2,6 +2,8 @@ from abc import ABC
 from decimal import ROUND_HALF_UP, Decimal
 from typing import Optional
 
+import numpy as np
+
 from DeclarativeQt.Resource.Grammars.RGrammar import GList, Equal, isValid
 from DeclarativeQt.Resource.Strings.RStr import RStr
 
@@ -66,6 +68,8 @@ class PhyMeasure(ABC):
     ExponentFrame = "1e-{}"
     DecimalRound = RStr.DecimalRound
     DecimalPrecision = RStr.DecimalPrecision
+    ShortestMagnitude: float = 8.0
+    ExactMagnitude: float = 64.0
 
     def __eq__(self, other):
         if not isinstance(other, PhyMeasure):
@@ -92,6 +96,32 @@ class PhyMeasure(ABC):
             return value
         return float(rounded)
 
+    @staticmethod
+    def vectorConversion(values: np.ndarray, origin: MeasureUnit, target: MeasureUnit) -> np.ndarray:
+        return PhyMeasure.vectorRound(np.asarray(values, dtype=np.float64) * origin.value / target.value)
+
+    @staticmethod
+    def vectorRound(values: np.ndarray) -> np.ndarray:
+        values = np.asarray(values, dtype=np.float64)
+        scale = 10.0 ** PhyMeasure.DecimalPrecision
+        magnitude = np.abs(values)
+        whole = np.trunc(magnitude)
+        fraction = magnitude - whole
+        units = np.floor(fraction * scale)
+        half = (whole * scale * 2 + units * 2 + 1) / (scale * 2)
+        nearest = (units * 20 + 9) / (scale * 20)
+        byHalf = (magnitude < PhyMeasure.ShortestMagnitude) & (half != magnitude)
+        roundUp = np.where(byHalf, magnitude > half, fraction >= nearest)
+        floor = whole * scale + units
+        onGrid = (floor / scale == magnitude) | ((floor + 1) / scale == magnitude)
+        rounded = np.where(onGrid, magnitude, (floor + roundUp) / scale)
+        exact = ~np.isfinite(values) | (magnitude >= PhyMeasure.ExactMagnitude)
+        rounded = np.where(exact, values, np.copysign(rounded, values))
+        ambiguous = ~exact & ~onGrid & ~byHalf & (fraction == nearest)
+        for i in np.flatnonzero(ambiguous):
+            rounded.flat[i] = PhyMeasure.decimalRound(float(values.flat[i]))
+        return rounded
+
 
 class UnitlessMeasure(PhyMeasure):
     PhyMark = "Unitless"
@@ -203,3 +233,15 @@ class TemperatureMeasure(PhyMeasure):
         elif Equal(origin.symbol, fahrenheit) and Equal(target.symbol, celsius):
             return measurement.fahrenheitToCelsius(value)
         return PhyMeasure.decimalRound(value)
+
+    @staticmethod
+    def vectorConversion(values: np.ndarray, origin: MeasureUnit, target: MeasureUnit) -> np.ndarray:
+        values = np.asarray(values, dtype=np.float64)
+        measurement = TemperatureMeasure()
+        celsius = measurement.Celsius.symbol
+        fahrenheit = measurement.Fahrenheit.symbol
+        if Equal(origin.symbol, celsius) and Equal(target.symbol, fahrenheit):
+            values = values * measurement.Fahrenheit.value + measurement.FahrenheitBias
+        elif Equal(origin.symbol, fahrenheit) and Equal(target.symbol, celsius):
+            values = (values - measurement.FahrenheitBias) / measurement.Fahrenheit.value
+        return PhyMeasure.vectorRound(values)
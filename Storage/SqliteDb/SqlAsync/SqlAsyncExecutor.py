@@ -0,0 +1,122 @@
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Callable, Any, Optional
+
+from PyQt5.QtCore import QObject, pyqtSignal, Qt
+
+from DeclarativeQt.DqtCore.DqtBase import Remember, ChangePolicy, RState
+from DeclarativeQt.Resource.Grammars.RGrammar import ReferList, Validate
+from DeclarativeQt.Resource.Strings.RStr import RStr
+
+
+class SqlAsyncQuery(QObject):
+    def __init__(self, executor: "SqlAsyncExecutor" = None, initial: Any = None):
+        super().__init__()
+        self._executor = executor
+        self._token = int(0)
+        self._future: Optional[Future] = None
+        self.pending: Remember[bool] = Remember(False)
+        self.result: Remember = Remember(initial, compare=ChangePolicy.identity)
+        self.error: Remember[Optional[Exception]] = Remember(None, compare=ChangePolicy.identity)
+
+    @property
+    def executor(self) -> "SqlAsyncExecutor":
+        return Validate(self._executor, SqlAsyncExecutor.shared())
+
+    @property
+    def token(self) -> int:
+        return self._token
+
+    def request(self, method: Callable, *args: Any) -> Future:
+        return self.executor.submit(self, method, *args)
+
+    def follow(self, *states: RState[Any], referExp: Callable) -> Remember:
+        request = lambda *args: self.request(referExp, *ReferList(states, Remember.getValue))
+        for state in states:
+            if Remember.isState(state):
+                state.connect(request, host=self)
+        request()
+        return self.result
+
+    def supersede(self) -> int:
+        if self._future is not None:
+            self._future.cancel()
+        self._future = None
+        self._token += int(1)
+        self.pending.setValue(True)
+        return self._token
+
+    def track(self, token: int, future: Future):
+        if token == self._token:
+            self._future = future
+        return None
+
+    def cancel(self) -> bool:
+        if self._future is None:
+            return False
+        cancelled = self._future.cancel()
+        self._future = None
+        self._token += int(1)
+        self.pending.setValue(False)
+        return cancelled
+
+    def finish(self, token: int, result: Any, error: Optional[Exception]) -> bool:
+        if token != self._token:
+            return False
+        self._future = None
+        self.error.setValue(error)
+        if error is None:
+            self.result.setValue(result)
+        self.pending.setValue(False)
+        return True
+
+
+class SqlAsyncExecutor(QObject):
+    MaxWorkers: int = int(2)
+    delivered = pyqtSignal(object, int, object, object)
+    _shared: Optional["SqlAsyncExecutor"] = None
+
+    def __init__(self, maxWorkers: int = None):
+        super().__init__()
+        self._pool = ThreadPoolExecutor(
+            max_workers=Validate(maxWorkers, SqlAsyncExecutor.MaxWorkers), thread_name_prefix="SqlAsync"
+        )
+        # noinspection PyUnresolvedReferences
+        self.delivered.connect(self.deliver, Qt.QueuedConnection)
+
+    @staticmethod
+    def shared() -> "SqlAsyncExecutor":
+        if SqlAsyncExecutor._shared is None:
+            SqlAsyncExecutor._shared = SqlAsyncExecutor()
+        return SqlAsyncExecutor._shared
+
+    def submit(self, query: SqlAsyncQuery, method: Callable, *args: Any) -> Future:
+        token = query.supersede()
+        future = self._pool.submit(self.run, query, token, method, *args)
+        query.track(token, future)
+        return future
+
+    def run(self, query: SqlAsyncQuery, token: int, method: Callable, *args: Any) -> Any:
+        if token != query.token:
+            return None
+        result, error = None, None
+        try:
+            result = method(*args)
+        except Exception as e:
+            error = e
+            RStr.log(repr(e), RStr.lgError)
+        # noinspection PyUnresolvedReferences
+        self.delivered.emit(query, token, result, error)
+        if error is not None:
+            raise error
+        return result
+
+    @staticmethod
+    def deliver(query: SqlAsyncQuery, token: int, result: Any, error: Optional[Exception]):
+        query.finish(token, result, error)
+        return None
+
+    def shutdown(self, wait: bool = True):
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+        if SqlAsyncExecutor._shared is self:
+            SqlAsyncExecutor._shared = None
+        return None
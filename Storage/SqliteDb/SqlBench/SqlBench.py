@@ -0,0 +1,173 @@
+import os
+import statistics
+import tempfile
+import threading
+import time
+from typing import List, Dict, Any
+
+from DeclarativeQt.Resource.FileTypes.RFileType import FilePath
+from DeclarativeQt.Resource.Grammars.RGrammar import DictData, Key, GList, Validate
+from DeclarativeQt.Resource.Strings.RStr import NLIndex, RStr
+from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlComposer import SqlComposer
+from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlConnector import SqlConnector
+from DeclarativeQt.Storage.SqliteDb.SqlDbKernel.SqlDatabase import SqlDatabase, FieldNLMap, FieldDefine, \
+    DataField, DBNaming, SqlRows, PragmaProfile
+
+BenchReport = Dict[str, Any]
+
+
+class BenchDatabase(SqlDatabase):
+    fdName: DataField = "name"
+    fdValue: DataField = "value"
+    fdNote: DataField = "note"
+
+    def __init__(self, dbFilePath: FilePath, dbPragmas: PragmaProfile = None):
+        self._dbFilePath = dbFilePath
+        self.dbPragmas = Validate(dbPragmas, self.dbPragmas)
+        self._sql = SqlComposer(dbFilePath)
+
+    @staticmethod
+    def dbFieldNLMap(index: NLIndex = RStr.EN) -> FieldNLMap:
+        return dict()
+
+    @property
+    def sql(self) -> SqlComposer:
+        return self._sql
+
+    @property
+    def dbFieldDefinitions(self) -> FieldDefine:
+        return GList(
+            GList(self.fdName, self._sql.dtSTRING, self._sql.primaryKeyMark),
+            GList(self.fdValue, self._sql.dtFLOAT),
+            GList(self.fdNote, self._sql.dtSTRING),
+            GList(self.fdSort, self._sql.dtINT),
+        )
+
+    @property
+    def dbFields(self) -> List[DataField]:
+        return GList(self.fdName, self.fdValue, self.fdNote)
+
+    @property
+    def dbTableName(self) -> DBNaming:
+        return "bench"
+
+    @property
+    def dbFilePath(self) -> FilePath:
+        return self._dbFilePath
+
+    @property
+    def dbStringFields(self) -> List[DataField]:
+        return GList(self.fdName, self.fdNote)
+
+    @property
+    def dbPrimaryKeyField(self) -> DataField:
+        return self.fdName
+
+    @property
+    def isPrimaryKeyAuto(self) -> bool:
+        return False
+
+
+class SqlBench:
+    DefaultRowCount: int = int(2000)
+    RollbackJournal: PragmaProfile = dict(journal_mode="delete", synchronous="full")
+
+    @staticmethod
+    def benchDatabase(dbFilePath: FilePath, dbPragmas: PragmaProfile = None) -> BenchDatabase:
+        return BenchDatabase(dbFilePath, dbPragmas).rebuildSqlTable()
+
+    @staticmethod
+    def releaseDatabase(database: SqlDatabase):
+        database.sql.close()
+        SqlConnector.closeAll(database.dbFilePath)
+        return None
+
+    @staticmethod
+    def benchRows(count: int, prefix: str = "row") -> SqlRows:
+        return [DictData(
+            Key(BenchDatabase.fdName).Val(f"{prefix}{i}"),
+            Key(BenchDatabase.fdValue).Val(i * 0.5),
+            Key(BenchDatabase.fdNote).Val(f"note {i}"),
+        ).data for i in range(count)]
+
+    @staticmethod
+    def bulkWrite(count: int = None, workDir: str = None) -> BenchReport:
+        if workDir is None:
+            with tempfile.TemporaryDirectory() as workDir:
+                return SqlBench.bulkWrite(count, workDir)
+        count = count if count else SqlBench.DefaultRowCount
+        rows = SqlBench.benchRows(count)
+        database = SqlBench.benchDatabase(os.path.join(workDir, "rows.db"))
+        start = time.perf_counter()
+        for row in rows:
+            database.insertSqlRowData(**row)
+        rowSeconds = time.perf_counter() - start
+        SqlBench.releaseDatabase(database)
+        database = SqlBench.benchDatabase(os.path.join(workDir, "batch.db"))
+        batchSeconds = database.insertSqlRows(rows)["seconds"]
+        updates = [DictData(Key(BenchDatabase.fdName).Val(x[BenchDatabase.fdName]), Key(BenchDatabase.fdValue).Val(
+            x[BenchDatabase.fdValue] + 1.0)).data for x in rows]
+        start = time.perf_counter()
+        for row in updates:
+            database.updateSqlRowData(key=row[BenchDatabase.fdName], value=row[BenchDatabase.fdValue])
+        rowUpdateSeconds = time.perf_counter() - start
+        batchUpdateSeconds = database.updateSqlRows(updates)["seconds"]
+        SqlBench.releaseDatabase(database)
+        return DictData(
+            Key("rows").Val(count),
+            Key("insertRowsPerSec").Val(round(count / rowSeconds, 1)),
+            Key("insertBatchRowsPerSec").Val(round(count / batchSeconds, 1)),
+            Key("updateRowsPerSec").Val(round(count / rowUpdateSeconds, 1)),
+            Key("updateBatchRowsPerSec").Val(round(count / batchUpdateSeconds, 1)),
+            Key("insertSpeedup").Val(round(rowSeconds / batchSeconds, 1)),
+            Key("updateSpeedup").Val(round(rowUpdateSeconds / batchUpdateSeconds, 1)),
+        ).data
+
+    @staticmethod
+    def readDuringWrite(
+            dbPragmas: PragmaProfile, count: int = None, batch: int = int(500), workDir: str = None
+    ) -> BenchReport:
+        if workDir is None:
+            with tempfile.TemporaryDirectory() as workDir:
+                return SqlBench.readDuringWrite(dbPragmas, count, batch, workDir)
+        count = count if count else SqlBench.DefaultRowCount
+        database = SqlBench.benchDatabase(os.path.join(workDir, "bench.db"), dbPragmas)
+        database.insertSqlRows(SqlBench.benchRows(count))
+        writing = threading.Event()
+        writing.set()
+
+        def writeRows():
+            with database.openSqlComposer() as sql:
+                for i in range(count // batch):
+                    database.insertSqlRows(SqlBench.benchRows(batch, f"w{i}_"), order=0, sql=sql)
+            writing.clear()
+
+        writer = threading.Thread(target=writeRows)
+        latencies = list()
+        writer.start()
+        with database.openSqlComposer() as sql:
+            while writing.is_set():
+                start = time.perf_counter()
+                sql.select(database.dbFields, database.dbTableName).cmdAppend(
+                    sql.orderByFrame(database.fdSort), end=False).cmdAppend(sql.limitFrame(100)).fetchall(showLog=False)
+                latencies.append(time.perf_counter() - start)
+        writer.join()
+        SqlBench.releaseDatabase(database)
+        latencies = sorted(latencies) if latencies else GList(0.0)
+        return DictData(
+            Key("reads").Val(len(latencies)),
+            Key("p50Ms").Val(round(statistics.median(latencies) * 1e3, 3)),
+            Key("p99Ms").Val(round(latencies[int(len(latencies) * 0.99)] * 1e3, 3)),
+            Key("maxMs").Val(round(latencies[-1] * 1e3, 3)),
+        ).data
+
+    @staticmethod
+    def pragmaProfiles(count: int = None) -> BenchReport:
+        profiles = DictData(Key("rollback").Val(SqlBench.RollbackJournal)).data
+        profiles.update({k: k for k in SqlDatabase.PragmaProfiles.keys()})
+        return {k: SqlBench.readDuringWrite(v, count) for k, v in profiles.items()}
+
+
+if not __name__ != "__main__":
+    RStr.log(SqlBench.bulkWrite(), RStr.lgInfo)
+    RStr.log(SqlBench.pragmaProfiles(), RStr.lgInfo)
@@ -0,0 +1,257 @@
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from typing import List, Dict, Any, Callable, Self, Tuple
+
+from DeclarativeQt.Resource.FileTypes.RFileType import FilePath
+from DeclarativeQt.Resource.Grammars.RGrammar import DictData, Key, GList, Validate
+from DeclarativeQt.Resource.PhyMetrics.RPhyMetric import MeasureUnit
+from DeclarativeQt.Resource.PhyMetrics.PhyMtrBase.PhyMtrBase import TemperatureMeasure
+from DeclarativeQt.Resource.Strings.RStr import NLIndex, RStr
+from DeclarativeQt.Storage.SqliteDb.SqlBench.SqlBench import BenchDatabase, SqlBench, BenchReport
+from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlComposer import SqlComposer
+from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlConnector import SqlConnector
+from DeclarativeQt.Storage.SqliteDb.SqlDbKernel.SqlDatabase import FieldNLMap, FieldDefine, DataField, DBNaming
+from DeclarativeQt.Storage.SqliteDb.SqlDbKernel.SqlDbMethod import SqlDbMethod
+from DeclarativeQt.Storage.SqliteDb.SqlDbVariant.AstDbKernel.AstDatabase import AstDatabase
+from DeclarativeQt.Storage.SqliteDb.SqlDbVariant.PhyDbKernel.PhyDatabase import PhyDatabase
+from DeclarativeQt.Storage.SqliteDb.SqlDbVariant.PhyDbKernel.PhyDbMethod import PhyDbMethod
+
+Regressions = List[Dict[str, Any]]
+
+
+class BenchPhyDatabase(BenchDatabase, PhyDatabase):
+    @property
+    def fieldPhysicalSymbols(self) -> Dict[DataField, str]:
+        return DictData(Key(self.fdValue).Val(TemperatureMeasure.Celsius.symbol)).data
+
+    @property
+    def physicalFields(self) -> List[DataField]:
+        return GList(self.fdValue)
+
+    @property
+    def fieldPhysicalQuantity(self) -> Dict[DataField, DataField]:
+        return DictData(Key(self.fdValue).Val(TemperatureMeasure.PhyMark)).data
+
+    @property
+    def fieldMeasureUnits(self) -> Dict[DataField, MeasureUnit]:
+        return DictData(Key(self.fdValue).Val(TemperatureMeasure.Celsius)).data
+
+
+class BenchAstDatabase(AstDatabase):
+    fdTheme: DataField = "theme"
+    fdScale: DataField = "scale"
+    fdLanguage: DataField = "language"
+
+    def __init__(self, dbFilePath: FilePath):
+        self._dbFilePath = dbFilePath
+        self._sql = SqlComposer(dbFilePath)
+        self.rebuildSqlTable().initAstParams()
+
+    @property
+    def dbParamFields(self) -> List[DataField]:
+        return GList(self.fdTheme, self.fdScale, self.fdLanguage)
+
+    @property
+    def defaultAstParams(self) -> Dict[DataField, Any]:
+        return DictData(
+            Key(self.fdTheme).Val("light"), Key(self.fdScale).Val(1.0), Key(self.fdLanguage).Val(RStr.EN)
+        ).data
+
+    def initAstParams(self) -> Self:
+        self.insertSqlRowData(**self.defaultAstParams)
+        return self
+
+    def fetchAstParams(self) -> Any:
+        data = self.fecthAstTableData()
+        return None if not data else dict(zip(self.dbParamFields, data[0]))
+
+    def actRequestAstParams(self, *args: Any, **kwargs: Any) -> bool:
+        return False
+
+    def updateAstParams(self, *args: Any, **kwargs: Any) -> Self:
+        return self.updateAstTableData(**kwargs)
+
+    @property
+    def dbStringFields(self) -> List[DataField]:
+        return GList(self.fdTheme, self.fdLanguage)
+
+    @property
+    def sql(self) -> SqlComposer:
+        return self._sql
+
+    @property
+    def dbFieldDefinitions(self) -> FieldDefine:
+        return GList(
+            GList(self.fdAutoId, self._sql.dtINT, self._sql.primaryKeyAutoIncrementMark),
+            GList(self.fdTheme, self._sql.dtSTRING),
+            GList(self.fdScale, self._sql.dtFLOAT),
+            GList(self.fdLanguage, self._sql.dtSTRING),
+            GList(self.fdSort, self._sql.dtINT),
+        )
+
+    @staticmethod
+    def dbFieldNLMap(index: NLIndex = RStr.EN) -> FieldNLMap:
+        return dict()
+
+    @property
+    def dbFields(self) -> List[DataField]:
+        return self.dbParamFields
+
+    @property
+    def dbTableName(self) -> DBNaming:
+        return "settings"
+
+    @property
+    def dbFilePath(self) -> FilePath:
+        return self._dbFilePath
+
+
+class SqlBenchSuite:
+    DefaultSizes: Tuple[int, ...] = (1000, 10000, 100000)
+    FullSizes: Tuple[int, ...] = (1000, 10000, 100000, 1000000)
+    DefaultThreshold: float = 0.25
+    WriteBudget: int = int(200000)
+    FetchBudget: int = int(2000000)
+    MemoryFrame: str = "file:sqlbench_{}?mode=memory&cache=shared"
+
+    @staticmethod
+    def benchPath(name: str, memory: bool, workDir: str) -> FilePath:
+        if memory:
+            return SqlBenchSuite.MemoryFrame.format(name)
+        return os.path.join(workDir, f"{name}.db")
+
+    @staticmethod
+    def latencyReport(latencies: List[float]) -> BenchReport:
+        latencies = sorted(latencies)
+        total = sum(latencies)
+        return DictData(
+            Key("samples").Val(len(latencies)),
+            Key("opsPerSec").Val(round(len(latencies) / total, 2) if total > 0 else None),
+            Key("p50Ms").Val(round(statistics.median(latencies) * 1e3, 4)),
+            Key("p99Ms").Val(round(latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)] * 1e3, 4)),
+        ).data
+
+    @staticmethod
+    def measure(method: Callable[[int], Any], repeat: int) -> BenchReport:
+        latencies = list()
+        for i in range(repeat):
+            start = time.perf_counter()
+            method(i)
+            latencies.append(time.perf_counter() - start)
+        return SqlBenchSuite.latencyReport(latencies)
+
+    @staticmethod
+    def benchSize(size: int, memory: bool = False, workDir: str = None) -> Dict[str, BenchReport]:
+        if workDir is None:
+            with tempfile.TemporaryDirectory() as workDir:
+                return SqlBenchSuite.benchSize(size, memory, workDir)
+        writes = max(int(5), min(int(200), SqlBenchSuite.WriteBudget // size))
+        fetches = max(int(3), min(int(50), SqlBenchSuite.FetchBudget // size))
+        database = BenchPhyDatabase(SqlBenchSuite.benchPath(f"table{size}", memory, workDir))
+        database.dbQueryCache = False
+        database.rebuildSqlTable()
+        rows = SqlBench.benchRows(size)
+        bulk = database.insertSqlRows(rows)
+        fdName, fdValue = BenchDatabase.fdName, BenchDatabase.fdValue
+        locate = lambda a0: DictData(Key(fdName).Val(f"row{(a0 * 7919) % size}")).data
+        translator = DictData(Key(BenchDatabase.fdNote).Val({f"note {i}": f"N{i}" for i in range(0, size, 2)})).data
+        appUnits = DictData(Key(TemperatureMeasure.PhyMark).Val(TemperatureMeasure.Fahrenheit)).data
+        readyData = SqlDbMethod.fetchSqlTable(database)
+        astDatabase = BenchAstDatabase(SqlBenchSuite.benchPath(f"settings{size}", memory, workDir))
+        report = DictData(
+            Key("bulkInsert").Val(DictData(
+                Key("samples").Val(size), Key("opsPerSec").Val(round(bulk["rowsPerSec"], 2)),
+            ).data),
+            Key("insert").Val(SqlBenchSuite.measure(lambda a0: database.insertSqlRowData(
+                order=size // 2, **{fdName: f"new{a0}", fdValue: float(a0)}), writes)),
+            Key("update").Val(SqlBenchSuite.measure(lambda a0: database.updateSqlRowData(
+                key=f"row{(a0 * 7919) % size}", **{fdValue: -float(a0)}), writes)),
+            Key("reorder").Val(SqlBenchSuite.measure(lambda a0: SqlDbMethod.rearrangeDataOrder(
+                database, locate(a0), size // 3), writes)),
+            Key("delete").Val(SqlBenchSuite.measure(lambda a0: SqlDbMethod.deleteDataRow(
+                database, locate(a0 + writes)), writes)),
+            Key("fetch").Val(SqlBenchSuite.measure(lambda a0: SqlDbMethod.fetchSqlTable(database), fetches)),
+            Key("fetchTranslated").Val(SqlBenchSuite.measure(lambda a0: SqlDbMethod.fetchSqlTable(
+                database, translator=translator), fetches)),
+            Key("phyConversion").Val(SqlBenchSuite.measure(lambda a0: PhyDbMethod.fetchDbTableDataToAppMeasureUnit(
+                database, readyData=readyData, appUnits=appUnits), fetches)),
+            Key("astRead").Val(SqlBenchSuite.measure(lambda a0: astDatabase.fetchAstParams(), writes)),
+        ).data
+        astDatabase.sql.close()
+        database.sql.close()
+        SqlConnector.closeAll()
+        return report
+
+    @staticmethod
+    def run(sizes: List[int] = None, memory: bool = False) -> BenchReport:
+        sizes = Validate(sizes, list(SqlBenchSuite.DefaultSizes))
+        with tempfile.TemporaryDirectory() as workDir:
+            results = {str(x): SqlBenchSuite.benchSize(x, memory, workDir) for x in sizes}
+        return DictData(
+            Key("meta").Val(DictData(
+                Key("storage").Val("memory" if memory else "file"),
+                Key("python").Val(platform.python_version()),
+                Key("sqlite").Val(sqlite3.sqlite_version),
+                Key("machine").Val(platform.machine()),
+                Key("at").Val(time.strftime("%Y-%m-%dT%H:%M:%S")),
+            ).data),
+            Key("results").Val(results),
+        ).data
+
+    @staticmethod
+    def saveBaseline(report: BenchReport, path: FilePath):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        return None
+
+    @staticmethod
+    def loadBaseline(path: FilePath) -> BenchReport:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+
+    @staticmethod
+    def compare(report: BenchReport, baseline: BenchReport, threshold: float = None) -> Regressions:
+        threshold = Validate(threshold, SqlBenchSuite.DefaultThreshold)
+        regressions = list()
+        for size, ops in report["results"].items():
+            for op, current in ops.items():
+                base = baseline.get("results", dict()).get(size, dict()).get(op)
+                if not base:
+                    continue
+                if base.get("opsPerSec") and current.get("opsPerSec") is not None:
+                    change = current["opsPerSec"] / base["opsPerSec"] - 1.0
+                    if change < -threshold:
+                        regressions.append(dict(size=size, op=op, metric="opsPerSec", change=round(change, 3)))
+                if base.get("p50Ms") and current.get("p50Ms") is not None:
+                    change = current["p50Ms"] / base["p50Ms"] - 1.0
+                    if change > threshold:
+                        regressions.append(dict(size=size, op=op, metric="p50Ms", change=round(change, 3)))
+        return regressions
+
+
+if not __name__ != "__main__":
+    parser = argparse.ArgumentParser(description="SqliteDb storage benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="*", default=list(SqlBenchSuite.DefaultSizes))
+    parser.add_argument("--full", action="store_true", help="sweep 1k to 1M rows")
+    parser.add_argument("--memory", action="store_true", help="run on shared in-memory databases")
+    parser.add_argument("--baseline", type=str, default=None, help="JSON baseline to compare against")
+    parser.add_argument("--threshold", type=float, default=SqlBenchSuite.DefaultThreshold)
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    arguments = parser.parse_args()
+    sizes = list(SqlBenchSuite.FullSizes) if arguments.full else arguments.sizes
+    benchReport = SqlBenchSuite.run(sizes, arguments.memory)
+    RStr.log(json.dumps(benchReport["results"], indent=2), RStr.lgInfo)
+    if arguments.baseline and arguments.save:
+        SqlBenchSuite.saveBaseline(benchReport, arguments.baseline)
+    elif arguments.baseline and os.path.exists(arguments.baseline):
+        found = SqlBenchSuite.compare(benchReport, SqlBenchSuite.loadBaseline(arguments.baseline), arguments.threshold)
+        for item in found:
+            RStr.log(item, RStr.lgError)
+        sys.exit(int(1) if found else int(0))
@@ -1,14 +1,33 @@
 import sqlite3
 from sqlite3 import Cursor
-from typing import List, Union, Optional
+from typing import List, Union, Optional, Any, Dict, Self
 
 from DeclarativeQt.Resource.FileTypes.RFileType import FilePath
+from DeclarativeQt.Resource.Grammars.RDecorator import private
 from DeclarativeQt.Resource.Grammars.RGrammar import CommandFrame, ReferList, isEmpty, Grammar, ConditionList, \
-    DtReferList, GIters, Equal, StrCommand
+    DtReferList, GIters, Equal, StrCommand, Validate
 from DeclarativeQt.Resource.Strings.RStr import Symbol, RStr
+from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlConnector import SqlConnector
+from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlProfiler import SqlProfiler
+from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlQueryCache import SqlQueryCache
 
 DataType = str
 FieldMark = Union[str, CommandFrame]
+BindParams = List[Any]
+
+
+class SqlTransaction:
+    def __init__(self, sql: "SqlComposer", savepoint: str = None):
+        self._sql = sql
+        self._savepoint = savepoint
+
+    def __enter__(self):
+        self._sql.beginTransaction(self._savepoint)
+        return self._sql
+
+    def __exit__(self, excType, excVal, excTb):
+        self._sql.endTransaction(excType is None)
+        return False
 
 
 class SqlComposer:
@@ -20,20 +39,32 @@ class SqlComposer:
     pAnd: Symbol = "and"
     pOr: Symbol = "or"
     pNull: Symbol = "null"
+    pBind: Symbol = "?"
+    pQuote: Symbol = "'"
+    pRowId: Symbol = "rowid"
+    pName: Symbol = "name"
+    pSequence: Symbol = "seq"
+    tbSequence: str = "sqlite_sequence"
     dtINT: DataType = "integer"
     dtSTRING: DataType = "text"
     dtFLOAT: DataType = "real"
     opLastInsertRowid: StrCommand = "select last_insert_rowid();"
+    opBegin: StrCommand = "begin;"
+    opExplainQueryPlan: StrCommand = "explain query plan"
+    spNested: str = "nested_"
+    StatementCacheSize: int = int(256)
 
-    def __init__(self, dbFilePath: FilePath = None):
+    def __init__(self, dbFilePath: FilePath = None, statementCacheSize: int = None):
         self._cmd = ""
+        self._params: BindParams = list()
         self._connection = None
         self._connected = False
         self._dbFilePath = None
+        self._cacheSize = statementCacheSize if statementCacheSize else self.StatementCacheSize
+        self._txStack: List[List] = list()
+        self._written: bool = False
         if dbFilePath:
-            self._connection = sqlite3.connect(dbFilePath)
-            self._connected = True
-            self._dbFilePath = dbFilePath
+            self.connect(dbFilePath)
         self.equalFrame: CommandFrame = lambda x, y: f"{x} = {y}"
         self.isFrame: CommandFrame = lambda x, y: f"{x} is {y}"
         self.unequalFrame: CommandFrame = lambda x, y: f"{x} != {y}"
@@ -50,7 +81,9 @@ class SqlComposer:
         self.orFrame: CommandFrame = lambda x, y: f"{self.bracketFrame(x)} or {self.bracketFrame(y)}"
         self.notFrame: CommandFrame = lambda x: f"not {self.bracketFrame(x)}"
         self.betweenAndFrame: CommandFrame = lambda x, a, b: f"{x} between {a} and {b}"
+        self.inFrame: CommandFrame = lambda x, items: f"{x} in {self._bktItemsFrame(items)}"
         self.limitFrame: CommandFrame = lambda x: f"limit {x}"
+        self.limitOffsetFrame: CommandFrame = lambda x, y: f"limit {x} offset {y}"
         self.likeFrame: CommandFrame = lambda x, y: f"{x} like \'%{y}%\'"
         self.leftLikeFrame: CommandFrame = lambda x, y: f"{x} like \'{y}%\'"
         self.rightLikeFrame: CommandFrame = lambda x, y: f"{x} like \'%{y}\'"
@@ -76,7 +109,33 @@ class SqlComposer:
         self._whereNotFrame: CommandFrame = lambda cmd: f"where not {self.bracketFrame(cmd)}"
         self._deleteFrame: CommandFrame = lambda table: f"delete from {table}"
         self._dropFrame: CommandFrame = lambda table: f"drop table if exists {table}"
+        self._dropIndexFrame: CommandFrame = lambda name: f"drop index if exists {name}"
+        self._indexListFrame: CommandFrame = lambda table: f"pragma index_list({table});"
+        self._indexInfoFrame: CommandFrame = lambda name: f"pragma index_info({name});"
+        self._createIndexFrame: CommandFrame = lambda unique, name, table, fields: \
+            f"create {unique}index if not exists {name} on {table} {fields}"
         self._insertFrame: CommandFrame = lambda table, keys, values: f"insert into {table} {keys} values {values}"
+        self._createTriggerFrame: CommandFrame = lambda name, event, table, body: \
+            f"create trigger if not exists {name} after {event} on {table} begin {body} end"
+        self._savepointFrame: CommandFrame = lambda name: f"savepoint {name};"
+        self._releaseFrame: CommandFrame = lambda name: f"release savepoint {name};"
+        self._rollbackToFrame: CommandFrame = lambda name: f"rollback to savepoint {name};"
+
+    def bind(self, value: Any) -> str:
+        self._params.append(value)
+        return self.pBind
+
+    def bindValues(self, values: dict) -> Dict[str, str]:
+        return {k: self.bind(v) for k, v in values.items()}
+
+    def unquote(self, value: Any) -> Any:
+        if not isinstance(value, str) or len(value) < 2 or value[0] != self.pQuote or value[-1] != self.pQuote:
+            return value
+        return value[1:-1].replace(self.pQuote * 2, self.pQuote)
+
+    def bindConditions(self, values: dict, opt: str = None) -> str:
+        conditions = [self.equalFrame(k, self.bind(v)) for k, v in values.items()]
+        return self.linkConditions(*conditions, opt=Validate(opt, self.pAnd))
 
     def linkConditions(self, *conditions, opt: str):
         opt = self.pCommandGap + opt + self.pCommandGap
@@ -119,6 +178,12 @@ class SqlComposer:
         self._cmd += self._dropFrame(table) + self.pEnding
         return self
 
+    def dropIndex(self, name: str):
+        if isEmpty(name):
+            return self
+        self._cmd += self._dropIndexFrame(name) + self.pEnding
+        return self
+
     def createTable(self, table: str, fields: List[List[str]]):
         if isEmpty(table):
             return self
@@ -127,6 +192,25 @@ class SqlComposer:
         self._cmd += self._createFrame(table, self._bktItemsFrame(lt_fields)) + self.pEnding
         return self
 
+    def createIndex(self, table: str, name: str, fields: List[str], unique: bool = False, where: str = None):
+        if isEmpty(table) or isEmpty(name) or isEmpty(fields):
+            return self
+        unique = "unique " if unique else self.pNone
+        self._cmd += self._createIndexFrame(unique, name, table, self._bktItemsFrame(fields))
+        if where:
+            self._cmd += self.pCommandGap + self._whereFrame(where)
+        self._cmd += self.pEnding
+        return self
+
+    def createTrigger(self, name: str, event: str, table: str, target: str, values: dict):
+        if isEmpty(name) or isEmpty(table) or isEmpty(target) or isEmpty(values):
+            return self
+        lt_keys = self._bktItemsFrame(list(values.keys()))
+        lt_values = self._bktItemsFrame(list(values.values()))
+        body = self._insertFrame(target, keys=lt_keys, values=lt_values) + self.pEnding
+        self._cmd += self._createTriggerFrame(name, event, table, body) + self.pEnding
+        return self
+
     def deleteData(self, table: str):
         if isEmpty(table):
             return self
@@ -150,14 +234,43 @@ class SqlComposer:
     def command(self):
         return self._cmd
 
+    @property
+    def params(self) -> BindParams:
+        return list(self._params)
+
     @property
     def dbFilePath(self):
         return self._dbFilePath
 
     def clear(self):
         self._cmd = self.pNone
+        self._params = list()
         return self
 
+    def runCommand(self, cursor: Cursor, rows: List[BindParams] = None) -> Cursor:
+        changes = self._connection.total_changes
+        if rows is not None:
+            cursor.executemany(self._cmd, rows)
+        else:
+            cursor.execute(self._cmd, self._params)
+        if self._connection.total_changes != changes:
+            self._written = True
+        return cursor
+
+    def indexList(self, table: str, showLog: bool = True) -> Optional[list]:
+        return self.cmdAppend(self._indexListFrame(table)).fetchall(showLog)
+
+    def indexColumns(self, name: str, showLog: bool = True) -> Optional[List[str]]:
+        info = self.cmdAppend(self._indexInfoFrame(name)).fetchall(showLog)
+        return None if info is None else ReferList(sorted(info), lambda x: x[-1])
+
+    def explainQueryPlan(self, showLog: bool = True) -> Optional[List[str]]:
+        if isEmpty(self._cmd):
+            return None
+        self._cmd = self.pCommandGap.join([self.opExplainQueryPlan, self._cmd])
+        plan = self.cmdEnd().fetchall(showLog)
+        return None if plan is None else ReferList(plan, lambda x: x[-1])
+
     def isCommandEnded(self):
         return len(self._cmd) > 0 and self._cmd[-1] in GIters(self.pEnding)
 
@@ -165,66 +278,194 @@ class SqlComposer:
         if not self._connected or not self.isCommandEnded():
             return False
         try:
-            self._connection.commit()
-            if showLog:
-                RStr.log(self._cmd)
+            self.syncCommit()
+            self.logCommand(showLog)
+            start = SqlProfiler.start()
             cursor = self._connection.cursor()
-            cursor.execute(self._cmd)
-            self._connection.commit()
+            self.runCommand(cursor)
+            self.syncCommit()
+            SqlProfiler.finish(start, self._connection, self._cmd, self._params, cursor.rowcount)
         except sqlite3.Error as e:
-            RStr.log(str(e), RStr.lgError)
-            RStr.log(str(self._cmd), RStr.lgError)
-            self._cmd = self.pNone
+            self.failCommand(e)
             return False
-        self._cmd = self.pNone
+        self.clear()
         return True
 
     def fetchall(self, showLog: bool = True) -> Union[list, None]:
         if not self._connected or not self.isCommandEnded():
             return None
         try:
-            self._connection.commit()
-            if showLog:
-                RStr.log(self._cmd)
+            self.syncCommit()
+            self.logCommand(showLog)
+            start = SqlProfiler.start()
             cursor = self._connection.cursor()
-            cursor.execute(self._cmd)
+            self.runCommand(cursor)
             data = cursor.fetchall()
+            SqlProfiler.finish(start, self._connection, self._cmd, self._params, len(data))
         except sqlite3.Error as e:
-            RStr.log(str(e), RStr.lgError)
-            RStr.log(str(self._cmd), RStr.lgError)
-            self._cmd = self.pNone
+            self.failCommand(e)
             return None
-        self._cmd = self.pNone
+        self.clear()
+        return data
+
+    def fetchCached(self, showLog: bool = True) -> Union[list, None]:
+        if not self._connected or self.inTransaction() or not SqlQueryCache.isCacheable(self._connection.dbKey):
+            return self.fetchall(showLog)
+        dbKey, query, params = self._connection.dbKey, self._cmd, list(self._params)
+        version = SqlQueryCache.observe(self._connection)
+        data = SqlQueryCache.lookup(dbKey, query, params, version)
+        if data is not None:
+            self.clear()
+            return data
+        data = self.fetchall(showLog)
+        if data is not None:
+            SqlQueryCache.store(dbKey, query, params, version, data)
         return data
 
+    def markWritten(self) -> Self:
+        if not self._connected:
+            return self
+        self._written = True
+        if not self.inTransaction():
+            self.flushWritten()
+        return self
+
     def execute(self, showLog: bool = True) -> Optional[Cursor]:
         if not self._connected or not self.isCommandEnded():
             return None
         try:
-            self._connection.commit()
-            if showLog:
-                RStr.log(self._cmd)
+            self.syncCommit()
+            self.logCommand(showLog)
+            start = SqlProfiler.start()
             cursor = self._connection.cursor()
-            cursor.execute(self._cmd)
-            self._connection.commit()
+            self.runCommand(cursor)
+            self.syncCommit()
+            SqlProfiler.finish(start, self._connection, self._cmd, self._params, cursor.rowcount)
         except sqlite3.Error as e:
-            RStr.log(str(e), RStr.lgError)
-            RStr.log(str(self._cmd), RStr.lgError)
-            self._cmd = self.pNone
+            self.failCommand(e)
             return None
-        self._cmd = self.pNone
+        self.clear()
         return cursor
 
+    def executemany(self, rows: List[BindParams], showLog: bool = True) -> Optional[int]:
+        if not self._connected or not self.isCommandEnded():
+            return None
+        try:
+            self.syncCommit()
+            self.logCommand(showLog, f"x{len(rows)}")
+            start = SqlProfiler.start()
+            cursor = self._connection.cursor()
+            self.runCommand(cursor, rows)
+            self.syncCommit()
+            SqlProfiler.finish(start, self._connection, self._cmd, rows[0] if rows else list(), cursor.rowcount)
+        except sqlite3.Error as e:
+            if not self.inTransaction():
+                self._connection.rollback()
+            self.failCommand(e)
+            return None
+        self.clear()
+        return len(rows)
+
+    def transaction(self) -> SqlTransaction:
+        return SqlTransaction(self)
+
+    def savepoint(self, name: str) -> SqlTransaction:
+        return SqlTransaction(self, name)
+
+    def inTransaction(self) -> bool:
+        return len(self._txStack) > 0
+
+    def beginTransaction(self, savepoint: str = None) -> bool:
+        if not self._connected:
+            return False
+        if not self.inTransaction() and savepoint is None:
+            self._connection.commit()
+            self._connection.execute(self.opBegin)
+        else:
+            savepoint = Validate(savepoint, f"{self.spNested}{len(self._txStack)}")
+            self._connection.execute(self._savepointFrame(savepoint))
+        self._txStack.append([savepoint, False])
+        return True
+
+    def endTransaction(self, success: bool = True) -> bool:
+        if not self.inTransaction():
+            return False
+        savepoint, failed = self._txStack.pop()
+        success = success and not failed
+        if savepoint is None:
+            self._connection.commit() if success else self._connection.rollback()
+        else:
+            if not success:
+                self._connection.execute(self._rollbackToFrame(savepoint))
+            self._connection.execute(self._releaseFrame(savepoint))
+            if not self.inTransaction():
+                self._connection.commit()
+        if not self.inTransaction():
+            self.flushWritten()
+        return success
+
+    @private
+    def logCommand(self, showLog: bool, suffix: str = None):
+        if not showLog or not SqlProfiler.LogStatements:
+            return None
+        RStr.log(self._cmd if suffix is None else f"{self._cmd} {suffix}")
+        return None
+
+    @private
+    def flushWritten(self):
+        if self._written:
+            self._written = False
+            SqlQueryCache.bump(self._connection.dbKey)
+        return None
+
+    @private
+    def syncCommit(self):
+        if not self.inTransaction():
+            self._connection.commit()
+            self.flushWritten()
+        return None
+
+    @private
+    def failCommand(self, error: sqlite3.Error):
+        if self.inTransaction():
+            self._txStack[-1][-1] = True
+        RStr.log(str(error), RStr.lgError)
+        RStr.log(str(self._cmd), RStr.lgError)
+        self.clear()
+        return None
+
+    def refreshPragmas(self) -> Self:
+        if self._connected and not self.inTransaction():
+            SqlConnector.applyPragmas(self._connection)
+        return self
+
     def isConnected(self):
         return self._connected
 
     def connect(self, dbFilePath: str):
-        self._connection = sqlite3.connect(dbFilePath)
+        if self._connected:
+            self.close()
+        self._connection = SqlConnector.acquire(dbFilePath, self._cacheSize)
         self._connected = True
+        self._dbFilePath = dbFilePath
         return self
 
     def close(self):
-        self._connection.close()
+        self._txStack.clear()
+        if self._connected:
+            self.flushWritten()
+        SqlConnector.release(self._connection)
         self._connection = None
         self._connected = False
         return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excVal, excTb):
+        self.close()
+        return False
+
+    def __del__(self):
+        if getattr(self, "_connected", False):
+            self.close()
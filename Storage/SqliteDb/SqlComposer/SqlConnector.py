@@ -0,0 +1,191 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Tuple, Any, Optional
+
+from DeclarativeQt.Resource.FileTypes.RFileType import FilePath
+from DeclarativeQt.Resource.Grammars.RGrammar import Validate, GTuple
+from DeclarativeQt.Resource.Strings.RStr import RStr
+
+SqlPragmas = Dict[str, Any]
+PoolKey = Tuple[str, int]
+
+
+class PooledConnection(sqlite3.Connection):
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.dbKey: str = str()
+        self.pragmaVersion: int = int(-1)
+        self.dataVersion: int = int(-1)
+        self.lastUsed: float = time.monotonic()
+
+
+class SqlConnector:
+    MemoryDb: FilePath = ":memory:"
+    UriPrefix: str = "file:"
+    PoolSize: int = int(4)
+    IdleTimeout: float = float(60.0)
+    DefaultPragmas: SqlPragmas = dict()
+    _pools: Dict[PoolKey, List[PooledConnection]] = dict()
+    _pragmas: Dict[str, Tuple[int, SqlPragmas]] = dict()
+    _lock = threading.RLock()
+    _opened: int = int(0)
+    _reused: int = int(0)
+    _closed: int = int(0)
+    _sweptAt: float = float(0.0)
+
+    @staticmethod
+    def dbKey(dbFilePath: FilePath) -> str:
+        dbFilePath = str(dbFilePath)
+        if dbFilePath == SqlConnector.MemoryDb or dbFilePath.startswith(SqlConnector.UriPrefix):
+            return dbFilePath
+        return os.path.abspath(dbFilePath)
+
+    @staticmethod
+    def poolKey(dbFilePath: FilePath) -> PoolKey:
+        return GTuple(SqlConnector.dbKey(dbFilePath), threading.get_ident())
+
+    @staticmethod
+    def configure(poolSize: int = None, idleTimeout: float = None):
+        SqlConnector.PoolSize = Validate(poolSize, SqlConnector.PoolSize)
+        SqlConnector.IdleTimeout = Validate(idleTimeout, SqlConnector.IdleTimeout)
+        return None
+
+    @staticmethod
+    def setPragmas(dbFilePath: FilePath, pragmas: SqlPragmas):
+        key = SqlConnector.dbKey(dbFilePath)
+        with SqlConnector._lock:
+            version, current = SqlConnector._pragmas.get(key, GTuple(int(0), None))
+            if current == pragmas:
+                return None
+            SqlConnector._pragmas[key] = GTuple(version + int(1), dict(pragmas))
+        return None
+
+    @staticmethod
+    def pragmasOf(dbFilePath: FilePath) -> Tuple[int, SqlPragmas]:
+        key = SqlConnector.dbKey(dbFilePath)
+        return SqlConnector._pragmas.get(key, GTuple(int(0), SqlConnector.DefaultPragmas))
+
+    @staticmethod
+    def applyPragmas(connection: PooledConnection):
+        version, pragmas = SqlConnector.pragmasOf(connection.dbKey)
+        if connection.pragmaVersion == version:
+            return None
+        for key, value in pragmas.items():
+            try:
+                connection.execute(f"pragma {key} = {value};").fetchall()
+            except sqlite3.Error:
+                continue
+        connection.pragmaVersion = version
+        return None
+
+    @staticmethod
+    def acquire(dbFilePath: FilePath, cachedStatements: int = None) -> PooledConnection:
+        SqlConnector.sweepDue()
+        key = SqlConnector.poolKey(dbFilePath)
+        connection = None
+        with SqlConnector._lock:
+            idle = SqlConnector._pools.get(key, list())
+            while idle and connection is None:
+                connection = idle.pop()
+                if not SqlConnector.isAlive(connection):
+                    connection = None
+        if connection is None:
+            connection = sqlite3.connect(
+                dbFilePath, factory=PooledConnection, cached_statements=Validate(cachedStatements, int(128)),
+                uri=str(dbFilePath).startswith(SqlConnector.UriPrefix), check_same_thread=False,
+            )
+            connection.dbKey = key[0]
+            SqlConnector._opened += 1
+        else:
+            SqlConnector._reused += 1
+        SqlConnector.applyPragmas(connection)
+        return connection
+
+    @staticmethod
+    def isAlive(connection: sqlite3.Connection) -> bool:
+        try:
+            return connection.total_changes >= 0
+        except sqlite3.Error:
+            return False
+
+    @staticmethod
+    def release(connection: Optional[sqlite3.Connection]):
+        if connection is None:
+            return None
+        try:
+            if connection.in_transaction:
+                connection.rollback()
+        except sqlite3.Error:
+            SqlConnector.closeConnection(connection)
+            return None
+        if not isinstance(connection, PooledConnection) or connection.dbKey == SqlConnector.MemoryDb:
+            SqlConnector.closeConnection(connection)
+            return None
+        key = GTuple(connection.dbKey, threading.get_ident())
+        connection.lastUsed = time.monotonic()
+        with SqlConnector._lock:
+            idle = SqlConnector._pools.setdefault(key, list())
+            if len(idle) < SqlConnector.PoolSize:
+                idle.append(connection)
+                return None
+        SqlConnector.closeConnection(connection)
+        return None
+
+    @staticmethod
+    def sweepDue() -> int:
+        if time.monotonic() - SqlConnector._sweptAt < SqlConnector.IdleTimeout / 4:
+            return int(0)
+        return SqlConnector.sweepIdle()
+
+    @staticmethod
+    def sweepIdle(timeout: float = None) -> int:
+        SqlConnector._sweptAt = time.monotonic()
+        timeout = Validate(timeout, SqlConnector.IdleTimeout)
+        deadline = time.monotonic() - timeout
+        threads = set(x.ident for x in threading.enumerate())
+        expired = list()
+        with SqlConnector._lock:
+            for key, idle in list(SqlConnector._pools.items()):
+                if key[1] not in threads:
+                    expired.extend(SqlConnector._pools.pop(key))
+                    continue
+                expired.extend(x for x in idle if x.lastUsed <= deadline)
+                idle[:] = [x for x in idle if x.lastUsed > deadline]
+                if not idle:
+                    SqlConnector._pools.pop(key, None)
+        for connection in expired:
+            SqlConnector.closeConnection(connection)
+        return len(expired)
+
+    @staticmethod
+    def closeAll(dbFilePath: FilePath = None) -> int:
+        dbKey = SqlConnector.dbKey(dbFilePath) if dbFilePath else None
+        expired = list()
+        with SqlConnector._lock:
+            for key in list(SqlConnector._pools.keys()):
+                if dbKey is None or key[0] == dbKey:
+                    expired.extend(SqlConnector._pools.pop(key))
+        for connection in expired:
+            SqlConnector.closeConnection(connection)
+        return len(expired)
+
+    @staticmethod
+    def closeConnection(connection: sqlite3.Connection):
+        try:
+            connection.close()
+        except sqlite3.Error as e:
+            RStr.log(f"failed to close sqlite connection: {e}", RStr.lgWarn)
+            return None
+        SqlConnector._closed += 1
+        return None
+
+    @staticmethod
+    def stats() -> Dict[str, int]:
+        with SqlConnector._lock:
+            idle = sum(len(x) for x in SqlConnector._pools.values())
+        return dict(
+            opened=SqlConnector._opened, reused=SqlConnector._reused,
+            closed=SqlConnector._closed, idle=idle,
+        )
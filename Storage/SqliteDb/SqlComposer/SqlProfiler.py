@@ -0,0 +1,139 @@
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Any, Optional, Deque
+
+from DeclarativeQt.Resource.Grammars.RGrammar import Validate
+from DeclarativeQt.Resource.Strings.RStr import RStr
+
+QueryRecord = Dict[str, Any]
+
+
+class SqlProfiler:
+    Enabled: bool = False
+    LogStatements: bool = False
+    SlowMsec: float = float(100.0)
+    BufferSize: int = int(512)
+    SlowBufferSize: int = int(64)
+    ExplainKinds: tuple = ("select", "insert", "update", "delete", "with")
+    opExplainQueryPlan: str = "explain query plan"
+    _records: Deque[QueryRecord] = deque(maxlen=BufferSize)
+    _slow: Deque[QueryRecord] = deque(maxlen=SlowBufferSize)
+    _shapes: Dict[str, Dict[str, Any]] = dict()
+    _lock = threading.Lock()
+    _literals = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+    _bindLists = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+    _skipFiles = ("SqlComposer.py", "SqlProfiler.py")
+
+    @staticmethod
+    def enable(slowMsec: float = None, bufferSize: int = None, logStatements: bool = None):
+        SqlProfiler.SlowMsec = Validate(slowMsec, SqlProfiler.SlowMsec)
+        SqlProfiler.LogStatements = Validate(logStatements, SqlProfiler.LogStatements)
+        with SqlProfiler._lock:
+            if bufferSize is not None and bufferSize != SqlProfiler.BufferSize:
+                SqlProfiler.BufferSize = bufferSize
+                SqlProfiler._records = deque(SqlProfiler._records, maxlen=bufferSize)
+        SqlProfiler.Enabled = True
+        return None
+
+    @staticmethod
+    def disable():
+        SqlProfiler.Enabled = False
+        return None
+
+    @staticmethod
+    def reset():
+        with SqlProfiler._lock:
+            SqlProfiler._records.clear()
+            SqlProfiler._slow.clear()
+            SqlProfiler._shapes.clear()
+        return None
+
+    @staticmethod
+    def start() -> Optional[float]:
+        return time.perf_counter() if SqlProfiler.Enabled else None
+
+    @staticmethod
+    def shapeOf(command: str) -> str:
+        shape = SqlProfiler._literals.sub("?", " ".join(command.split()))
+        return SqlProfiler._bindLists.sub("(...)", shape)
+
+    @staticmethod
+    def kindOf(command: str) -> str:
+        head = command.lstrip().split(None, 1)
+        return head[0].lower() if head else str()
+
+    @staticmethod
+    def callerOf(depth: int = 1) -> str:
+        frame = sys._getframe(depth)
+        while frame is not None and os.path.basename(frame.f_code.co_filename) in SqlProfiler._skipFiles:
+            frame = frame.f_back
+        if frame is None:
+            return str()
+        return f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno} {frame.f_code.co_name}"
+
+    @staticmethod
+    def explain(connection: sqlite3.Connection, command: str, params: List[Any]) -> Optional[List[str]]:
+        try:
+            plan = connection.execute(f"{SqlProfiler.opExplainQueryPlan} {command}", params).fetchall()
+        except sqlite3.Error:
+            return None
+        return [x[-1] for x in plan]
+
+    @staticmethod
+    def finish(start: Optional[float], connection: sqlite3.Connection, command: str, params: List[Any], rows: int):
+        if start is None:
+            return None
+        msec = (time.perf_counter() - start) * 1e3
+        kind = SqlProfiler.kindOf(command)
+        shape = SqlProfiler.shapeOf(command)
+        record = dict(
+            sql=command, shape=shape, kind=kind, msec=msec,
+            rows=int(rows) if rows is not None and rows >= 0 else None,
+            caller=SqlProfiler.callerOf(), at=time.time(),
+        )
+        if msec >= SqlProfiler.SlowMsec:
+            explainable = kind in SqlProfiler.ExplainKinds
+            record["plan"] = SqlProfiler.explain(connection, command, params) if explainable else None
+            RStr.log(f"slow query {msec:.1f} ms at {record['caller']}: {command} {record['plan']}", RStr.lgWarn)
+        with SqlProfiler._lock:
+            SqlProfiler._records.append(record)
+            if "plan" in record:
+                SqlProfiler._slow.append(record)
+            aggregate = SqlProfiler._shapes.setdefault(
+                shape, dict(kind=kind, count=int(0), totalMsec=float(0), maxMsec=float(0), rows=int(0))
+            )
+            aggregate["count"] += 1
+            aggregate["totalMsec"] += msec
+            aggregate["maxMsec"] = max(aggregate["maxMsec"], msec)
+            aggregate["rows"] += Validate(record["rows"], int(0))
+        return None
+
+    @staticmethod
+    def records() -> List[QueryRecord]:
+        with SqlProfiler._lock:
+            return list(SqlProfiler._records)
+
+    @staticmethod
+    def slowQueries() -> List[QueryRecord]:
+        with SqlProfiler._lock:
+            return list(SqlProfiler._slow)
+
+    @staticmethod
+    def aggregates(top: int = None, sortBy: str = "totalMsec") -> List[Dict[str, Any]]:
+        with SqlProfiler._lock:
+            shapes = [dict(shape=k, meanMsec=v["totalMsec"] / v["count"], **v) for k, v in SqlProfiler._shapes.items()]
+        shapes.sort(key=lambda x: x[sortBy], reverse=True)
+        return shapes if top is None else shapes[:top]
+
+    @staticmethod
+    def report(top: int = None) -> Dict[str, Any]:
+        return dict(
+            enabled=SqlProfiler.Enabled, slowMsec=SqlProfiler.SlowMsec,
+            recorded=len(SqlProfiler.records()), shapes=SqlProfiler.aggregates(top),
+            slow=SqlProfiler.slowQueries(),
+        )
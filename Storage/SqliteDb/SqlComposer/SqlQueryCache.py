@@ -0,0 +1,95 @@
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple, Any, List, Optional
+
+from DeclarativeQt.Resource.FileTypes.RFileType import FilePath
+from DeclarativeQt.Resource.Grammars.RGrammar import GTuple
+from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlConnector import SqlConnector, PooledConnection
+
+QueryKey = Tuple[str, tuple]
+CachedResult = Tuple[int, List[Any]]
+
+
+class SqlQueryCache:
+    Enabled: bool = True
+    MaxEntries: int = int(32)
+    opDataVersion: str = "pragma data_version;"
+    _entries: Dict[str, "OrderedDict[QueryKey, CachedResult]"] = dict()
+    _versions: Dict[str, int] = dict()
+    _lock = threading.RLock()
+    _hits: int = int(0)
+    _misses: int = int(0)
+
+    @staticmethod
+    def queryKey(query: str, params: List[Any]) -> QueryKey:
+        return GTuple(" ".join(query.split()).rstrip(";").strip(), tuple(params))
+
+    @staticmethod
+    def isCacheable(dbKey: str) -> bool:
+        return SqlQueryCache.Enabled and dbKey != SqlConnector.MemoryDb
+
+    @staticmethod
+    def version(dbFilePath: FilePath) -> int:
+        return SqlQueryCache._versions.get(SqlConnector.dbKey(dbFilePath), int(0))
+
+    @staticmethod
+    def bump(dbFilePath: FilePath) -> int:
+        key = SqlConnector.dbKey(dbFilePath)
+        with SqlQueryCache._lock:
+            version = SqlQueryCache._versions.get(key, int(0)) + int(1)
+            SqlQueryCache._versions[key] = version
+            SqlQueryCache._entries.pop(key, None)
+        return version
+
+    @staticmethod
+    def observe(connection: PooledConnection) -> int:
+        try:
+            dataVersion = connection.execute(SqlQueryCache.opDataVersion).fetchone()[0]
+        except sqlite3.Error:
+            return SqlQueryCache.bump(connection.dbKey)
+        if dataVersion != connection.dataVersion:
+            connection.dataVersion = dataVersion
+            return SqlQueryCache.bump(connection.dbKey)
+        return SqlQueryCache.version(connection.dbKey)
+
+    @staticmethod
+    def lookup(dbKey: str, query: str, params: List[Any], version: int) -> Optional[List[Any]]:
+        key = SqlQueryCache.queryKey(query, params)
+        with SqlQueryCache._lock:
+            entries = SqlQueryCache._entries.get(dbKey)
+            cached = entries.get(key) if entries is not None else None
+            if cached is None or cached[0] != version:
+                SqlQueryCache._misses += 1
+                return None
+            entries.move_to_end(key)
+            SqlQueryCache._hits += 1
+        return list(cached[1])
+
+    @staticmethod
+    def store(dbKey: str, query: str, params: List[Any], version: int, rows: List[Any]):
+        key = SqlQueryCache.queryKey(query, params)
+        with SqlQueryCache._lock:
+            if SqlQueryCache._versions.get(dbKey, int(0)) != version:
+                return None
+            entries = SqlQueryCache._entries.setdefault(dbKey, OrderedDict())
+            entries[key] = GTuple(version, list(rows))
+            entries.move_to_end(key)
+            while len(entries) > SqlQueryCache.MaxEntries:
+                entries.popitem(last=False)
+        return None
+
+    @staticmethod
+    def clear(dbFilePath: FilePath = None):
+        with SqlQueryCache._lock:
+            if dbFilePath is None:
+                SqlQueryCache._entries.clear()
+            else:
+                SqlQueryCache._entries.pop(SqlConnector.dbKey(dbFilePath), None)
+        return None
+
+    @staticmethod
+    def stats() -> Dict[str, int]:
+        with SqlQueryCache._lock:
+            entries = sum(len(x) for x in SqlQueryCache._entries.values())
+        return dict(hits=SqlQueryCache._hits, misses=SqlQueryCache._misses, entries=entries)
@@ -1,22 +1,65 @@
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Self, Optional, Any
+from typing import Dict, List, Self, Optional, Any, Union, Tuple
 
 from DeclarativeQt.Resource.FileTypes.RFileType import FilePath
 from DeclarativeQt.Resource.Grammars.RGrammar import GList, Validate, isEmpty, LimitVal, Key, DtReferDict, \
-    DictData, ReferList, DictToDefault
+    DictData, ReferList, DictToDefault, GetDictItem, GTuple
 from DeclarativeQt.Resource.Strings.RStr import NLIndex, RStr
 from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlComposer import SqlComposer
+from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlConnector import SqlConnector, SqlPragmas
 
 FieldNLMap = Dict[str, str]
 DataField = str
 FieldDefine = List[List[str]]
+IndexDefine = List[List[Any]]
+QueryPlans = Dict[str, Optional[List[str]]]
+IndexReport = Dict[str, str]
 DBNaming = str
 SortOrder = int
+SqlRows = List[Dict[DataField, Any]]
+ChangeLog = List[Tuple[int, str, Optional[int], Optional[SortOrder]]]
+BatchReport = Dict[str, Any]
+PragmaProfile = Union[str, SqlPragmas]
 
 
 class SqlDatabase(ABC):
     fdSort: DataField = "sorting"
     baseOrder: SortOrder = int(-1)
+    pfInteractive: str = "interactive"
+    pfBulkImport: str = "bulk-import"
+    pfReadMostly: str = "read-mostly"
+    PragmaProfiles: Dict[str, SqlPragmas] = {
+        pfInteractive: dict(
+            journal_mode="wal", synchronous="normal", temp_store="memory",
+            cache_size=int(-16384), mmap_size=int(64 * 1024 * 1024), busy_timeout=int(2000),
+        ),
+        pfBulkImport: dict(
+            journal_mode="wal", synchronous="off", temp_store="memory",
+            cache_size=int(-131072), mmap_size=int(256 * 1024 * 1024), busy_timeout=int(10000),
+        ),
+        pfReadMostly: dict(
+            journal_mode="wal", synchronous="normal", temp_store="memory",
+            cache_size=int(-65536), mmap_size=int(512 * 1024 * 1024), busy_timeout=int(5000),
+        ),
+    }
+    dbPragmas: PragmaProfile = pfInteractive
+    odDense: str = "dense"
+    odGap: str = "gap"
+    dbOrdering: str = odDense
+    orderGap: SortOrder = int(1024)
+    dbSortIndex: bool = True
+    dbQueryCache: bool = True
+    dbChangeLog: bool = False
+    dbChangeRetain: int = int(4096)
+    fdChangeVersion: DataField = "version"
+    fdChangeOp: DataField = "op"
+    fdChangeRowId: DataField = "row_id"
+    fdChangeSort: DataField = "sort_key"
+    chInsert: str = "insert"
+    chUpdate: str = "update"
+    chDelete: str = "delete"
+    chReset: str = "reset"
 
     @staticmethod
     @abstractmethod
@@ -63,14 +106,39 @@ class SqlDatabase(ABC):
     def isPrimaryKeyAuto(self) -> bool:
         pass
 
+    @property
+    def dbChangeTableName(self) -> DBNaming:
+        return f"{self.dbTableName}_changes"
+
+    @property
+    def dbIndexDefinitions(self) -> IndexDefine:
+        if not self.dbSortIndex:
+            return list()
+        return GList(GList(f"{self.dbTableName}_{self.fdSort}_idx", GList(self.fdSort)))
+
     @property
     def isPrimaryKeyString(self) -> bool:
         return self.dbPrimaryKeyField in self.dbStringFields
 
     def reconnectSqlDb(self) -> Self:
+        SqlConnector.setPragmas(self.dbFilePath, self.sqlPragmas())
         self.sql.connect(self.dbFilePath)
         return self
 
+    def sqlPragmas(self) -> SqlPragmas:
+        if isinstance(self.dbPragmas, dict):
+            return dict(self.dbPragmas)
+        return dict(GetDictItem(self.PragmaProfiles, self.dbPragmas, dict()))
+
+    def applySqlPragmas(self, sql: SqlComposer = None) -> Self:
+        SqlConnector.setPragmas(self.dbFilePath, self.sqlPragmas())
+        Validate(sql, self.sql).refreshPragmas()
+        return self
+
+    def openSqlComposer(self) -> SqlComposer:
+        SqlConnector.setPragmas(self.dbFilePath, self.sqlPragmas())
+        return SqlComposer(self.dbFilePath)
+
     def standardSqlRowData(self, sql: SqlComposer = None, **kwargs: Any):
         sql = Validate(sql, self.sql)
         if not sql.isConnected():
@@ -82,60 +150,251 @@ class SqlDatabase(ABC):
         kwargs = DictToDefault(kwargs, defaultVal=sql.pNull)
         return kwargs
 
+    def bindSqlRowData(self, sql: SqlComposer = None, fields: List[DataField] = None, **kwargs: Any):
+        sql = Validate(sql, self.sql)
+        fields = Validate(fields, list(kwargs.keys()))
+        return DictData(*ReferList(fields, lambda a0: Key(a0).Val(sql.bind(kwargs.get(a0))))).data
+
+    def flushSqlCopies(self) -> Self:
+        return self
+
     def insertSqlRowData(self, order: int = None, sql: SqlComposer = None, **kwargs: Any) -> Self:
+        self.flushSqlCopies()
         isAutoKey = self.isPrimaryKeyAuto
         if not isAutoKey and self.dbPrimaryKeyField not in kwargs:
             return self
         sql = Validate(sql, self.sql)
         if not sql.isConnected():
             return self
-        max_order = self.maxValidOrder(sql)
-        order = max_order if order is None else LimitVal(order, self.minValidOrder(), max_order)
-        row_key = kwargs[self.dbPrimaryKeyField] if not isAutoKey else None
-        kwargs = self.standardSqlRowData(sql, **kwargs)
-        kvPair = lambda k: Key(k).Val(kwargs[k])
-        if not sql.insert(self.dbTableName, values=DictData(
-                *ReferList(self.dbFields, lambda a0: kvPair(a0)), Key(self.fdSort).Val(order)
-        ).data).commit():
-            return self
-        last_id = row_key if not isAutoKey else sql.cmdAppend(sql.opLastInsertRowid).fetchall()[0][0]
-        if self.isPrimaryKeyString:
-            last_id = sql.stringFrame(last_id)
-        sql.update(self.dbTableName, values=DictData(
-            Key(self.fdSort).Val(sql.plusFrame(self.fdSort, int(1)))
-        ).data).where(sql.andFrame(
-            sql.atLeastFrame(self.fdSort, order),
-            sql.unequalFrame(self.dbPrimaryKeyField, last_id)
-        )).commit()
+        with sql.transaction():
+            if self.isGapOrdering:
+                order = self.gapOrderKeys(order, int(1), sql)[0]
+                values = self.bindSqlRowData(sql, self.dbFields, **kwargs)
+                values[self.fdSort] = sql.bind(order)
+                sql.insert(self.dbTableName, values=values).commit()
+                return self
+            max_order = self.maxValidOrder(sql)
+            order = max_order if order is None else LimitVal(order, self.minValidOrder(), max_order)
+            row_key = kwargs[self.dbPrimaryKeyField] if not isAutoKey else None
+            values = self.bindSqlRowData(sql, self.dbFields, **kwargs)
+            values[self.fdSort] = sql.bind(order)
+            if not sql.insert(self.dbTableName, values=values).commit():
+                return self
+            last_id = row_key if not isAutoKey else sql.cmdAppend(sql.opLastInsertRowid).fetchall()[0][0]
+            sql.update(self.dbTableName, values=DictData(
+                Key(self.fdSort).Val(sql.plusFrame(self.fdSort, int(1)))
+            ).data).where(sql.andFrame(
+                sql.atLeastFrame(self.fdSort, sql.bind(order)),
+                sql.unequalFrame(self.dbPrimaryKeyField, sql.bind(last_id))
+            )).commit()
         return self
 
     def updateSqlRowData(self, key: Any = None, sql: SqlComposer = None, **kwargs: Any) -> Self:
         if key is None:
             return self
+        self.flushSqlCopies()
         sql = Validate(sql, self.sql)
         if not sql.isConnected():
             return self
-        if self.isPrimaryKeyString:
-            key = sql.stringFrame(key)
-        kwargs = self.standardSqlRowData(sql, **kwargs)
-        sql.update(self.dbTableName, values=kwargs).where(
-            condition=sql.equalFrame(self.dbPrimaryKeyField, key)
+        sql.update(self.dbTableName, values=self.bindSqlRowData(sql, **kwargs)).where(
+            condition=sql.equalFrame(self.dbPrimaryKeyField, sql.bind(key))
         ).commit()
         return self
 
+    def insertSqlRows(self, rows: SqlRows, order: int = None, sql: SqlComposer = None) -> BatchReport:
+        start = time.perf_counter()
+        self.flushSqlCopies()
+        sql = Validate(sql, self.sql)
+        if not self.isPrimaryKeyAuto:
+            rows = [x for x in rows if self.dbPrimaryKeyField in x]
+        if isEmpty(rows) or not sql.isConnected():
+            return self.batchReport(0, start)
+        with sql.transaction():
+            if self.isGapOrdering:
+                keys = self.gapOrderKeys(order, len(rows), sql)
+            else:
+                max_order = self.maxValidOrder(sql)
+                order = max_order if order is None else LimitVal(order, self.minValidOrder(), max_order)
+                if order < max_order:
+                    sql.update(self.dbTableName, values=DictData(
+                        Key(self.fdSort).Val(sql.plusFrame(self.fdSort, len(rows)))
+                    ).data).where(sql.atLeastFrame(self.fdSort, sql.bind(order))).commit()
+                keys = list(range(order, order + len(rows)))
+            fields = self.dbFields + GList(self.fdSort)
+            sql.insert(self.dbTableName, values=DictData(*ReferList(fields, lambda a0: Key(a0).Val(sql.pBind))).data)
+            params = [ReferList(self.dbFields, lambda a0: x.get(a0)) + GList(keys[i]) for i, x in enumerate(rows)]
+            count = Validate(sql.executemany(params), 0)
+        return self.batchReport(count, start)
+
+    def updateSqlRows(self, rows: SqlRows, sql: SqlComposer = None) -> BatchReport:
+        start = time.perf_counter()
+        self.flushSqlCopies()
+        sql = Validate(sql, self.sql)
+        if not sql.isConnected():
+            return self.batchReport(0, start)
+        groups: Dict[tuple, list] = dict()
+        for row in rows:
+            if self.dbPrimaryKeyField not in row:
+                continue
+            fields = tuple(k for k in row.keys() if k != self.dbPrimaryKeyField)
+            if fields:
+                groups.setdefault(fields, list()).append(row)
+        count = int(0)
+        with sql.transaction():
+            for fields, group in groups.items():
+                values = DictData(*ReferList(fields, lambda a0: Key(a0).Val(sql.pBind))).data
+                sql.update(self.dbTableName, values=values).where(sql.equalFrame(self.dbPrimaryKeyField, sql.pBind))
+                params = [ReferList(fields, lambda a0: x[a0]) + GList(x[self.dbPrimaryKeyField]) for x in group]
+                count += Validate(sql.executemany(params), 0)
+        return self.batchReport(count, start)
+
+    @staticmethod
+    def batchReport(count: int, start: float) -> BatchReport:
+        seconds = time.perf_counter() - start
+        return DictData(
+            Key("rows").Val(count),
+            Key("seconds").Val(seconds),
+            Key("rowsPerSec").Val(count / seconds if seconds > 0 else float(0)),
+        ).data
+
     def createSqlTable(self, sql: SqlComposer = None) -> Self:
         sql = Validate(sql, self.sql)
         if not sql.isConnected():
             return self
-        sql.createTable(self.dbTableName, fields=self.dbFieldDefinitions).cmdEnd().commit()
+        self.applySqlPragmas(sql)
+        with sql.transaction():
+            sql.createTable(self.dbTableName, fields=self.dbFieldDefinitions).cmdEnd().commit()
+            self.createSqlIndexes(sql)
+            if self.dbChangeLog:
+                self.createChangeLog(sql)
+        return self
+
+    def createChangeLog(self, sql: SqlComposer = None) -> Self:
+        sql = Validate(sql, self.sql)
+        if not sql.isConnected():
+            return self
+        with sql.transaction():
+            sql.createTable(self.dbChangeTableName, fields=GList(
+                GList(self.fdChangeVersion, sql.dtINT, sql.primaryKeyAutoIncrementMark),
+                GList(self.fdChangeOp, sql.dtSTRING, sql.notNullMark),
+                GList(self.fdChangeRowId, sql.dtINT),
+                GList(self.fdChangeSort, sql.dtINT),
+            )).commit()
+            for event, ref in GList(
+                    GTuple(self.chInsert, "new"), GTuple(self.chUpdate, "new"), GTuple(self.chDelete, "old")
+            ):
+                sql.createTrigger(
+                    f"{self.dbTableName}_{event}_log", event, self.dbTableName, self.dbChangeTableName, DictData(
+                        Key(self.fdChangeOp).Val(sql.stringFrame(event)),
+                        Key(self.fdChangeRowId).Val(f"{ref}.{sql.pRowId}"),
+                        Key(self.fdChangeSort).Val(f"{ref}.{self.fdSort}"),
+                    ).data
+                ).commit()
+        return self
+
+    def fetchChangesSince(self, version: int, sql: SqlComposer = None) -> Optional[ChangeLog]:
+        sql = Validate(sql, self.sql)
+        if not self.dbChangeLog or not sql.isConnected():
+            return None
+        fields = GList(self.fdChangeVersion, self.fdChangeOp, self.fdChangeRowId, self.fdChangeSort)
+        sql.select(fields, self.dbChangeTableName)
+        sql.where(sql.greaterFrame(self.fdChangeVersion, sql.bind(version)), end=False)
+        return sql.cmdAppend(sql.orderByFrame(self.fdChangeVersion)).fetchall()
+
+    def latestChangeVersion(self, sql: SqlComposer = None) -> Optional[int]:
+        sql = Validate(sql, self.sql)
+        if not self.dbChangeLog or not sql.isConnected():
+            return None
+        sql.select(GList(sql.pSequence), sql.tbSequence)
+        version = sql.where(sql.equalFrame(sql.pName, sql.bind(self.dbChangeTableName))).fetchall()
+        return None if version is None else version[0][0] if version else int(0)
+
+    def pruneChangeLog(self, version: int, sql: SqlComposer = None) -> Self:
+        sql = Validate(sql, self.sql)
+        if not self.dbChangeLog or not sql.isConnected():
+            return self
+        sql.deleteData(self.dbChangeTableName).where(sql.atMostFrame(self.fdChangeVersion, sql.bind(version)))
+        sql.commit()
+        return self
+
+    def createSqlIndexes(self, sql: SqlComposer = None) -> Self:
+        sql = Validate(sql, self.sql)
+        if not sql.isConnected():
+            return self
+        with sql.transaction():
+            for name in self.verifySqlIndexes(sql).keys():
+                sql.dropIndex(name).commit()
+            for index in self.dbIndexDefinitions:
+                sql.createIndex(self.dbTableName, *index).commit()
+        for name, problem in self.verifySqlIndexes(sql).items():
+            RStr.log(f"index {name} on {self.dbTableName}: {problem}", RStr.lgWarn)
         return self
 
+    def verifySqlIndexes(self, sql: SqlComposer = None) -> IndexReport:
+        sql = Validate(sql, self.sql)
+        if not sql.isConnected():
+            return dict()
+        indexes = sql.indexList(self.dbTableName)
+        if indexes is None:
+            return dict()
+        live = {x[1]: x for x in indexes}
+        report = dict()
+        for index in self.dbIndexDefinitions:
+            name, fields = index[0], list(index[1])
+            unique = bool(index[2]) if len(index) > 2 else False
+            partial = bool(index[3]) if len(index) > 3 else False
+            if name not in live:
+                report[name] = "missing"
+                continue
+            columns = sql.indexColumns(name)
+            if columns != fields:
+                report[name] = f"columns {columns} != {fields}"
+            elif bool(live[name][2]) != unique:
+                report[name] = "unique" if unique else "not unique"
+            elif bool(live[name][4]) != partial:
+                report[name] = "partial" if partial else "not partial"
+        return report
+
+    def scanningSqlQueries(self, sql: SqlComposer = None) -> QueryPlans:
+        isScan = lambda a0: a0.startswith("SCAN") and "USING" not in a0 or "TEMP B-TREE" in a0
+        plans = self.explainSqlQueries(sql)
+        return {k: v for k, v in plans.items() if v is None or any(isScan(x) for x in v)}
+
+    def explainSqlQueries(self, sql: SqlComposer = None) -> QueryPlans:
+        sql = Validate(sql, self.sql)
+        if not sql.isConnected():
+            return dict()
+        plans = dict()
+        sql.select(self.dbFields, self.dbTableName).cmdAppend(sql.orderByFrame(self.fdSort))
+        plans["fetchSqlTable"] = sql.explainQueryPlan()
+        sql.select(GList(self.fdSort), self.dbTableName).where(sql.equalFrame(self.dbPrimaryKeyField, sql.bind(None)))
+        plans["locateRow"] = sql.explainQueryPlan()
+        sql.select(GList(sql.maxFrame(self.fdSort)), self.dbTableName)
+        plans["maxExistOrder"] = sql.explainQueryPlan()
+        sql.select(GList(self.fdSort), self.dbTableName).cmdAppend(sql.orderByFrame(self.fdSort), end=False)
+        sql.cmdAppend(sql.limitOffsetFrame(sql.bind(int(2)), sql.bind(int(0))))
+        plans["neighbourOrders"] = sql.explainQueryPlan()
+        sql.update(self.dbTableName, values=DictData(
+            Key(self.fdSort).Val(sql.plusFrame(self.fdSort, int(1)))
+        ).data).where(sql.atLeastFrame(self.fdSort, sql.bind(int(0))))
+        plans["shiftOrders"] = sql.explainQueryPlan()
+        sql.update(self.dbTableName, values=DictData(Key(self.fdSort).Val(sql.bind(int(0)))).data)
+        sql.where(sql.equalFrame(self.dbPrimaryKeyField, sql.bind(None)))
+        plans["updateSqlRowData"] = sql.explainQueryPlan()
+        return plans
+
     def rebuildSqlTable(self, sql: SqlComposer = None) -> Self:
+        self.flushSqlCopies()
         sql = Validate(sql, self.sql)
         if not sql.isConnected():
             return self
         sql.dropTable(self.dbTableName).cmdEnd().commit()
         self.createSqlTable(sql)
+        if self.dbChangeLog:
+            sql.insert(self.dbChangeTableName, values=DictData(
+                Key(self.fdChangeOp).Val(sql.stringFrame(self.chReset))
+            ).data).commit()
+        sql.markWritten()
         return self
 
     def maxExistOrder(self, sql: SqlComposer = None) -> Optional[int]:
@@ -151,6 +410,60 @@ class SqlDatabase(ABC):
     def minValidOrder(self) -> int:
         return self.baseOrder + int(1)
 
+    @property
+    def isGapOrdering(self) -> bool:
+        return self.dbOrdering == self.odGap
+
+    def neighbourOrders(self, position: int, sql: SqlComposer = None, exclude: dict = None) -> List[Optional[int]]:
+        sql = Validate(sql, self.sql)
+        sql.select(GList(self.fdSort), self.dbTableName)
+        if exclude:
+            sql.whereNot(sql.bindConditions(exclude), end=False)
+        sql.cmdAppend(sql.orderByFrame(self.fdSort), end=False)
+        sql.cmdAppend(sql.limitOffsetFrame(sql.bind(int(2)), sql.bind(max(position - int(1), int(0)))))
+        keys = ReferList(Validate(sql.fetchall(), list()), lambda a0: a0[0]) + GList(None, None)
+        if position <= 0:
+            return GList(None, keys[0])
+        if keys[0] is None:
+            return GList(self.maxExistOrder(sql), None)
+        return keys[:2]
+
+    def gapOrderKeys(self, position: Optional[int], count: int, sql: SqlComposer = None, exclude: dict = None):
+        sql = Validate(sql, self.sql)
+        if position is None:
+            prev, after = self.maxExistOrder(sql), None
+        else:
+            prev, after = self.neighbourOrders(position, sql, exclude)
+        if prev is None and after is None:
+            return list(range(0, count * self.orderGap, self.orderGap))
+        if after is None:
+            return ReferList(range(count), lambda a0: prev + self.orderGap * (a0 + 1))
+        if prev is None:
+            return ReferList(range(count), lambda a0: after - self.orderGap * (count - a0))
+        if (after - prev) // (count + 1) < 1:
+            self.renormalizeOrder(sql)
+            prev, after = self.neighbourOrders(position, sql, exclude)
+        if (after - prev) // (count + 1) < 1:
+            shift = self.orderGap * (count + 1)
+            sql.update(self.dbTableName, values=DictData(
+                Key(self.fdSort).Val(sql.plusFrame(self.fdSort, shift))
+            ).data).where(sql.atLeastFrame(self.fdSort, sql.bind(after))).commit()
+            after += shift
+        step = (after - prev) // (count + 1)
+        return ReferList(range(count), lambda a0: prev + step * (a0 + 1))
+
+    def renormalizeOrder(self, sql: SqlComposer = None) -> Self:
+        sql = Validate(sql, self.sql)
+        if not sql.isConnected():
+            return self
+        with sql.transaction():
+            rows = sql.select(GList(sql.pRowId), self.dbTableName).cmdAppend(sql.orderByFrame(self.fdSort)).fetchall()
+            gap = self.orderGap if self.isGapOrdering else int(1)
+            params = [GList(i * gap, x[0]) for i, x in enumerate(Validate(rows, list()))]
+            sql.update(self.dbTableName, values=DictData(Key(self.fdSort).Val(sql.pBind)).data)
+            sql.where(sql.equalFrame(sql.pRowId, sql.pBind)).executemany(params)
+        return self
+
     DbFields: List[DataField] = list()
     DbTableName: DBNaming = str()
     DbFilePath: FilePath = str()
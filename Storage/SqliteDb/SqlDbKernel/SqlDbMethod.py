@@ -1,34 +1,36 @@
-from typing import List, Dict, Iterable, Optional
+from typing import List, Dict, Iterable, Optional, Iterator, Tuple
 
 from DeclarativeQt.Resource.Grammars.RGrammar import GList, ReferList, Validate, isEmpty, LimitVal, DictData, Equal, \
-    Key
+    Key, GTuple
 from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlComposer import SqlComposer
-from DeclarativeQt.Storage.SqliteDb.SqlDbKernel.SqlDatabase import SqlDatabase, DataField
+from DeclarativeQt.Storage.SqliteDb.SqlDbKernel.SqlDatabase import SqlDatabase, DataField, SortOrder
 
 DataTranslator = Dict[DataField, Dict[str, str]]
 SqlTableData = Optional[List[Iterable]]
+SqlTablePage = Tuple[SqlTableData, Optional[SortOrder]]
 
 
 class BaseSqlDbMethod:
     @staticmethod
     def getTableFields(dbFile: str, tableName: str):
-        sql = SqlComposer(dbFile)
-        if not sql.isConnected():
-            return None
-        cursor = sql.select(GList(sql.pAllFields), tableName).cmdAppend(sql.limitFrame(0)).execute()
-        return ReferList(cursor.description, lambda x: x[0])
+        with SqlComposer(dbFile) as sql:
+            if not sql.isConnected():
+                return None
+            cursor = sql.select(GList(sql.pAllFields), tableName).cmdAppend(sql.limitFrame(0)).execute()
+            return ReferList(cursor.description, lambda x: x[0])
 
     @staticmethod
     def getTableData(dbFile: str, tableName: str, fields: List[str] = None):
-        sql = SqlComposer(dbFile)
-        if not sql.isConnected():
-            return None
-        fields = Validate(fields, GList(sql.pAllFields))
-        return sql.select(fields, tableName).cmdEnd().fetchall()
+        with SqlComposer(dbFile) as sql:
+            if not sql.isConnected():
+                return None
+            fields = Validate(fields, GList(sql.pAllFields))
+            return sql.select(fields, tableName).cmdEnd().fetchall()
 
 
 class SqlDbMethod:
     BaseMethod = BaseSqlDbMethod
+    DefaultChunkSize: int = int(1000)
 
     @staticmethod
     def fetchSqlTable(
@@ -37,70 +39,127 @@ class SqlDbMethod:
     ) -> SqlTableData:
         if sqlDb is None:
             return None
-        sql = SqlComposer(sqlDb.dbFilePath)
-        if not sql.isConnected():
-            return None
-        fields = Validate(fields, sqlDb.dbFields)
-        sql.select(fields, sqlDb.dbTableName)
-        if sort:
-            sql.cmdAppend(sql.orderByFrame(sqlDb.fdSort))
-        data = sql.cmdEnd().fetchall()
+        with sqlDb.openSqlComposer() as sql:
+            if not sql.isConnected():
+                return None
+            fields = Validate(fields, sqlDb.dbFields)
+            sql.select(fields, sqlDb.dbTableName)
+            if sort:
+                sql.cmdAppend(sql.orderByFrame(sqlDb.fdSort))
+            sql.cmdEnd()
+            data = sql.fetchCached() if sqlDb.dbQueryCache else sql.fetchall()
         if translator is None or isEmpty(data):
             return data
-        data = ReferList(data, lambda a0: list(a0))
-        for field, mapping in translator.items():
-            if field not in fields:
-                continue
-            idx = fields.index(field)
-            translate = lambda a0: a0 if a0 not in mapping else mapping[a0]
-            for row in data:
-                row[idx] = translate(row[idx])
-        data = ReferList(data, lambda a0: tuple(a0))
-        return data
+        return SqlDbMethod.translateRows(data, fields, translator)
 
     @staticmethod
-    def deleteDataRow(sqlDb: SqlDatabase, uniqueKey: dict):
-        sql = SqlComposer(sqlDb.dbFilePath)
-        locator = list()
-        for k, v in uniqueKey.items():
-            locator.append(sql.equalFrame(k, v))
-        locator = sql.linkConditions(*locator, opt=sql.pAnd)
-        order = sql.select(GList(sqlDb.fdSort), sqlDb.dbTableName).where(locator).fetchall()
-        if isEmpty(order):
+    def translateRows(data: List[Iterable], fields: List[DataField], translator: DataTranslator) -> List[tuple]:
+        mappings = [translator.get(x) for x in fields]
+        if not any(mappings):
+            return data
+        columns = SqlDbMethod.tableColumns(data, len(fields))
+        columns = [col if mp is None else list(map(mp.get, col, col)) for col, mp in zip(columns, mappings)]
+        return list(zip(*columns))
+
+    @staticmethod
+    def tableColumns(data: List[Iterable], width: int) -> List[tuple]:
+        columns = list(zip(*data))
+        return columns if columns else [tuple() for _ in range(width)]
+
+    @staticmethod
+    def streamSqlTable(
+            sqlDb: SqlDatabase, fields: List[DataField] = None, sort: bool = True,
+            translator: DataTranslator = None, chunkSize: int = None
+    ) -> Iterator[List[tuple]]:
+        if sqlDb is None:
             return None
-        order = order[0][0]
-        result = sql.deleteData(sqlDb.dbTableName).where(locator).commit()
-        if result:
-            sql.update(sqlDb.dbTableName, DictData(
-                Key(sqlDb.fdSort).Val(sql.minusFrame(sqlDb.fdSort, int(1)))
-            ).data).where(sql.greaterFrame(sqlDb.fdSort, order)).commit()
+        chunkSize = Validate(chunkSize, SqlDbMethod.DefaultChunkSize)
+        with sqlDb.openSqlComposer() as sql:
+            if not sql.isConnected():
+                return None
+            fields = Validate(fields, sqlDb.dbFields)
+            sql.select(fields, sqlDb.dbTableName)
+            if sort:
+                sql.cmdAppend(sql.orderByFrame(sqlDb.fdSort))
+            cursor = sql.cmdEnd().execute()
+            while cursor is not None:
+                chunk = cursor.fetchmany(chunkSize)
+                if isEmpty(chunk):
+                    break
+                yield chunk if translator is None else SqlDbMethod.translateRows(chunk, fields, translator)
+        return None
+
+    @staticmethod
+    def fetchPage(
+            sqlDb: SqlDatabase, afterSort: SortOrder = None, limit: int = None,
+            fields: List[DataField] = None, translator: DataTranslator = None
+    ) -> SqlTablePage:
+        if sqlDb is None:
+            return GTuple(None, None)
+        limit = Validate(limit, SqlDbMethod.DefaultChunkSize)
+        with sqlDb.openSqlComposer() as sql:
+            if not sql.isConnected():
+                return GTuple(None, None)
+            fields = Validate(fields, sqlDb.dbFields)
+            sql.select(fields + GList(sqlDb.fdSort), sqlDb.dbTableName)
+            if afterSort is not None:
+                sql.where(sql.greaterFrame(sqlDb.fdSort, sql.bind(afterSort)), end=False)
+            sql.cmdAppend(sql.orderByFrame(sqlDb.fdSort), end=False)
+            data = sql.cmdAppend(sql.limitFrame(sql.bind(limit))).fetchall()
+        if isEmpty(data):
+            return GTuple(data, afterSort)
+        lastSort = data[-1][-1]
+        data = ReferList(data, lambda a0: a0[:-1])
+        if translator is not None:
+            data = SqlDbMethod.translateRows(data, fields, translator)
+        return GTuple(data, lastSort)
+
+    @staticmethod
+    def deleteDataRow(sqlDb: SqlDatabase, uniqueKey: dict):
+        sqlDb.flushSqlCopies()
+        with sqlDb.openSqlComposer() as sql, sql.transaction():
+            uniqueKey = {k: sql.unquote(v) for k, v in uniqueKey.items()}
+            sql.select(GList(sqlDb.fdSort), sqlDb.dbTableName)
+            order = sql.where(sql.bindConditions(uniqueKey)).fetchall()
+            if isEmpty(order):
+                return None
+            order = order[0][0]
+            result = sql.deleteData(sqlDb.dbTableName).where(sql.bindConditions(uniqueKey)).commit()
+            if result and not sqlDb.isGapOrdering:
+                sql.update(sqlDb.dbTableName, DictData(
+                    Key(sqlDb.fdSort).Val(sql.minusFrame(sqlDb.fdSort, int(1)))
+                ).data).where(sql.greaterFrame(sqlDb.fdSort, sql.bind(order))).commit()
         return None
 
     @staticmethod
     def rearrangeDataOrder(sqlDb: SqlDatabase, uniqueKey: dict, moveTo: int):
-        sql = SqlComposer(sqlDb.dbFilePath)
-        locator = list()
-        for k, v in uniqueKey.items():
-            locator.append(sql.equalFrame(k, v))
-        locator = sql.linkConditions(*locator, opt=sql.pAnd)
-        order = sql.select(GList(sqlDb.fdSort), sqlDb.dbTableName).where(locator).fetchall()
-        if isEmpty(order):
-            return None
-        order = order[0][0]
-        moveTo = LimitVal(moveTo, sqlDb.minValidOrder(), sqlDb.maxExistOrder(sql))
-        if Equal(order, moveTo):
-            return None
-        if order > moveTo:
-            sql.update(sqlDb.dbTableName, DictData(
-                Key(sqlDb.fdSort).Val(sql.plusFrame(sqlDb.fdSort, int(1)))
-            ).data).where(sql.andFrame(
-                sql.atLeastFrame(sqlDb.fdSort, moveTo), sql.lessFrame(sqlDb.fdSort, order)
-            )).commit()
-        else:
-            sql.update(sqlDb.dbTableName, DictData(
-                Key(sqlDb.fdSort).Val(sql.minusFrame(sqlDb.fdSort, int(1)))
-            ).data).where(sql.andFrame(
-                sql.greaterFrame(sqlDb.fdSort, order), sql.atMostFrame(sqlDb.fdSort, moveTo)
-            )).commit()
-        sql.update(sqlDb.dbTableName, DictData(Key(sqlDb.fdSort).Val(moveTo)).data).where(locator).commit()
+        sqlDb.flushSqlCopies()
+        with sqlDb.openSqlComposer() as sql, sql.transaction():
+            uniqueKey = {k: sql.unquote(v) for k, v in uniqueKey.items()}
+            sql.select(GList(sqlDb.fdSort), sqlDb.dbTableName)
+            order = sql.where(sql.bindConditions(uniqueKey)).fetchall()
+            if isEmpty(order):
+                return None
+            order = order[0][0]
+            moveToRow = lambda a0: sql.update(sqlDb.dbTableName, DictData(Key(sqlDb.fdSort).Val(sql.bind(a0))).data)
+            if sqlDb.isGapOrdering:
+                moveTo = sqlDb.gapOrderKeys(moveTo, int(1), sql, exclude=uniqueKey)[0]
+                moveToRow(moveTo).where(sql.bindConditions(uniqueKey)).commit()
+                return None
+            moveTo = LimitVal(moveTo, sqlDb.minValidOrder(), sqlDb.maxExistOrder(sql))
+            if Equal(order, moveTo):
+                return None
+            if order > moveTo:
+                sql.update(sqlDb.dbTableName, DictData(
+                    Key(sqlDb.fdSort).Val(sql.plusFrame(sqlDb.fdSort, int(1)))
+                ).data).where(sql.andFrame(
+                    sql.atLeastFrame(sqlDb.fdSort, sql.bind(moveTo)), sql.lessFrame(sqlDb.fdSort, sql.bind(order))
+                )).commit()
+            else:
+                sql.update(sqlDb.dbTableName, DictData(
+                    Key(sqlDb.fdSort).Val(sql.minusFrame(sqlDb.fdSort, int(1)))
+                ).data).where(sql.andFrame(
+                    sql.greaterFrame(sqlDb.fdSort, sql.bind(order)), sql.atMostFrame(sqlDb.fdSort, sql.bind(moveTo))
+                )).commit()
+            moveToRow(moveTo).where(sql.bindConditions(uniqueKey)).commit()
         return None
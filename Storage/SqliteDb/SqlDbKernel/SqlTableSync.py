@@ -0,0 +1,200 @@
+import threading
+import weakref
+from bisect import bisect_left, insort
+from typing import Dict, List, Tuple, Optional, Any, Callable
+
+from DeclarativeQt.DqtCore.DqtBase import RList, Remember
+from DeclarativeQt.Resource.Grammars.RGrammar import GList, Validate, isEmpty, GTuple, ReferList
+from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlComposer import SqlComposer
+from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlConnector import SqlConnector
+from DeclarativeQt.Storage.SqliteDb.SqlDbKernel.SqlDatabase import SqlDatabase, DataField, SortOrder
+from DeclarativeQt.Storage.SqliteDb.SqlDbKernel.SqlDbMethod import SqlDbMethod, SqlTableData, DataTranslator
+
+RowKey = Tuple[SortOrder, int]
+RowOp = Tuple[int, Optional[int], Optional[int]]
+SyncSource = Tuple[str, str, Tuple[DataField, ...]]
+RowConverter = Callable[[tuple], Any]
+LogKey = Tuple[str, str]
+
+
+class SqlTableSync:
+    MaxPatchRatio: float = 0.5
+    PatchChunkSize: int = int(500)
+    _registry = threading.Lock()
+    _consumers: Dict[LogKey, weakref.WeakSet] = dict()
+    _prunedAt: Dict[LogKey, int] = dict()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._source: Optional[SyncSource] = None
+        self._version: Optional[int] = None
+        self._pruned: int = int(0)
+        self._rows: Dict[int, tuple] = dict()
+        self._sorts: Dict[int, SortOrder] = dict()
+        self._order: List[RowKey] = list()
+        self._ops: Optional[List[RowOp]] = None
+        self._pushed: Optional[List[Any]] = None
+        self._patched = int(0)
+        self._reloaded = int(0)
+
+    @property
+    def version(self) -> Optional[int]:
+        return self._version
+
+    def fetchSqlTable(
+            self, sqlDb: SqlDatabase, fields: List[DataField] = None,
+            sort: bool = True, translator: DataTranslator = None
+    ) -> SqlTableData:
+        if sqlDb is None:
+            return None
+        if not sqlDb.dbChangeLog or not sort:
+            return SqlDbMethod.fetchSqlTable(sqlDb, fields, sort, translator)
+        fields = Validate(fields, sqlDb.dbFields)
+        with self._lock:
+            if not self.synchronize(sqlDb, fields):
+                return None
+            self._ops = None
+            data = [self._rows[x[-1]] for x in self._order]
+        if translator is None or isEmpty(data):
+            return data
+        return SqlDbMethod.translateRows(data, fields, translator)
+
+    def syncSqlTable(
+            self, rows: RList, sqlDb: SqlDatabase, fields: List[DataField] = None,
+            translator: DataTranslator = None, converter: RowConverter = None
+    ) -> RList:
+        converter = Validate(converter, lambda a0: a0)
+        if sqlDb is None or not sqlDb.dbChangeLog:
+            data = SqlDbMethod.fetchSqlTable(sqlDb, fields, True, translator) if sqlDb else None
+            self._pushed = None
+            rows.setValue(ReferList(Validate(data, list()), converter))
+            return rows
+        fields = Validate(fields, sqlDb.dbFields)
+        translate = lambda a0: SqlDbMethod.translateRows(GList(a0), fields, translator)[0] if translator else a0
+        toRow = lambda a0: converter(translate(a0))
+        with self._lock:
+            if not self.synchronize(sqlDb, fields):
+                return rows
+            ops = self._ops
+            pushed = Remember.getListValue(rows)
+            if ops is None or pushed != self._pushed or isEmpty(pushed) or isEmpty(self._order):
+                rows.setValue([toRow(self._rows[x[-1]]) for x in self._order])
+            else:
+                with Remember.batch():
+                    for rowId, oldAt, newAt in ops:
+                        if newAt is None:
+                            rows.remove(oldAt)
+                        elif oldAt is None:
+                            rows.insert(newAt, toRow(self._rows[rowId]))
+                        elif oldAt == newAt:
+                            rows.setItem(newAt, toRow(self._rows[rowId]))
+                        else:
+                            rows.remove(oldAt)
+                            rows.insert(newAt, toRow(self._rows[rowId]))
+            self._pushed = Remember.getListValue(rows)
+            self._ops = list()
+        return rows
+
+    def synchronize(self, sqlDb: SqlDatabase, fields: List[DataField]) -> bool:
+        with sqlDb.openSqlComposer() as sql:
+            if not sql.isConnected():
+                return False
+            with sql.transaction():
+                if not self.patch(sqlDb, fields, sql):
+                    self.reload(sqlDb, fields, sql)
+            if self._version is None:
+                return False
+            self.prune(sqlDb, sql)
+        return True
+
+    @staticmethod
+    def sourceOf(sqlDb: SqlDatabase, fields: List[DataField], sql: SqlComposer) -> SyncSource:
+        return GTuple(sql.dbFilePath, sqlDb.dbTableName, tuple(fields))
+
+    def reload(self, sqlDb: SqlDatabase, fields: List[DataField], sql: SqlComposer) -> bool:
+        self._ops = None
+        version = sqlDb.latestChangeVersion(sql)
+        sql.select(GList(sql.pRowId, sqlDb.fdSort) + list(fields), sqlDb.dbTableName)
+        rows = sql.cmdAppend(sql.orderByFrame(sql.pItemGap.join(GList(sqlDb.fdSort, sql.pRowId)))).fetchall()
+        if rows is None or version is None:
+            self._source, self._version = None, None
+            return False
+        self._source = self.sourceOf(sqlDb, fields, sql)
+        self._version = version
+        self._rows = {x[0]: tuple(x[2:]) for x in rows}
+        self._sorts = {x[0]: x[1] for x in rows}
+        self._order = [GTuple(x[1], x[0]) for x in rows]
+        self._reloaded += 1
+        return True
+
+    def patch(self, sqlDb: SqlDatabase, fields: List[DataField], sql: SqlComposer) -> bool:
+        if self._version is None or self._source != self.sourceOf(sqlDb, fields, sql):
+            return False
+        changes = sqlDb.fetchChangesSince(self._version, sql)
+        if changes is None:
+            return False
+        if isEmpty(changes):
+            return True
+        if changes[0][0] != self._version + int(1):
+            return False
+        if len(changes) > max(len(self._order), int(1)) * self.MaxPatchRatio:
+            return False
+        if any(x[1] == sqlDb.chReset for x in changes):
+            return False
+        rowIds = list(dict.fromkeys(x[2] for x in changes))
+        fetched = dict()
+        for i in range(0, len(rowIds), self.PatchChunkSize):
+            chunk = rowIds[i:i + self.PatchChunkSize]
+            sql.select(GList(sql.pRowId, sqlDb.fdSort) + list(fields), sqlDb.dbTableName)
+            rows = sql.where(sql.inFrame(sql.pRowId, [sql.bind(x) for x in chunk])).fetchall()
+            if rows is None:
+                return False
+            fetched.update((x[0], x) for x in rows)
+        for rowId in rowIds:
+            oldAt, newAt = self.discard(rowId), None
+            row = fetched.get(rowId)
+            if row is not None:
+                self._rows[rowId] = tuple(row[2:])
+                self._sorts[rowId] = row[1]
+                newAt = bisect_left(self._order, GTuple(row[1], rowId))
+                insort(self._order, GTuple(row[1], rowId))
+            if self._ops is not None and (oldAt is not None or newAt is not None):
+                self._ops.append(GTuple(rowId, oldAt, newAt))
+        self._version = changes[-1][0]
+        self._patched += 1
+        return True
+
+    def discard(self, rowId: int) -> Optional[int]:
+        sortKey = self._sorts.pop(rowId, None)
+        self._rows.pop(rowId, None)
+        if sortKey is None:
+            return None
+        i = bisect_left(self._order, GTuple(sortKey, rowId))
+        if i < len(self._order) and self._order[i] == GTuple(sortKey, rowId):
+            self._order.pop(i)
+            return i
+        return None
+
+    @staticmethod
+    def logKeyOf(sqlDb: SqlDatabase, sql: SqlComposer) -> LogKey:
+        return GTuple(SqlConnector.dbKey(sql.dbFilePath), sqlDb.dbChangeTableName)
+
+    def prune(self, sqlDb: SqlDatabase, sql: SqlComposer):
+        key = self.logKeyOf(sqlDb, sql)
+        with SqlTableSync._registry:
+            consumers = SqlTableSync._consumers.setdefault(key, weakref.WeakSet())
+            consumers.add(self)
+            horizon = min(x.version for x in consumers if x.version is not None)
+            self._pruned = SqlTableSync._prunedAt.get(key, int(0))
+            if horizon - self._pruned < sqlDb.dbChangeRetain:
+                return None
+            SqlTableSync._prunedAt[key] = horizon
+        sqlDb.pruneChangeLog(horizon, sql)
+        self._pruned = horizon
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        return dict(
+            rows=len(self._order), version=self._version, pruned=self._pruned,
+            patched=self._patched, reloaded=self._reloaded,
+        )
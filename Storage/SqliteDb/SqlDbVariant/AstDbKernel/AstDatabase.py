@@ -1,19 +1,154 @@
+import atexit
+import threading
+import time
 from abc import abstractmethod
-from typing import List, Self, Any, Dict
+from typing import List, Self, Any, Dict, Optional, Tuple
 
 from DeclarativeQt.Resource.FileTypes.RFileType import FilePath
-from DeclarativeQt.Resource.Grammars.RGrammar import Validate
+from DeclarativeQt.Resource.Grammars.RGrammar import Validate, GTuple
 from DeclarativeQt.Resource.Strings.RStr import NLIndex, RStr
 from DeclarativeQt.Storage.RStorage import RStorage
 from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlComposer import SqlComposer
+from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlConnector import SqlConnector
+from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlQueryCache import SqlQueryCache
 from DeclarativeQt.Storage.SqliteDb.SqlDbKernel.SqlDatabase import SqlDatabase, DBNaming, DataField, \
     FieldNLMap, FieldDefine
 from DeclarativeQt.Storage.SqliteDb.SqlDbKernel.SqlDbMethod import SqlTableData
 
 
+class AstHotCopy:
+    _registry = threading.Lock()
+    _copies: Dict[Tuple[str, DBNaming], "AstHotCopy"] = dict()
+    _wake = threading.Condition()
+    _due: Dict["AstHotCopy", float] = dict()
+    _flusher: Optional[threading.Thread] = None
+
+    def __init__(self, database: "AstDatabase"):
+        self._database = database
+        self._lock = threading.RLock()
+        self._flushLock = threading.Lock()
+        self._rows: Optional[List[Dict[DataField, Any]]] = None
+        self._version: int = int(-1)
+        self._dirty: Dict[DataField, Any] = dict()
+        self._flushing: Dict[DataField, Any] = dict()
+        self._atExit = False
+
+    @staticmethod
+    def shared(database: "AstDatabase") -> "AstHotCopy":
+        key = GTuple(SqlConnector.dbKey(database.dbFilePath), database.dbTableName)
+        with AstHotCopy._registry:
+            if key not in AstHotCopy._copies:
+                AstHotCopy._copies[key] = AstHotCopy(database)
+            return AstHotCopy._copies[key]
+
+    @property
+    def isLoaded(self) -> bool:
+        return self._rows is not None and self._version == SqlQueryCache.version(self._database.dbFilePath)
+
+    @property
+    def isDirty(self) -> bool:
+        return len(self._dirty) > 0 or len(self._flushing) > 0
+
+    def load(self, sql: SqlComposer = None) -> bool:
+        database = self._database
+        sql = Validate(sql, database.sql)
+        if not sql.isConnected():
+            return False
+        fields = database.dbParamFields
+        version = SqlQueryCache.version(database.dbFilePath)
+        data = sql.select(fields, database.dbTableName).cmdEnd().fetchall()
+        if data is None:
+            return False
+        with self._lock:
+            self._rows = [dict(zip(fields, x)) for x in data]
+            self._version = version
+            for row in self._rows:
+                row.update({**self._flushing, **self._dirty})
+        return True
+
+    def read(self, fields: List[DataField]) -> SqlTableData:
+        with self._lock:
+            return [tuple(row.get(x) for x in fields) for row in self._rows]
+
+    def write(self, **kwargs: Any):
+        with self._lock:
+            for row in self._rows:
+                row.update(kwargs)
+            self._dirty.update(kwargs)
+            if not self._atExit:
+                self._atExit = True
+                atexit.register(self.flush)
+        policy = self._database.dbFlushPolicy
+        if policy == AstDatabase.fpImmediate:
+            return self.flush()
+        if policy == AstDatabase.fpPeriodic:
+            self.schedule()
+        return None
+
+    def schedule(self):
+        with AstHotCopy._wake:
+            if self in AstHotCopy._due:
+                return None
+            AstHotCopy._due[self] = time.monotonic() + self._database.dbFlushMsec / 1e3
+            if AstHotCopy._flusher is None or not AstHotCopy._flusher.is_alive():
+                AstHotCopy._flusher = threading.Thread(target=AstHotCopy.flushLoop, name="AstFlusher", daemon=True)
+                AstHotCopy._flusher.start()
+            AstHotCopy._wake.notify()
+        return None
+
+    @staticmethod
+    def flushLoop():
+        while True:
+            with AstHotCopy._wake:
+                while not AstHotCopy._due:
+                    AstHotCopy._wake.wait()
+                hotCopy, due = min(AstHotCopy._due.items(), key=lambda a0: a0[1])
+                if due > time.monotonic():
+                    AstHotCopy._wake.wait(due - time.monotonic())
+                    continue
+                AstHotCopy._due.pop(hotCopy, None)
+            hotCopy.flush()
+
+    def flush(self) -> bool:
+        with self._flushLock:
+            with AstHotCopy._wake:
+                AstHotCopy._due.pop(self, None)
+            with self._lock:
+                dirty, self._dirty = self._dirty, dict()
+                self._flushing = dirty
+            if not dirty:
+                return True
+            database = self._database
+            with database.openSqlComposer() as sql:
+                done = sql.isConnected()
+                if done:
+                    with sql.transaction():
+                        values = database.bindSqlRowData(sql, **dirty)
+                        done = bool(sql.update(database.dbTableName, values=values).cmdEnd().commit())
+            with self._lock:
+                self._flushing = dict()
+                if not done:
+                    self._dirty = {**dirty, **self._dirty}
+            if not done:
+                RStr.log(f"failed to flush {list(dirty)} into {database.dbTableName}", RStr.lgWarn)
+            return done
+
+    def reset(self):
+        self.flush()
+        with self._lock:
+            self._rows = None
+        return None
+
+
 class AstDatabase(SqlDatabase):
     DbFileDirAt = RStorage().getDir(RStorage.dirAppSetting)
     fdAutoId: DataField = "id"
+    fpImmediate: str = "immediate"
+    fpPeriodic: str = "periodic"
+    fpOnExit: str = "on-exit"
+    dbHotCopy: bool = False
+    dbFlushPolicy: str = fpPeriodic
+    dbFlushMsec: int = int(1000)
 
     @property
     @abstractmethod
@@ -41,18 +176,41 @@ class AstDatabase(SqlDatabase):
     def updateAstParams(self, *args: Any, **kwargs: Any) -> Self:
         pass
 
+    @property
+    def astHotCopy(self) -> Optional[AstHotCopy]:
+        if not self.dbHotCopy:
+            return None
+        return AstHotCopy.shared(self)
+
+    def loadAstHotCopy(self, sql: SqlComposer = None) -> bool:
+        hotCopy = self.astHotCopy
+        return hotCopy is not None and (hotCopy.isLoaded or hotCopy.load(sql))
+
+    def flushAstParams(self) -> bool:
+        hotCopy = self.astHotCopy
+        return True if hotCopy is None else hotCopy.flush()
+
     def fecthAstTableData(self, sql: SqlComposer = None) -> SqlTableData:
+        if self.loadAstHotCopy(sql):
+            return self.astHotCopy.read(self.dbParamFields)
         sql = Validate(sql, self.sql)
         if not sql.isConnected():
             return None
         return sql.select(self.dbParamFields, self.dbTableName).cmdEnd().fetchall()
 
     def updateAstTableData(self, sql: SqlComposer = None, **kwargs: Any) -> Self:
+        if self.loadAstHotCopy(sql):
+            self.astHotCopy.write(**kwargs)
+            return self
         sql = Validate(sql, self.sql)
         if not sql.isConnected():
             return None
-        kwargs = self.standardSqlRowData(sql=sql, **kwargs)
-        sql.update(self.dbTableName, values=kwargs).cmdEnd().commit()
+        sql.update(self.dbTableName, values=self.bindSqlRowData(sql=sql, **kwargs)).cmdEnd().commit()
+        return self
+
+    def flushSqlCopies(self) -> Self:
+        if self.astHotCopy is not None:
+            self.astHotCopy.reset()
         return self
 
     @property
@@ -1,6 +1,9 @@
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Sequence
+
+import numpy as np
 
 from DeclarativeQt.Resource.Grammars.RGrammar import Validate, isEmpty, isValid
+from DeclarativeQt.Resource.PhyMetrics.PhyMtrBase.PhyMtrBase import PhyMeasure
 from DeclarativeQt.Resource.PhyMetrics.RPhyMetric import Measurements, MeasureUnit
 from DeclarativeQt.Storage.SqliteDb.SqlDbKernel.SqlDatabase import DataField
 from DeclarativeQt.Storage.SqliteDb.SqlDbKernel.SqlDbMethod import SqlDbMethod, DataTranslator, \
@@ -15,7 +18,6 @@ class PhyDbMethod(SqlDbMethod):
             readyData: SqlTableData = None,
             appUnits: Dict[str, MeasureUnit] = None, translator: DataTranslator = None,
     ) -> SqlTableData:
-        converted = list()
         dbQuantity = phyDb.fieldPhysicalQuantity
         dbMeasure = phyDb.fieldMeasureUnits
         appMeasure = Validate(appUnits, dict())
@@ -25,18 +27,24 @@ class PhyDbMethod(SqlDbMethod):
         data = readyData if isValid(readyData) else simpleFetch(phyDb, fields, translator=translator)
         if isEmpty(data):
             return None
-        for row in data.copy():
-            rowData: List[Any] = list(row)
-            for i, item in enumerate(rowData):
-                if item is None:
-                    continue
-                field = fields[i]
-                if field in dbQuantity and dbQuantity[field] in appMeasure:
-                    dbUnit = dbMeasure[field]
-                    appUnit = appMeasure[dbQuantity[field]]
-                    measurement = measurements[dbUnit]
-                    rowData[i] = measurement.conversion(item, dbUnit, appUnit)
-            converted.append(tuple(rowData))
+        columns = PhyDbMethod.tableColumns(data, len(fields))
+        for i, field in enumerate(fields):
+            if field in dbQuantity and dbQuantity[field] in appMeasure:
+                dbUnit = dbMeasure[field]
+                appUnit = appMeasure[dbQuantity[field]]
+                measurement = measurements[dbUnit]
+                columns[i] = PhyDbMethod.convertColumn(columns[i], measurement, dbUnit, appUnit)
+        return list(zip(*columns))
+
+    @staticmethod
+    def convertColumn(column: Sequence, measurement: PhyMeasure, origin: MeasureUnit, target: MeasureUnit) -> List:
+        try:
+            values = np.array(column, dtype=np.float64)
+        except (TypeError, ValueError):
+            return [measurement.conversion(x, origin, target) for x in column]
+        converted = measurement.vectorConversion(values, origin, target).tolist()
+        for i in np.flatnonzero(np.isnan(values)):
+            converted[i] = column[i]
         return converted
 
     @staticmethod
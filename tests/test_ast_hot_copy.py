@@ -0,0 +1,65 @@
+import os
+import threading
+import time
+
+from DeclarativeQt.Resource.FileTypes.RFileType import FilePath
+from DeclarativeQt.Storage.SqliteDb.SqlBench.SqlBenchSuite import BenchAstDatabase
+from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlComposer import SqlComposer
+from DeclarativeQt.Storage.SqliteDb.SqlDbKernel.SqlDbMethod import SqlDbMethod
+
+
+class HotAstDatabase(BenchAstDatabase):
+    dbHotCopy = True
+    dbFlushMsec = int(20)
+
+    def __init__(self, dbFilePath: FilePath, rebuild: bool = True):
+        self._dbFilePath = dbFilePath
+        self._sql = SqlComposer(dbFilePath)
+        if rebuild:
+            self.rebuildSqlTable().initAstParams()
+
+
+def storedTheme(dbFilePath: FilePath):
+    with SqlComposer(dbFilePath) as sql:
+        return sql.cmdAppend("select theme from settings;").fetchall()
+
+
+def waitFlushed(db: HotAstDatabase):
+    deadline = time.monotonic() + 5
+    while db.astHotCopy.isDirty and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return not db.astHotCopy.isDirty
+
+
+def test_instances_on_one_file_share_the_copy(tmp_path):
+    dbFilePath = os.path.join(tmp_path, "ast.db")
+    first, second = HotAstDatabase(dbFilePath), HotAstDatabase(dbFilePath, rebuild=False)
+    assert first.astHotCopy is second.astHotCopy
+    assert second.fetchAstParams()["theme"] == "light"
+    first.updateAstParams(theme="dark")
+    assert second.fetchAstParams()["theme"] == "dark"
+    assert waitFlushed(first)
+    assert storedTheme(dbFilePath) == [("dark",)]
+
+
+def test_one_flusher_serves_every_copy(tmp_path):
+    databases = [HotAstDatabase(os.path.join(tmp_path, f"ast{i}.db")) for i in range(3)]
+    for burst in range(3):
+        for db in databases:
+            db.updateAstParams(scale=float(burst))
+        assert all(waitFlushed(db) for db in databases)
+    assert len([x for x in threading.enumerate() if x.name == "AstFlusher"]) == 1
+    assert all(db.fetchAstParams()["scale"] == 2.0 for db in databases)
+
+
+def test_other_write_paths_reset_the_copy(tmp_path):
+    dbFilePath = os.path.join(tmp_path, "ast.db")
+    db = HotAstDatabase(dbFilePath)
+    db.updateAstParams(theme="dark")
+    SqlDbMethod.deleteDataRow(db, {db.fdTheme: "dark"})
+    assert db.fetchAstParams() is None
+    db.initAstParams()
+    assert db.fetchAstParams()["theme"] == "light"
+    with SqlComposer(dbFilePath) as sql:
+        sql.cmdAppend("update settings set theme = 'raw';").commit()
+    assert db.fetchAstParams()["theme"] == "raw"
@@ -0,0 +1,202 @@
+import gc
+import weakref
+
+import pytest
+from PyQt5 import sip
+from PyQt5.QtCore import QObject
+
+from DeclarativeQt.DqtCore.DqtBase import Remember, ReferState, RCell, ChangePolicy, RList
+
+
+def test_slot_reads_derived_state_during_emit():
+    a = Remember(1)
+    b = ReferState(a, referExp=lambda x: x + 1)
+    seen = list()
+    a.connect(lambda v: seen.append(b.value()))
+    a.setValue(5)
+    assert seen == [6]
+    assert b.value() == 6
+
+
+def test_slot_reads_chained_state_during_emit():
+    a = Remember(1)
+    b = ReferState(a, referExp=lambda x: x + 1)
+    c = ReferState(b, referExp=lambda x: x * 10)
+    seen, counts = list(), [0]
+    c.connect(lambda v: counts.__setitem__(0, counts[0] + 1))
+    a.connect(lambda v: seen.append(c.value()))
+    a.setValue(5)
+    assert seen == [60]
+    assert c.value() == 60
+    assert counts[0] == 1
+
+
+def test_sensitive_cell_bridges_both_ways():
+    cell = RCell(1, sensitive=True)
+    bridge = cell.asRemember()
+    cell.setValue(2)
+    assert bridge.value() == 2
+    bridge.setValue(3)
+    assert cell.value() == 3
+    assert cell.asRemember() is bridge
+
+
+def test_label_follows_cell_text(qapp):
+    from DeclarativeQt.DqtUI.DqtMaven.Labels.BaseLabel.Label import Label
+    text = RCell("before")
+    label = Label(text=text)
+    assert label.text() == "before"
+    text.setValue("after")
+    assert label.text() == "after"
+
+
+def test_hashed_policy_compares_equal_hashes():
+    assert hash(-1) == hash(-2)
+    assert ChangePolicy.hashed(-1, -2)
+    assert not ChangePolicy.hashed((1, "a"), (1, "a"))
+    a = Remember(-1, compare=ChangePolicy.hashed)
+    seen = list()
+    a.connect(lambda v: seen.append(v))
+    a.setValue(-2)
+    a.setValue(-2)
+    assert seen == [-2]
+
+
+def test_lazy_state_recomputes_on_pull():
+    calls = list()
+    a = Remember(1)
+    b = ReferState(a, referExp=lambda x: calls.append(x) or x * 10, lazy=True)
+    assert calls == list() and b.value() == 10
+    calls.clear()
+    invalidated = list()
+    b.invalidated.connect(lambda: invalidated.append(True))
+    a.setValue(2)
+    a.setValue(3)
+    assert calls == list() and b.isStale()
+    assert invalidated == [True]
+    assert b.value() == 30
+    assert b.value() == 30
+    assert calls == [3] and not b.isStale()
+
+
+def test_eager_state_pulls_lazy_source():
+    a = Remember(1)
+    b = ReferState(a, referExp=lambda x: x + 1, lazy=True)
+    c = ReferState(b, referExp=lambda x: x * 2)
+    assert c.value() == 4
+    a.setValue(5)
+    assert c.value() == 12
+    assert not b.isStale()
+
+
+@pytest.mark.parametrize("stateClass", [Remember, RCell])
+def test_disconnecting_host_releases_its_destroyed_hook(qapp, stateClass):
+    state = stateClass(0)
+    host = QObject()
+    seen = list()
+    state.connect(lambda v: seen.append(v), host=host)
+    hostRef = weakref.ref(host)
+    assert state.disconnect(host=host) == 1
+    del host
+    gc.collect()
+    assert hostRef() is None
+    state.setValue(1)
+    assert seen == list()
+
+
+@pytest.mark.parametrize("stateClass", [Remember, RCell])
+def test_deleted_host_releases_its_slots(qapp, stateClass):
+    state = stateClass(0)
+    host = QObject()
+    seen = list()
+    state.connect(lambda v: seen.append(v), host=host)
+    sip.delete(host)
+    state.setValue(1)
+    assert seen == list()
+    assert state.hookedHosts() == list()
+
+
+@pytest.mark.parametrize("stateClass", [Remember, RCell])
+def test_collecting_a_bound_widget_cycle_is_safe(qapp, stateClass):
+    from DeclarativeQt.DqtUI.DqtMaven.Labels.BaseLabel.Label import Label
+    for _ in range(3):
+        text = stateClass("text")
+        label = Label(text=text)
+        text.setValue("next")
+        del text, label
+        gc.collect()
+
+
+def test_style_editor_keeps_cell_styles_valid(qapp):
+    from DeclarativeQt.DqtUI.DqtMaven.Buttons.BorderedButton import ButtonStyle
+    cell = RCell("#123456")
+    style = ButtonStyle(borderColor=cell)
+    assert Remember.isState(style.styles[ButtonStyle.borderColor])
+    cell.setValue(None)
+    assert style.getStyle(ButtonStyle.borderColor) == "#123456"
+    cell.setValue("#ffffff")
+    assert style.getStyle(ButtonStyle.borderColor) == "#ffffff"
+
+
+def test_batch_emits_each_state_once_at_outer_exit():
+    a, b = Remember(1), Remember("x")
+    total = ReferState(a, b, referExp=lambda x, y: f"{x}{y}")
+    seen, totals = list(), list()
+    a.connect(lambda v: seen.append(("a", v)))
+    b.connect(lambda v: seen.append(("b", v)))
+    total.connect(lambda v: totals.append(v))
+    with Remember.batch():
+        a.setValue(2)
+        with Remember.batch():
+            a.setValue(3)
+            b.setValue("y")
+        assert seen == list() and a.value() == 3
+        b.setValue("x")
+    assert seen == [("a", 3)]
+    assert totals == ["3x"]
+
+
+def test_batch_flushes_when_block_raises():
+    a = Remember(1)
+    seen = list()
+    a.connect(lambda v: seen.append(v))
+    with pytest.raises(ValueError):
+        with Remember.batch():
+            a.setValue(2)
+            raise ValueError
+    assert seen == [2]
+    assert not Remember.isBatching()
+
+
+def test_rlist_emits_granular_diffs_before_changed():
+    rows = RList([1, 2, 3])
+    seen = list()
+    rows.diffConnect(
+        onReset=lambda v: seen.append(("reset", v)), onInserted=lambda i, n: seen.append(("inserted", i, n)),
+        onRemoved=lambda i, n: seen.append(("removed", i, n)), onMoved=lambda a, b: seen.append(("moved", a, b)),
+        onItemChanged=lambda i: seen.append(("item", i)),
+    )
+    rows.connect(lambda v: seen.append(("changed", list(v))))
+    rows.append(4, 5)
+    rows.remove(0)
+    rows.move(0, -1)
+    rows.setItem(1, 9)
+    assert seen == [
+        ("inserted", 3, 2), ("changed", [1, 2, 3, 4, 5]), ("removed", 0, 1), ("changed", [2, 3, 4, 5]),
+        ("moved", 0, 3), ("changed", [3, 4, 5, 2]), ("item", 1), ("changed", [3, 9, 5, 2]),
+    ]
+    seen.clear()
+    rows.setValue([0])
+    assert seen == [("reset", [0]), ("changed", [0])]
+
+
+def test_rlist_batched_edits_do_not_reset():
+    rows = RList([1, 2])
+    seen = list()
+    rows.diffConnect(onReset=lambda v: seen.append("reset"), onInserted=lambda i, n: seen.append("inserted"))
+    rows.connect(lambda v: seen.append("changed"))
+    with Remember.batch():
+        rows.append(3)
+        rows.append(4)
+    assert seen == ["inserted", "inserted", "changed"]
+    assert rows.value() == [1, 2, 3, 4]
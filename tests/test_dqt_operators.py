@@ -0,0 +1,70 @@
+import time
+
+from DeclarativeQt.DqtCore.DqtBase import Remember, ReferScheduler
+
+
+def spin(qapp, msec: int):
+    deadline = time.monotonic() + msec / 1e3
+    while time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.001)
+
+
+def recorder(state: Remember) -> list:
+    seen = list()
+    state.connect(lambda v: seen.append(v))
+    return seen
+
+
+def test_debounce_delivers_last_value_after_quiet_period(qapp):
+    source = Remember(0)
+    derived = source.debounce(30)
+    seen = recorder(derived)
+    for i in range(1, 6):
+        source.setValue(i)
+        spin(qapp, 5)
+    assert seen == list()
+    spin(qapp, 80)
+    assert seen == [5]
+
+
+def test_throttle_passes_leading_and_trailing_values(qapp):
+    source = Remember(0)
+    derived = source.throttle(40)
+    seen = recorder(derived)
+    for i in range(1, 5):
+        source.setValue(i)
+    assert seen == [1]
+    spin(qapp, 100)
+    assert seen == [1, 4]
+
+
+def test_frame_sampling_coalesces_a_burst(qapp):
+    source = Remember(0)
+    derived = source.sampleOnFrame()
+    seen = recorder(derived)
+    for i in range(1, 50):
+        source.setValue(i)
+    spin(qapp, ReferScheduler.FrameMsec * 4)
+    assert seen == [49]
+
+
+def test_distinct_uses_the_given_comparison(qapp):
+    source = Remember(0.0)
+    derived = source.distinctUntilChanged(lambda a, b: a is None or round(a) != round(b))
+    seen = recorder(derived)
+    for value in (0.2, 0.4, 1.1, 1.3, 0.9, 2.0):
+        source.setValue(value)
+    assert seen == [1.1, 2.0]
+
+
+def test_timed_operators_share_one_scheduler(qapp):
+    sources = [Remember(0) for _ in range(3)]
+    derived = [x.debounce(20) for x in sources]
+    for i, source in enumerate(sources):
+        source.setValue(i + 1)
+    scheduler = ReferScheduler.shared()
+    assert all(scheduler.isScheduled(x) for x in derived)
+    spin(qapp, 60)
+    assert [x.value() for x in derived] == [1, 2, 3]
+    assert not any(scheduler.isScheduled(x) for x in derived)
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from DeclarativeQt.Resource.PhyMetrics.PhyMtrBase.PhyMtrBase import PhyMeasure, LengthMeasure, TemperatureMeasure
+from DeclarativeQt.Storage.SqliteDb.SqlDbVariant.PhyDbKernel.PhyDbMethod import PhyDbMethod
+
+
+def test_vector_round_matches_decimal_round():
+    rng = np.random.default_rng(19)
+    scale = 10.0 ** PhyMeasure.DecimalPrecision
+    ties = (np.arange(-2000, 2000) + 0.5) / scale
+    values = np.concatenate([
+        rng.uniform(-100, 100, 20000), rng.uniform(-1, 1, 20000), ties, [0.0, -0.0, 63.99999, 64.0, 1e6],
+    ])
+    expected = [PhyMeasure.decimalRound(float(x)) for x in values]
+    assert PhyMeasure.vectorRound(values).tolist() == expected
+
+
+@pytest.mark.parametrize("measure, origin, target", [
+    (LengthMeasure, LengthMeasure.inch, LengthMeasure.cm),
+    (LengthMeasure, LengthMeasure.km, LengthMeasure.foot),
+    (TemperatureMeasure, TemperatureMeasure.Celsius, TemperatureMeasure.Fahrenheit),
+    (TemperatureMeasure, TemperatureMeasure.Fahrenheit, TemperatureMeasure.Celsius),
+])
+def test_vector_conversion_matches_scalar_conversion(measure, origin, target):
+    values = np.random.default_rng(7).uniform(-500, 500, 5000)
+    expected = [measure.conversion(float(x), origin, target) for x in values]
+    assert measure.vectorConversion(values, origin, target).tolist() == expected
+
+
+def test_convert_column_keeps_missing_cells():
+    inch, cm = LengthMeasure.inch, LengthMeasure.cm
+    assert PhyDbMethod.convertColumn([1.0, None, 2.5], LengthMeasure, inch, cm) == [2.54, None, 6.35]
+    assert PhyDbMethod.convertColumn([None, None], LengthMeasure, inch, cm) == [None, None]
@@ -0,0 +1,60 @@
+import json
+import os
+
+import pytest
+
+from DeclarativeQt.DqtCore.DqtBase import Remember, ReferState, ReferTracer
+
+
+@pytest.fixture
+def tracer():
+    ReferTracer.reset()
+    yield ReferTracer
+    ReferTracer.disable()
+    ReferTracer.reset()
+
+
+def namedGraph():
+    source = Remember(1)
+    source.setObjectName("source")
+    double = ReferState(source, referExp=lambda x: x * 2)
+    double.setObjectName("double")
+    label = ReferState(double, referExp=lambda x: f"v{x}")
+    label.setObjectName("label")
+    return source, double, label
+
+
+def test_trace_counts_emits_and_recomputes_by_name(tracer):
+    source, double, label = namedGraph()
+    with ReferTracer.trace():
+        for i in range(3):
+            source.setValue(i + 2)
+    assert not ReferTracer.tracing
+    states = {x["state"]: x for x in ReferTracer.report()["states"]}
+    assert states["source"]["emits"] == 3
+    assert states["double"]["recomputes"] == 3
+    assert states["label"]["recomputes"] == 3
+    assert ReferTracer.report()["maxDepth"] >= 2
+    assert label.value() == "v8"
+
+
+def test_disabled_tracer_records_nothing(tracer):
+    source, _, _ = namedGraph()
+    source.setValue(5)
+    assert ReferTracer.report()["states"] == list()
+    assert ReferTracer.folded() == str()
+
+
+def test_dump_writes_json_and_folded_stacks(tmp_path, tracer):
+    source, _, _ = namedGraph()
+    with ReferTracer.trace():
+        source.setValue(3)
+    jsonPath, foldedPath = os.path.join(tmp_path, "trace.json"), os.path.join(tmp_path, "trace.folded")
+    ReferTracer.dump(jsonPath)
+    ReferTracer.dump(foldedPath, ReferTracer.fmtFolded)
+    with open(jsonPath, encoding="utf-8") as file:
+        assert json.load(file)["totalEmits"] == ReferTracer.report()["totalEmits"]
+    with open(foldedPath, encoding="utf-8") as file:
+        lines = file.read().splitlines()
+    assert lines and all(x.rsplit(" ", 1)[-1].isdigit() for x in lines)
+    assert any(x.startswith("source:emit") for x in lines)
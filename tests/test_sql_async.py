@@ -0,0 +1,56 @@
+import inspect
+import threading
+
+import pytest
+
+from DeclarativeQt.DqtUI.DqtMaven.TableViews.DatabaseViewer.ManusDbViewer import ManusDbViewer
+from DeclarativeQt.DqtUI.DqtMaven.TableViews.DatabaseViewer.SqliteDbViewer import SqliteDbViewer
+from DeclarativeQt.Storage.SqliteDb.SqlAsync.SqlAsyncExecutor import SqlAsyncExecutor, SqlAsyncQuery
+
+
+@pytest.fixture
+def executor():
+    executor = SqlAsyncExecutor(maxWorkers=1)
+    yield executor
+    executor.shutdown()
+
+
+def waitFor(qapp, future):
+    try:
+        future.result(timeout=5)
+    except Exception:
+        pass
+    qapp.processEvents()
+
+
+def test_newer_request_supersedes_older(qapp, executor):
+    query = SqlAsyncQuery(executor, initial="initial")
+    gate = threading.Event()
+    first = query.request(lambda: gate.wait(5) and "first")
+    queued = query.request(lambda: "queued")
+    last = query.request(lambda: "last")
+    assert queued.cancelled()
+    assert query.pending.value()
+    gate.set()
+    waitFor(qapp, first)
+    waitFor(qapp, last)
+    assert query.result.value() == "last"
+    assert not query.pending.value()
+
+
+def test_error_is_delivered_without_touching_result(qapp, executor):
+    query = SqlAsyncQuery(executor, initial="initial")
+    waitFor(qapp, query.request(lambda: 1 // 0))
+    assert isinstance(query.error.value(), ZeroDivisionError)
+    assert query.result.value() == "initial"
+    assert not query.pending.value()
+    waitFor(qapp, query.request(lambda: "ok"))
+    assert query.error.value() is None
+    assert query.result.value() == "ok"
+
+
+@pytest.mark.parametrize("viewer", [SqliteDbViewer, ManusDbViewer])
+def test_viewer_fetch_options_come_last(viewer):
+    names = list(inspect.signature(viewer).parameters)
+    assert names[names.index("fetchDataMethod") + 1] == "language"
+    assert names[-3:] == ["lazyFetch", "asyncFetch", "syncFetch"]
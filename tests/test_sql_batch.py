@@ -0,0 +1,69 @@
+import os
+
+from DeclarativeQt.Storage.SqliteDb.SqlBench.SqlBench import SqlBench, BenchDatabase
+from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlComposer import SqlComposer
+from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlQueryCache import SqlQueryCache
+from DeclarativeQt.Storage.SqliteDb.SqlDbKernel.SqlDbMethod import SqlDbMethod
+
+
+def benchDb(tmp_path, count: int) -> BenchDatabase:
+    db = BenchDatabase(os.path.join(tmp_path, "batch.db"))
+    db.rebuildSqlTable()
+    db.insertSqlRows(SqlBench.benchRows(count))
+    return db
+
+
+def rowsOf(db: BenchDatabase) -> list:
+    return SqlDbMethod.fetchSqlTable(db, fields=[db.fdName, db.fdValue, db.fdSort])
+
+
+def test_bulk_insert_lands_as_one_block(tmp_path):
+    db = benchDb(tmp_path, 5)
+    version = SqlQueryCache.version(db.dbFilePath)
+    report = db.insertSqlRows(SqlBench.benchRows(3, "bulk"), order=2)
+    assert report["rows"] == 3
+    assert SqlQueryCache.version(db.dbFilePath) == version + 1
+    names = [x[0] for x in rowsOf(db)]
+    assert names == ["row0", "row1", "bulk0", "bulk1", "bulk2", "row2", "row3", "row4"]
+    assert [x[-1] for x in rowsOf(db)] == list(range(db.minValidOrder(), db.minValidOrder() + 8))
+
+
+def test_bulk_update_groups_rows_by_fields(tmp_path):
+    db = benchDb(tmp_path, 4)
+    report = db.updateSqlRows([
+        {db.fdName: "row0", db.fdValue: 9.0},
+        {db.fdName: "row1", db.fdValue: 8.0, db.fdNote: "n"},
+        {db.fdName: "row2", db.fdValue: 7.0},
+        {db.fdValue: 1.0},
+    ])
+    assert report["rows"] == 3
+    assert [x[1] for x in rowsOf(db)] == [9.0, 8.0, 7.0, 1.5]
+
+
+def test_failed_batch_inserts_nothing(tmp_path):
+    db = benchDb(tmp_path, 3)
+    rows = SqlBench.benchRows(2, "new") + SqlBench.benchRows(1)
+    db.insertSqlRows(rows)
+    assert [x[0] for x in rowsOf(db)] == ["row0", "row1", "row2"]
+
+
+def test_failed_executemany_keeps_earlier_rows(tmp_path):
+    dbFilePath = os.path.join(tmp_path, "many.db")
+    with SqlComposer(dbFilePath) as sql:
+        sql.cmdAppend("create table t (id integer primary key);").commit()
+        version = SqlQueryCache.version(dbFilePath)
+        sql.cmdAppend("insert into t values (0);").commit()
+        assert sql.cmdAppend("insert into t values (?);").executemany([[1], [2]]) == 2
+        assert sql.cmdAppend("insert into t values (?);").executemany([[3], [1]]) is None
+        assert SqlQueryCache.version(dbFilePath) == version + 2
+    with SqlComposer(dbFilePath) as sql:
+        assert sql.cmdAppend("select id from t;").fetchall() == [(0,), (1,), (2,)]
+
+
+def test_update_of_missing_key_does_not_invalidate(tmp_path):
+    db = benchDb(tmp_path, 2)
+    version = SqlQueryCache.version(db.dbFilePath)
+    db.updateSqlRowData(key="missing", value=1.0)
+    assert SqlQueryCache.version(db.dbFilePath) == version
+    db.updateSqlRowData(key="row0", value=1.0)
+    assert SqlQueryCache.version(db.dbFilePath) == version + 1
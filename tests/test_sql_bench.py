@@ -0,0 +1,29 @@
+import os
+import tempfile
+
+from DeclarativeQt.Storage.SqliteDb.SqlBench.SqlBench import SqlBench
+from DeclarativeQt.Storage.SqliteDb.SqlBench.SqlBenchSuite import SqlBenchSuite
+
+
+def test_bench_runs_leave_no_temp_dirs(tmp_path, monkeypatch):
+    scratch = tmp_path / "scratch"
+    scratch.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(scratch))
+    report = SqlBenchSuite.run([200])
+    assert {"insert", "update", "reorder", "delete", "fetch", "astRead"} <= set(report["results"]["200"])
+    assert SqlBench.bulkWrite(50)["rows"] == 50
+    assert os.listdir(scratch) == list()
+
+
+def test_bench_size_uses_the_given_work_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "mkdtemp", lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError))
+    SqlBenchSuite.benchSize(200, workDir=str(tmp_path))
+    assert {"settings200.db", "table200.db"} <= set(os.listdir(tmp_path))
+
+
+def test_compare_flags_only_regressions_past_threshold():
+    baseline = dict(results={"200": dict(insert=dict(opsPerSec=100.0), fetch=dict(p50Ms=1.0))})
+    report = dict(results={"200": dict(insert=dict(opsPerSec=95.0), fetch=dict(p50Ms=2.0))})
+    assert SqlBenchSuite.compare(report, baseline, 0.1) == [
+        dict(size="200", op="fetch", metric="p50Ms", change=1.0)
+    ]
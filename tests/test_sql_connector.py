@@ -0,0 +1,79 @@
+import os
+import threading
+
+from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlComposer import SqlComposer
+from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlConnector import SqlConnector
+
+
+def test_sweep_closes_connections_of_finished_threads(tmp_path):
+    dbFilePath = os.path.join(tmp_path, "pool.db")
+    SqlConnector.closeAll()
+    together = threading.Barrier(3)
+
+    def work():
+        with SqlComposer(dbFilePath) as sql:
+            sql.cmdAppend("select 1;").fetchall()
+            together.wait(5)
+
+    threads = [threading.Thread(target=work) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    closed = SqlConnector.stats()["closed"]
+    assert SqlConnector.sweepIdle() == 3
+    assert SqlConnector.stats()["closed"] == closed + 3
+    assert SqlConnector.stats()["idle"] == 0
+
+
+def test_close_all_closes_other_thread_connections(tmp_path):
+    dbFilePath = os.path.join(tmp_path, "pool.db")
+    SqlConnector.closeAll()
+    hold, done = threading.Event(), threading.Event()
+
+    def work():
+        with SqlComposer(dbFilePath) as sql:
+            sql.cmdAppend("select 1;").fetchall()
+        hold.set()
+        done.wait()
+
+    thread = threading.Thread(target=work)
+    thread.start()
+    hold.wait()
+    try:
+        closed = SqlConnector.stats()["closed"]
+        assert SqlConnector.closeAll(dbFilePath) == 1
+        assert SqlConnector.stats()["closed"] == closed + 1
+    finally:
+        done.set()
+        thread.join()
+
+
+def test_plain_composer_applies_no_pragmas(tmp_path):
+    dbFilePath = os.path.join(tmp_path, "plain.db")
+    with SqlComposer(dbFilePath) as sql:
+        sql.cmdAppend("create table t (x integer);").commit()
+        assert sql.cmdAppend("pragma journal_mode;").fetchall() == [("delete",)]
+        assert sql.cmdAppend("pragma synchronous;").fetchall() == [(2,)]
+    assert not os.path.exists(dbFilePath + "-wal")
+    SqlConnector.setPragmas(dbFilePath, dict(journal_mode="wal"))
+    with SqlComposer(dbFilePath) as sql:
+        assert sql.cmdAppend("pragma journal_mode;").fetchall() == [("wal",)]
+    SqlConnector.closeAll(dbFilePath)
+
+
+def test_acquire_sweeps_at_most_once_per_interval(tmp_path, monkeypatch):
+    dbFilePath = os.path.join(tmp_path, "sweep.db")
+    sweeps = list()
+    sweepIdle = SqlConnector.sweepIdle
+    monkeypatch.setattr(SqlConnector, "sweepIdle", staticmethod(lambda *args: sweeps.append(1) or sweepIdle(*args)))
+    monkeypatch.setattr(SqlConnector, "_sweptAt", float(0.0))
+    for _ in range(20):
+        with SqlComposer(dbFilePath) as sql:
+            sql.cmdAppend("select 1;").fetchall()
+    assert len(sweeps) == 1
+    monkeypatch.setattr(SqlConnector, "_sweptAt", float(0.0))
+    with SqlComposer(dbFilePath) as sql:
+        sql.cmdAppend("select 1;").fetchall()
+    assert len(sweeps) == 2
+    SqlConnector.closeAll(dbFilePath)
@@ -0,0 +1,95 @@
+import os
+
+import pytest
+
+from DeclarativeQt.Storage.SqliteDb.SqlBench.SqlBench import SqlBench, BenchDatabase
+from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlConnector import SqlConnector
+from DeclarativeQt.Storage.SqliteDb.SqlDbKernel.SqlDbMethod import SqlDbMethod
+
+
+class GapDatabase(BenchDatabase):
+    dbOrdering = BenchDatabase.odGap
+
+
+def names(db: BenchDatabase) -> list:
+    return [x[0] for x in SqlDbMethod.fetchSqlTable(db, fields=[db.fdName])]
+
+
+@pytest.mark.parametrize("dbClass", [BenchDatabase, GapDatabase])
+def test_unique_key_values_are_bound(tmp_path, dbClass):
+    db = dbClass(os.path.join(tmp_path, "method.db"))
+    db.rebuildSqlTable()
+    db.insertSqlRows(SqlBench.benchRows(10))
+    db.insertSqlRowData(order=5, name="o'brien", value=0.0, note="n")
+    SqlDbMethod.rearrangeDataOrder(db, {db.fdName: "o'brien"}, 0)
+    assert names(db)[:2] == ["o'brien", "row0"]
+    SqlDbMethod.rearrangeDataOrder(db, {db.fdName: "o'brien", db.fdNote: "n"}, 8)
+    assert names(db)[8] == "o'brien"
+    SqlDbMethod.deleteDataRow(db, {db.fdName: "o'brien"})
+    assert names(db) == [f"row{i}" for i in range(10)]
+    SqlDbMethod.deleteDataRow(db, {db.fdName: "x' or '1' = '1"})
+    assert len(names(db)) == 10
+    if not db.isGapOrdering:
+        orders = [x[-1] for x in SqlDbMethod.fetchSqlTable(db, fields=[db.fdName, db.fdSort])]
+        assert orders == list(range(db.minValidOrder(), db.minValidOrder() + 10))
+
+
+def test_exhausted_gap_renormalizes_with_integer_keys(tmp_path):
+    db = GapDatabase(os.path.join(tmp_path, "gap.db"))
+    db.rebuildSqlTable()
+    db.insertSqlRows(SqlBench.benchRows(5))
+    for i in range(16):
+        db.insertSqlRowData(order=1, name=f"new{i}", value=0.0, note="n")
+    orders = [x[-1] for x in SqlDbMethod.fetchSqlTable(db, fields=[db.fdName, db.fdSort])]
+    assert all(type(x) is int for x in orders)
+    assert orders == sorted(set(orders))
+    assert names(db) == ["row0"] + [f"new{i}" for i in reversed(range(16))] + [f"row{i}" for i in range(1, 5)]
+    db.insertSqlRows([dict(name=f"bulk{i}", value=0.0, note="n") for i in range(db.orderGap)], order=1)
+    orders = [x[-1] for x in SqlDbMethod.fetchSqlTable(db, fields=[db.fdName, db.fdSort])]
+    assert all(type(x) is int for x in orders) and orders == sorted(set(orders))
+    assert names(db)[:3] == ["row0", "bulk0", "bulk1"]
+
+
+def test_unique_key_accepts_quoted_literals(tmp_path):
+    db = BenchDatabase(os.path.join(tmp_path, "quoted.db"))
+    db.rebuildSqlTable()
+    db.insertSqlRows(SqlBench.benchRows(5))
+    db.insertSqlRowData(name="it's", value=0.0, note="n")
+    SqlDbMethod.rearrangeDataOrder(db, db.standardSqlRowData(name="row3"), 0)
+    assert names(db)[0] == "row3"
+    SqlDbMethod.deleteDataRow(db, {db.fdName: "'it''s'"})
+    SqlDbMethod.deleteDataRow(db, db.standardSqlRowData(name="row1"))
+    assert names(db) == ["row3", "row0", "row2", "row4"]
+
+
+def test_stream_yields_chunks_and_releases_the_connection(tmp_path):
+    db = BenchDatabase(os.path.join(tmp_path, "stream.db"))
+    db.rebuildSqlTable()
+    db.insertSqlRows(SqlBench.benchRows(25))
+    fields = [db.fdName, db.fdNote]
+    translator = {db.fdNote: {"note 3": "three"}}
+    chunks = list(SqlDbMethod.streamSqlTable(db, fields=fields, translator=translator, chunkSize=10))
+    assert [len(x) for x in chunks] == [10, 10, 5]
+    assert [x for chunk in chunks for x in chunk] == SqlDbMethod.fetchSqlTable(db, fields, translator=translator)
+    assert chunks[0][3] == ("row3", "three")
+    stream = SqlDbMethod.streamSqlTable(db, chunkSize=10)
+    next(stream)
+    idle = SqlConnector.stats()["idle"]
+    stream.close()
+    assert SqlConnector.stats()["idle"] == idle + 1
+
+
+@pytest.mark.parametrize("dbClass", [BenchDatabase, GapDatabase])
+def test_keyset_pages_walk_the_table_in_order(tmp_path, dbClass):
+    db = dbClass(os.path.join(tmp_path, "page.db"))
+    db.rebuildSqlTable()
+    db.insertSqlRows(SqlBench.benchRows(23))
+    pages, afterSort = list(), None
+    while True:
+        page, afterSort = SqlDbMethod.fetchPage(db, afterSort, limit=10, fields=[db.fdName])
+        if not page:
+            break
+        pages.append(page)
+    assert [len(x) for x in pages] == [10, 10, 3]
+    assert [x[0] for page in pages for x in page] == names(db)
+    assert SqlDbMethod.fetchPage(db, afterSort, limit=10) == ([], afterSort)
@@ -0,0 +1,50 @@
+import os
+
+from DeclarativeQt.Storage.SqliteDb.SqlBench.SqlBench import BenchDatabase
+
+
+class IndexedDatabase(BenchDatabase):
+    indexFields = ["value", "note"]
+    indexUnique = False
+
+    @property
+    def dbIndexDefinitions(self):
+        return super().dbIndexDefinitions + [
+            ["bench_value_note_idx", self.indexFields],
+            ["bench_name_partial_idx", ["name"], self.indexUnique, "note is not null"],
+        ]
+
+
+class RenamedDatabase(IndexedDatabase):
+    indexFields = ["note", "value"]
+    indexUnique = True
+
+
+def test_declared_indexes_are_created_and_verified(tmp_path):
+    db = IndexedDatabase(os.path.join(tmp_path, "index.db"))
+    db.createSqlTable()
+    assert db.verifySqlIndexes() == dict()
+    with db.openSqlComposer() as sql:
+        sql.dropIndex("bench_name_partial_idx").commit()
+    assert db.verifySqlIndexes() == {"bench_name_partial_idx": "missing"}
+
+
+def test_changed_declarations_are_reported_and_rebuilt(tmp_path):
+    dbFilePath = os.path.join(tmp_path, "index.db")
+    IndexedDatabase(dbFilePath).createSqlTable()
+    db = RenamedDatabase(dbFilePath)
+    report = db.verifySqlIndexes()
+    assert set(report.keys()) == {"bench_value_note_idx", "bench_name_partial_idx"}
+    assert report["bench_name_partial_idx"] == "unique"
+    db.createSqlIndexes()
+    assert db.verifySqlIndexes() == dict()
+
+
+def test_dense_tables_sort_through_the_index(tmp_path):
+    db = BenchDatabase(os.path.join(tmp_path, "dense.db"))
+    db.createSqlTable()
+    assert db.dbOrdering == db.odDense
+    scans = db.scanningSqlQueries()
+    assert "fetchSqlTable" not in scans
+    assert "maxExistOrder" not in scans
+    assert "neighbourOrders" not in scans
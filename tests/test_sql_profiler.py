@@ -0,0 +1,48 @@
+import os
+import threading
+
+import pytest
+
+from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlComposer import SqlComposer
+from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlProfiler import SqlProfiler
+
+
+@pytest.fixture
+def profiler():
+    SqlProfiler.reset()
+    SqlProfiler.enable(slowMsec=1e9, bufferSize=512)
+    yield SqlProfiler
+    SqlProfiler.disable()
+    SqlProfiler.reset()
+
+
+def test_queries_aggregate_by_shape(tmp_path, profiler):
+    with SqlComposer(os.path.join(tmp_path, "profile.db")) as sql:
+        sql.cmdAppend("create table t (id integer, name text);").commit()
+        for i in range(3):
+            sql.cmdAppend(f"insert into t values ({i}, 'n{i}');").commit()
+        sql.cmdAppend("select * from t where id in (1, 2);").fetchall()
+    shapes = {x["shape"]: x for x in profiler.aggregates()}
+    assert shapes["insert into t values (...);"]["count"] == 3
+    assert shapes["insert into t values (...);"]["rows"] == 3
+    assert shapes["select * from t where id in (...);"]["kind"] == "select"
+    assert profiler.report()["recorded"] == len(profiler.records()) == 5
+
+
+def test_resizing_buffer_while_recording_keeps_records(profiler):
+    stop = threading.Event()
+
+    def record():
+        while not stop.is_set():
+            SqlProfiler.finish(SqlProfiler.start(), None, "select 1;", list(), 1)
+
+    workers = [threading.Thread(target=record) for _ in range(4)]
+    for x in workers:
+        x.start()
+    for size in (64, 32, 128, 16):
+        SqlProfiler.enable(bufferSize=size)
+    stop.set()
+    for x in workers:
+        x.join()
+    SqlProfiler.finish(SqlProfiler.start(), None, "select 1;", list(), 1)
+    assert len(SqlProfiler.records()) == 16
@@ -0,0 +1,27 @@
+import os
+
+from DeclarativeQt.Storage.SqliteDb.SqlBench.SqlBench import SqlBench
+from DeclarativeQt.Storage.SqliteDb.SqlDbKernel.SqlDbMethod import SqlDbMethod
+
+
+def test_raw_composer_write_invalidates_cached_fetch(tmp_path):
+    db = SqlBench.benchDatabase(os.path.join(tmp_path, "cache.db"))
+    db.insertSqlRows(SqlBench.benchRows(10))
+    assert db.dbQueryCache
+    before = SqlDbMethod.fetchSqlTable(db)
+    assert SqlDbMethod.fetchSqlTable(db) == before
+    with db.openSqlComposer() as sql:
+        assert sql.cmdAppend(f"update {db.dbTableName} set value = -1;").commit()
+    after = SqlDbMethod.fetchSqlTable(db)
+    assert len(after) == len(before)
+    assert all(row[db.dbFields.index("value")] == -1 for row in after)
+
+
+def test_raw_composer_write_in_transaction_invalidates_cached_fetch(tmp_path):
+    db = SqlBench.benchDatabase(os.path.join(tmp_path, "cache.db"))
+    db.insertSqlRows(SqlBench.benchRows(10))
+    before = SqlDbMethod.fetchSqlTable(db)
+    with db.openSqlComposer() as sql, sql.transaction():
+        sql.cmdAppend(f"delete from {db.dbTableName};").execute()
+    assert len(before) == 10
+    assert SqlDbMethod.fetchSqlTable(db) == list()
@@ -0,0 +1,113 @@
+import os
+
+from DeclarativeQt.DqtCore.DqtBase import RList, Trigger, Remember
+from DeclarativeQt.DqtUI.DqtMaven.TableViews.DatabaseViewer.SqliteDbViewer import SqliteDbViewer
+from DeclarativeQt.Storage.SqliteDb.SqlBench.SqlBench import SqlBench, BenchDatabase
+from DeclarativeQt.Storage.SqliteDb.SqlDbKernel.SqlDbMethod import SqlDbMethod
+from DeclarativeQt.Storage.SqliteDb.SqlDbKernel.SqlTableSync import SqlTableSync
+
+
+class LogDatabase(BenchDatabase):
+    dbChangeLog = True
+    dbOrdering = BenchDatabase.odGap
+
+
+def logDatabase(tmp_path, count: int = 20) -> LogDatabase:
+    db = LogDatabase(os.path.join(tmp_path, "sync.db"))
+    db.rebuildSqlTable()
+    db.insertSqlRows(SqlBench.benchRows(count))
+    return db
+
+
+def recordDiffs(rows: RList) -> list:
+    diffs = list()
+    rows.diffConnect(
+        onReset=lambda value: diffs.append("reset"),
+        onInserted=lambda i, n: diffs.append(("inserted", i, n)),
+        onRemoved=lambda i, n: diffs.append(("removed", i, n)),
+        onItemChanged=lambda i: diffs.append(("itemChanged", i)),
+    )
+    return diffs
+
+
+def test_sync_patches_rows_in_place(tmp_path):
+    db = logDatabase(tmp_path)
+    sync, rows = SqlTableSync(), RList()
+    sync.syncSqlTable(rows, db)
+    diffs = recordDiffs(rows)
+    db.updateSqlRowData(key="row3", value=-1.0)
+    sync.syncSqlTable(rows, db)
+    assert diffs == [("itemChanged", 3)]
+    db.insertSqlRowData(order=5, name="new", value=0.0, note="n")
+    SqlDbMethod.deleteDataRow(db, {"name": "row10"})
+    sync.syncSqlTable(rows, db)
+    assert "reset" not in diffs
+    assert rows.value() == SqlDbMethod.fetchSqlTable(db)
+    sync.syncSqlTable(rows, db)
+    assert "reset" not in diffs
+
+
+def test_sync_resets_after_local_edit(tmp_path):
+    db = logDatabase(tmp_path)
+    sync, rows = SqlTableSync(), RList()
+    sync.syncSqlTable(rows, db)
+    rows.remove(0)
+    diffs = recordDiffs(rows)
+    db.updateSqlRowData(key="row3", value=-1.0)
+    sync.syncSqlTable(rows, db)
+    assert diffs == ["reset"]
+    assert rows.value() == SqlDbMethod.fetchSqlTable(db)
+
+
+def test_sync_prunes_change_log(tmp_path):
+    db = logDatabase(tmp_path)
+    db.dbChangeRetain = 8
+    sync, rows = SqlTableSync(), RList()
+    for i in range(40):
+        db.updateSqlRowData(key=f"row{i % 20}", value=float(i))
+        sync.syncSqlTable(rows, db)
+    with db.openSqlComposer() as sql:
+        logged = sql.cmdAppend(f"select count(*) from {db.dbChangeTableName};").fetchall()[0][0]
+    assert logged <= 2 * db.dbChangeRetain
+    assert rows.value() == SqlDbMethod.fetchSqlTable(db)
+    late = SqlTableSync()
+    assert late.fetchSqlTable(db) == rows.value()
+
+
+def test_viewer_patches_model_rows(tmp_path, qapp):
+    from DeclarativeQt.DqtUI.DqtMaven.TableViews.DatabaseViewer.SqliteDbViewer import SqliteDbViewer
+    db = logDatabase(tmp_path)
+    reloadTrig = Trigger()
+    viewer = SqliteDbViewer(sqlDb=db, reloadTrig=reloadTrig)
+    model = viewer.model()
+    db.updateSqlRowData(key="row2", value=-7.0)
+    reloadTrig.trig()
+    assert viewer.model() is model
+    assert model.rowCount() == 20
+    assert model.item(2, db.dbFields.index("value")).text() == viewer.tableStandardItem(-7.0).text()
+
+
+def test_prune_keeps_changes_a_lagging_sync_needs(tmp_path):
+    db = logDatabase(tmp_path)
+    db.dbChangeRetain = 4
+    ahead, behind, rows = SqlTableSync(), SqlTableSync(), RList()
+    behind.fetchSqlTable(db)
+    for i in range(8):
+        db.updateSqlRowData(key=f"row{i % 20}", value=float(i))
+        ahead.syncSqlTable(rows, db)
+    assert behind.fetchSqlTable(db) == rows.value()
+    assert behind.stats()["reloaded"] == 1 and behind.stats()["patched"] == 1
+    for i in range(30):
+        db.updateSqlRowData(key=f"row{i % 20}", value=-float(i))
+        ahead.syncSqlTable(rows, db)
+    assert ahead.stats()["pruned"] >= behind.version
+
+
+def test_viewers_sync_only_with_change_log(tmp_path):
+    db = logDatabase(tmp_path)
+    assert isinstance(SqliteDbViewer.tableSyncOf(Remember(db)), SqlTableSync)
+    assert SqliteDbViewer.tableSyncOf(Remember(db), syncFetch=False) is None
+    assert SqliteDbViewer.tableSyncOf(Remember(db), SqlDbMethod.fetchSqlTable) is None
+    db.dbChangeLog = False
+    assert SqliteDbViewer.tableSyncOf(Remember(db)) is None
+    assert isinstance(SqliteDbViewer.tableSyncOf(Remember(db), syncFetch=True), SqlTableSync)
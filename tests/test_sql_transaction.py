@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+from DeclarativeQt.Storage.SqliteDb.SqlComposer.SqlComposer import SqlComposer
+
+
+@pytest.fixture
+def dbFilePath(tmp_path):
+    dbFilePath = os.path.join(tmp_path, "tx.db")
+    with SqlComposer(dbFilePath) as sql:
+        sql.cmdAppend("create table t (id integer primary key);").commit()
+    return dbFilePath
+
+
+def storedIds(dbFilePath) -> list:
+    with SqlComposer(dbFilePath) as sql:
+        return [x[0] for x in sql.cmdAppend("select id from t order by id;").fetchall()]
+
+
+def insert(sql: SqlComposer, value: int) -> bool:
+    return sql.cmdAppend(f"insert into t values ({value});").commit()
+
+
+def test_transaction_commits_once_on_exit(dbFilePath):
+    with SqlComposer(dbFilePath) as sql:
+        with sql.transaction():
+            insert(sql, 1)
+            insert(sql, 2)
+            assert sql.inTransaction()
+            assert storedIds(dbFilePath) == list()
+        assert not sql.inTransaction()
+    assert storedIds(dbFilePath) == [1, 2]
+
+
+def test_transaction_rolls_back_on_error_or_failed_statement(dbFilePath):
+    with SqlComposer(dbFilePath) as sql:
+        with pytest.raises(RuntimeError):
+            with sql.transaction():
+                insert(sql, 1)
+                raise RuntimeError
+        with sql.transaction():
+            insert(sql, 2)
+            assert not insert(sql, 2)
+            insert(sql, 3)
+    assert storedIds(dbFilePath) == list()
+
+
+def test_savepoint_failure_rolls_back_only_its_block(dbFilePath):
+    with SqlComposer(dbFilePath) as sql:
+        with sql.transaction():
+            insert(sql, 1)
+            with sql.savepoint("inner"):
+                insert(sql, 2)
+                insert(sql, 1)
+            with sql.transaction():
+                insert(sql, 3)
+    assert storedIds(dbFilePath) == [1, 3]
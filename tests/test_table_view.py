@@ -0,0 +1,48 @@
+from DeclarativeQt.DqtCore.DqtBase import Remember, RList
+from DeclarativeQt.DqtUI.DqtMaven.TableViews.BaseTableView.TableView import TableView
+
+
+def tableRows(view: TableView) -> list:
+    model = view.model()
+    return [[model.item(r, c).text() for c in range(model.columnCount())] for r in range(model.rowCount())]
+
+
+def listView(count: int):
+    rows = RList([[f"r{i}", str(i)] for i in range(count)], spread=True)
+    return rows, TableView(dataModel=rows, fields=["name", "value"])
+
+
+def test_row_state_change_updates_its_own_row(qapp):
+    rows, view = listView(50)
+    rows.value()[30].setValue(["r30", "changed"])
+    assert tableRows(view)[30] == ["r30", "changed"]
+    lookup = view._rowIndexes
+    rows.value()[10].setValue(["r10", "changed"])
+    assert view._rowIndexes is lookup
+    assert tableRows(view)[10] == ["r10", "changed"]
+
+
+def test_row_state_follows_structural_changes(qapp):
+    rows, view = listView(5)
+    moved = rows.value()[4]
+    rows.move(4, 0)
+    rows.insert(1, ["new", "x"])
+    rows.remove(3)
+    moved.setValue(["r4", "moved"])
+    assert tableRows(view)[0] == ["r4", "moved"]
+    rows.setItem(2, ["set", "y"])
+    replaced = rows.value()[2]
+    replaced.setValue(["set", "z"])
+    assert tableRows(view) == [["r4", "moved"], ["new", "x"], ["set", "z"], ["r2", "2"], ["r3", "3"]]
+
+
+def test_list_diffs_edit_the_existing_model(qapp):
+    rows, view = listView(4)
+    model = view.model()
+    rows.insert(1, ["a", "x"], ["b", "y"])
+    rows.remove(0)
+    rows.move(3, 0)
+    assert view.model() is model
+    assert tableRows(view) == [["r2", "2"], ["a", "x"], ["b", "y"], ["r1", "1"], ["r3", "3"]]
+    rows.setValue([["only", "1"]])
+    assert tableRows(view) == [["only", "1"]]